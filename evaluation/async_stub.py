@@ -0,0 +1,209 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+
+from metaheuristic.DE.DE import BaseDE, L_SHADE
+from metaheuristic.cro.CRO import OCRO
+from metaheuristic.optimizer.evaluator import AsyncEvaluator
+from metaheuristic.pso.PSO import BasePSO, CL_PSO
+from metaheuristic.triangle.TCO import TCO
+
+
+class StubServer:
+    """
+    Local asyncio TCP server evaluating the sphere function with a latency, the stub remote objective used to check
+    the 'async' mode of Optimizer.solve()
+
+    Notes
+    ~~~~~
+    + One JSON line per request (the solution), one JSON line per answer (the fitness), one connection per request
+    + The server runs its own event loop in a background thread, not the loop of the AsyncEvaluator
+    + Faults for the timeout/retry/cancel paths of AsyncEvaluator, counted on the requests received:
+        + fail_every: every fail_every-th request closes the connection without answer (the call fails)
+        + hang_every: every hang_every-th request answers after hang_time seconds (the call times out)
+    """
+
+    def __init__(self, delay=0.01, fail_every=None, hang_every=None, hang_time=2.0):
+        """
+        Args:
+            delay (float): latency of each answer in seconds
+            fail_every (int): period of the failed requests, None for no failure
+            hang_every (int): period of the hanging requests, None for no hanging request
+            hang_time (float): latency of a hanging request in seconds
+        """
+        self.delay, self.fail_every, self.hang_every, self.hang_time = delay, fail_every, hang_every, hang_time
+        self.n_requests, self.n_answers = 0, 0
+        self.host, self.port = "127.0.0.1", None
+        self._loop, self._thread, self._server, self._tasks = None, None, None, set()
+
+    async def _handle(self, reader, writer):
+        self.n_requests += 1
+        n_request = self.n_requests
+        self._tasks.add(asyncio.current_task())
+        try:
+            line = await reader.readline()
+            # The call was cancelled by the client before sending its solution
+            if not line:
+                return
+            solution = np.array(json.loads(line), dtype=float)
+            if self.fail_every is not None and n_request % self.fail_every == 0:
+                return
+            hanging = self.hang_every is not None and n_request % self.hang_every == 0
+            await asyncio.sleep(self.hang_time if hanging else self.delay)
+            writer.write((json.dumps(float(np.sum(solution ** 2))) + "\n").encode())
+            await writer.drain()
+            self.n_answers += 1
+        except asyncio.CancelledError:
+            # Stop of the server, a cancelled handler is reported as an error by asyncio.start_server()
+            return
+        finally:
+            self._tasks.discard(asyncio.current_task())
+            writer.close()
+
+    async def _start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self):
+        # The requests of the cancelled calls are still hanging on the server side
+        self._server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def start(self):
+        """
+        Returns:
+            StubServer: the server itself, listening on a free port of 127.0.0.1
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="StubServer", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def get_objective(self):
+        """
+        Returns:
+            callable: async fit_func sending the solution to the server
+        """
+        async def fit_func(solution):
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                writer.write((json.dumps(np.ravel(solution).tolist()) + "\n").encode())
+                await writer.drain()
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionError("The stub server closed the connection without answer.")
+                return json.loads(line)
+            finally:
+                writer.close()
+        return fit_func
+
+
+def get_problem(server, **kwargs):
+    problem = {"fit_func": server.get_objective(), "lb": [-10, ] * 5, "ub": [10, ] * 5, "minmax": "min",
+               "log_to": None, "save_population": False}
+    problem.update(kwargs)
+    return problem
+
+
+def run(cls, server, mode="sequential", seed=7, paras=None, **kwargs):
+    model = cls(get_problem(server, **kwargs), epoch=5, pop_size=20, seed=seed, **(paras or {}))
+    model.solve(mode)
+    return model
+
+
+def check_same_results(list_models=(BasePSO, CL_PSO, OCRO, BaseDE, L_SHADE, TCO)):
+    """
+    solve('async') gives the same global best history as solve() for the same seed
+    """
+    # restart_count of OCRO is at most epoch / 2
+    list_paras = {OCRO: {"restart_count": 2}}
+    server = StubServer().start()
+    try:
+        for cls in list_models:
+            paras = list_paras.get(cls)
+            time_start = time.perf_counter()
+            model = run(cls, server, paras=paras)
+            time_sequential = time.perf_counter() - time_start
+            time_start = time.perf_counter()
+            model_async = run(cls, server, "async", paras=paras)
+            time_async = time.perf_counter() - time_start
+            assert model.history.list_global_best_fit == model_async.history.list_global_best_fit, cls.__name__
+            print(f"{cls.__name__}: same results, sequential {time_sequential:.2f}s, async {time_async:.2f}s")
+    finally:
+        server.stop()
+
+
+def check_retries():
+    """
+    The failed and timed out calls are tried again, the results don't change
+    """
+    server = StubServer().start()
+    try:
+        expected = run(BaseDE, server).history.list_global_best_fit
+    finally:
+        server.stop()
+    for kwargs in (dict(fail_every=7), dict(hang_every=9, hang_time=1.0)):
+        server = StubServer(**kwargs).start()
+        try:
+            model = run(BaseDE, server, "async", async_timeout=0.5, async_retries=2)
+            assert model.history.list_global_best_fit == expected, kwargs
+            assert model.problem.evaluator.n_retries > 0, kwargs
+            print(f"{kwargs}: same results after {model.problem.evaluator.n_retries} retries")
+        finally:
+            server.stop()
+
+
+def check_cancel():
+    """
+    A call failing after its retries raises the error, the pending calls of the batch are cancelled (not awaited)
+    """
+    failing, hanging = StubServer(fail_every=1).start(), StubServer(hang_every=1, hang_time=5.0).start()
+    fit_fail, fit_hang = failing.get_objective(), hanging.get_objective()
+    n_calls = [0]
+
+    async def fit_func(solution):
+        # The first call hangs, all the other ones fail
+        n_calls[0] += 1
+        if n_calls[0] == 1:
+            return await fit_hang(solution)
+        return await fit_fail(solution)
+
+    evaluator = AsyncEvaluator(fit_func, max_in_flight=4, retries=1)
+    try:
+        time_start = time.perf_counter()
+        try:
+            evaluator.evaluate_many([np.zeros(5) for _ in range(0, 20)])
+            raise AssertionError("The failed call was not raised.")
+        except ConnectionError:
+            pass
+        time_cancel = time.perf_counter() - time_start
+        assert time_cancel < hanging.hang_time, time_cancel
+        # 2 attempts of the first failing call, the calls waiting for the semaphore are never started
+        assert failing.n_requests < 19 * 2, failing.n_requests
+        print(f"cancel: error raised after {time_cancel:.2f}s and {failing.n_requests} failed requests, "
+              f"the hanging call was cancelled")
+    finally:
+        evaluator.close()
+        failing.stop()
+        hanging.stop()
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    check_same_results()
+    check_retries()
+    check_cancel()
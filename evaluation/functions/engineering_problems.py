@@ -4,50 +4,26 @@ from evaluation.functions.ihaoavoa_2022 import TensionCompressionSpringProblem,
     CantileverBeamProblem, SpeedReducerProblem, RollingElementBearingProblem
 
 
+# The problems are created once, each call evaluates the whole (n, n_dims) batch of solutions at once. The values are
+# the ones of evaluate() on each solution up to floating-point rounding (the sums along an axis add in another order)
+SPRING, WELDED, BEAM, SPEED, ROLLING = TensionCompressionSpringProblem(), WeldedBeamProblem(), CantileverBeamProblem(), \
+    SpeedReducerProblem(), RollingElementBearingProblem()
+
+
 def spring_func(solutions):
-    func = TensionCompressionSpringProblem()
-    result = []
-    for sol in solutions:
-        a = func.evaluate(sol)
-        #result.append(func.evaluate(sol)[0])
-        result.append(a[0])
-    return result
+    return SPRING.evaluate_batch(solutions)[:, 0]
 
 def welded_func(solutions):
-    func = WeldedBeamProblem()
-    result = []
-    for sol in solutions:
-        a = func.evaluate(sol)[0]
-        #result.append(func.evaluate(sol)[0])
-        result.append(a)
-    return result
+    return WELDED.evaluate_batch(solutions)[:, 0]
 
 def beam_func(solutions):
-    func = CantileverBeamProblem()
-    result = []
-    for sol in solutions:
-        a = func.evaluate(sol)[0]
-        #result.append(func.evaluate(sol)[0])
-        result.append(a)
-    return result
+    return BEAM.evaluate_batch(solutions)[:, 0]
 
 def speed_func(solutions):
-    func = SpeedReducerProblem()
-    result = []
-    for sol in solutions:
-        a = func.evaluate(sol)
-        #result.append(func.evaluate(sol)[0])
-        result.append(a[0])
-    return result
+    return SPEED.evaluate_batch(solutions)[:, 0]
 
 def rolling_func(solutions):
-    func = RollingElementBearingProblem()
-    result = []
-    for sol in solutions:
-        a = func.evaluate(sol)
-        #result.append(func.evaluate(sol)[0])
-        result.append(a[0])
-    return result
+    return ROLLING.evaluate_batch(solutions)[:, 0]
 
 
 
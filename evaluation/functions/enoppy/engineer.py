@@ -189,18 +189,9 @@ class Engineer(ABC):
           #  raise ValueError(f"The length of solution should has {self._n_dims} variables!")
 
     def default_penalty(self, list_objs=None, list_cons=None):
-        list_objs_new = np.zeros_like(list_objs)
-        for idx, val in enumerate(list_objs):
-            temp = val + self.w * np.sum([max(0, f_con) for f_con in list_cons])
-
-
-            if temp != 0:
-                list_objs_new[idx] = temp
-            else:
-                list_objs_new[idx] = list_objs[idx]
-
-
-        return list_objs_new
+        list_objs = np.asarray(list_objs)
+        temp = list_objs + self.w * np.sum(np.fmax(0, list_cons), axis=-1, keepdims=list_objs.ndim > 1)
+        return np.where(temp != 0, temp, list_objs)
 
     def check_penalty_func(self, func=None):
         if callable(func):
@@ -208,6 +199,66 @@ class Engineer(ABC):
         else:
             self.f_penalty = self.default_penalty
 
+    def _transpose_batch(self, X):
+        X = np.asarray(X, dtype=float)
+        # A single solution is given as it is, the operations on scalars are faster than on arrays of 1 element
+        return X[0] if len(X) == 1 else X.T
+
+    def get_objs_batch(self, X):
+        """
+        Compute the objectives of a batch of solutions with a single call of get_objs(): the batch is transposed, so
+        x[i] is the vector of the i-th variable of all the solutions. Override it when get_objs() is not element-wise.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The (n, n_dims) batch of solutions
+
+        Returns
+        -------
+        objs : np.ndarray
+            The (n, n_objs) objectives
+        """
+        return np.asarray(self.get_objs(self._transpose_batch(X)), dtype=float).reshape(self.n_objs, -1).T
+
+    def get_cons_batch(self, X):
+        """
+        Compute the constraints of a batch of solutions with a single call of get_cons(), see get_objs_batch().
+        Can be given as the "constraints" of a Problem, then the ConstraintHandler computes the penalty.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The (n, n_dims) batch of solutions
+
+        Returns
+        -------
+        cons : np.ndarray
+            The (n, n_cons) constraint matrix
+        """
+        return np.asarray(self.get_cons(self._transpose_batch(X)), dtype=float).reshape(self.n_cons, -1).T
+
+    def evaluate_batch(self, X):
+        """
+        Evaluation of a batch of solutions, same values as evaluate() on each solution.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The (n, n_dims) batch of solutions
+
+        Returns
+        -------
+        val : np.ndarray
+            The (n, n_objs) penalized objectives
+        """
+        X = np.atleast_2d(X)
+        self.n_fe += len(X)
+        objs, cons = self.get_objs_batch(X), self.get_cons_batch(X)
+        if self.f_penalty == self.default_penalty:
+            return self.default_penalty(objs, cons)
+        return np.array([self.f_penalty(objs[idx], cons[idx]) for idx in range(0, len(X))])
+
     def evaluate(self, x):
         """
         Evaluation of the benchmark function.
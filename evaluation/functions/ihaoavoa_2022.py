@@ -120,7 +120,7 @@ class CantileverBeamProblem(Engineer):
 
     def get_objs(self, x):
         x = np.array(x)
-        f1 = 0.6224 * np.sum(x)
+        f1 = 0.6224 * np.sum(x, axis=0)
         return np.array([f1, ])
 
     def get_cons(self, x):
@@ -207,10 +207,7 @@ class RollingElementBearingProblem(Engineer):
         gama = x[1] / x[0]
         t1 = 37.91*(1+(1.04*((1-gama)/(1+gama))**1.72*(x[3]/x[4] * (2*x[4] - 1)/(2*x[3] - 1))**0.41)**(10./3))**(-0.3)
         fc = t1 * (gama**0.3 *(1 - gama)**1.39 / ((1+gama)**(1./3))) * (2*x[3]/(2*x[3] - 1))**0.41
-        if x[1] <= 25.4:
-            f1 = fc * x[2]**(2./3) * x[1]**1.8
-        else:
-            f1 = 3.647 * fc * x[2]**(2./3) * x[1]**1.4
+        f1 = np.where(x[1] <= 25.4, fc * x[2]**(2./3) * x[1]**1.8, 3.647 * fc * x[2]**(2./3) * x[1]**1.4)
         return np.array([f1, ])
 
     def get_cons(self, x):
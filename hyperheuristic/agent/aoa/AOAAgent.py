@@ -4,7 +4,6 @@
 #       Github: https://github.com/thieu1995        %
 # --------------------------------------------------%
 
-import numpy as np
 from copy import deepcopy
 
 from hyperheuristic.agent.optimizer import Optimizer
@@ -90,7 +89,7 @@ class AOAAgent(Optimizer):
         for idx in range(0, self.pop_size):
             pos_new = deepcopy(self.pop[idx][self.ID_POS])
             for j in range(0, self.problem.n_dims):
-                r1, r2, r3 = np.random.rand(3)
+                r1, r2, r3 = self.generator.random(3)
                 if r1 > moa:  # Exploration phase
                     if r2 < 0.5:
                         pos_new[j] = self.g_best[self.ID_POS][j] / (mop + self.EPSILON) * \
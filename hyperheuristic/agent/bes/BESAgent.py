@@ -81,12 +81,12 @@ class BESAgent(Optimizer):
     def _create_x_y_x1_y1_(self):
         """ Using numpy vector for faster computational time """
         ## Eq. 2
-        phi = self.a_factor * np.pi * np.random.uniform(0, 1, self.pop_size)
-        r = phi + self.R_factor * np.random.uniform(0, 1, self.pop_size)
+        phi = self.a_factor * np.pi * self.generator.uniform(0, 1, self.pop_size)
+        r = phi + self.R_factor * self.generator.uniform(0, 1, self.pop_size)
         xr, yr = r * np.sin(phi), r * np.cos(phi)
 
         ## Eq. 3
-        r1 = phi1 = self.a_factor * np.pi * np.random.uniform(0, 1, self.pop_size)
+        r1 = phi1 = self.a_factor * np.pi * self.generator.uniform(0, 1, self.pop_size)
         xr1, yr1 = r1 * np.sinh(phi1), r1 * np.cosh(phi1)
 
         x_list = xr / max(xr)
@@ -112,7 +112,7 @@ class BESAgent(Optimizer):
 
         pop_new = []
         for idx in range(0, self.pop_size):
-            pos_new = self.g_best[self.ID_POS] + self.alpha * np.random.uniform() * (pos_mean - self.pop[idx][self.ID_POS])
+            pos_new = self.g_best[self.ID_POS] + self.alpha * self.generator.uniform() * (pos_mean - self.pop[idx][self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         pop_new = self.update_target_wrapper_population(pop_new)
@@ -124,7 +124,7 @@ class BESAgent(Optimizer):
 
         pop_child = []
         for idx in range(0, self.pop_size):
-            idx_rand = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+            idx_rand = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}))
             pos_new = pop_new[idx][self.ID_POS] + y_list[idx] * (pop_new[idx][self.ID_POS] - pop_new[idx_rand][self.ID_POS]) + \
                       x_list[idx] * (pop_new[idx][self.ID_POS] - pos_mean)
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
@@ -138,7 +138,7 @@ class BESAgent(Optimizer):
 
         pop_new = []
         for idx in range(0, self.pop_size):
-            pos_new = np.random.uniform() * self.g_best[self.ID_POS] + x1_list[idx] * (pop_child[idx][self.ID_POS] - self.c1 * pos_mean) \
+            pos_new = self.generator.uniform() * self.g_best[self.ID_POS] + x1_list[idx] * (pop_child[idx][self.ID_POS] - self.c1 * pos_mean) \
                       + y1_list[idx] * (pop_child[idx][self.ID_POS] - self.c2 * self.g_best[self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
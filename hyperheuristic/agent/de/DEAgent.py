@@ -8,6 +8,7 @@ import numpy as np
 from copy import deepcopy
 
 from hyperheuristic.agent.optimizer import Optimizer
+from metaheuristic.DE.strategies import get_mutants, get_crossover
 
 
 class DEAgent(Optimizer):
@@ -79,10 +80,6 @@ class DEAgent(Optimizer):
         self.sort_flag = False
 
 
-    def _mutation__(self, current_pos, new_pos):
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
-        return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-
     def evolve(self, epoch):
         """
         The main operations (equations) of algorithm. Inherit from Optimizer class
@@ -90,75 +87,12 @@ class DEAgent(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop = []
-        if self.strategy == 0:
-            # Choose 3 random element and different to i
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 1:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 2:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 4, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[2]][self.ID_POS] - self.pop[idx_list[3]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 3:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 5, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[3]][self.ID_POS] - self.pop[idx_list[4]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 4:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.wf * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 5:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 6:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                temp_pop = [self.pop[idx_list[0]], self.pop[idx_list[1]], self.pop[idx_list[2]]]
-                if self.problem.minmax == "min":
-                    sorted_pop = sorted(temp_pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT])
-                else:
-                    sorted_pop = sorted(temp_pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT], reverse=True)
-                pos_new = self.pop[idx][self.ID_POS] + self.wf * (
-                            sorted_pop[0][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.wf * (sorted_pop[1][self.ID_POS] - sorted_pop[2][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        else:
-                    for idx in range(0, self.pop_size):
-                        idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                        if self.pop[idx_list[0]][self.ID_TAR][self.ID_FIT] < self.pop[idx_list[1]][self.ID_TAR][self.ID_FIT]:
-                            pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                                      (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                        else:
-                            pos_new = self.pop[idx_list[1]][self.ID_POS] + self.wf * (
-                                    self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                        pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                        pop.append([pos_new, None])
-
+        # The donor vectors and the crossover of the whole population are computed at once, see strategies.py
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop]) if self.strategy == 6 else None
+        mutants = get_mutants(self.generator, self.strategy, pos_matrix, self.g_best[self.ID_POS], self.wf, fit_list, self.problem.minmax)
+        pos_new = get_crossover(self.generator, pos_matrix, mutants, self.cr)
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
         # create new pop by comparing fitness of corresponding each member in pop and children
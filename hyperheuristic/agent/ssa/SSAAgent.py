@@ -17,7 +17,7 @@ class BaseSSA(Optimizer):
     Notes
     ~~~~~
     + First, I sort the algorithm and find g-best and g-worst
-    + In Eq. 4, Instead of using A+ and L, I used np.random.normal()
+    + In Eq. 4, Instead of using A+ and L, I used self.generator.normal()
     + Some components (g_best_position, fitness updated) are missing in Algorithm 1 (paper)
 
     Hyper-parameters should fine tuned in approximate range to get faster convergen toward the global optimum:
@@ -89,7 +89,7 @@ class BaseSSA(Optimizer):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def evolve(self, epoch):
         """
@@ -98,26 +98,26 @@ class BaseSSA(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        r2 = np.random.uniform()  # R2 in [0, 1], the alarm value, random value
+        r2 = self.generator.uniform()  # R2 in [0, 1], the alarm value, random value
         pop_new = []
         for idx in range(0, self.pop_size):
             # Using equation (3) update the sparrow’s location;
             if idx < self.n1:
                 if r2 < self.ST:
-                    des = (epoch + 1) / (np.random.uniform() * self.epoch + self.EPSILON)
+                    des = (epoch + 1) / (self.generator.uniform() * self.epoch + self.EPSILON)
                     if des > 5:
-                        des = np.random.normal()
+                        des = self.generator.normal()
                     x_new = self.pop[idx][self.ID_POS] * np.exp(des)
                 else:
-                    x_new = self.pop[idx][self.ID_POS] + np.random.normal() * np.ones(self.problem.n_dims)
+                    x_new = self.pop[idx][self.ID_POS] + self.generator.normal() * np.ones(self.problem.n_dims)
             else:
                 # Using equation (4) update the sparrow’s location;
                 _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1)
                 g_best = x_p[0], g_worst = worst[0]
                 if idx > int(self.pop_size / 2):
-                    x_new = np.random.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
+                    x_new = self.generator.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
                 else:
-                    x_new = g_best[self.ID_POS] + np.abs(self.pop[idx][self.ID_POS] - g_best[self.ID_POS]) * np.random.normal()
+                    x_new = g_best[self.ID_POS] + np.abs(self.pop[idx][self.ID_POS] - g_best[self.ID_POS]) * self.generator.normal()
             pos_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         pop_new = self.update_target_wrapper_population(pop_new)
@@ -130,10 +130,10 @@ class BaseSSA(Optimizer):
             #  Using equation (5) update the sparrow’s location;
             if self.compare_agent(self.pop[idx], g_best):
                 x_new = pop2[idx][self.ID_POS] + \
-                        np.random.uniform(-1, 1) * (np.abs(pop2[idx][self.ID_POS] - g_worst[self.ID_POS]) /
+                        self.generator.uniform(-1, 1) * (np.abs(pop2[idx][self.ID_POS] - g_worst[self.ID_POS]) /
                                                     (pop2[idx][self.ID_TAR][self.ID_FIT] - g_worst[self.ID_TAR][self.ID_FIT] + self.EPSILON))
             else:
-                x_new = g_best[self.ID_POS] + np.random.normal() * np.abs(pop2[idx][self.ID_POS] - g_best[self.ID_POS])
+                x_new = g_best[self.ID_POS] + self.generator.normal() * np.abs(pop2[idx][self.ID_POS] - g_best[self.ID_POS])
             pos_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
             child.append([pos_new, None])
         child = self.update_target_wrapper_population(child)
@@ -206,27 +206,27 @@ class SSAAgent(BaseSSA):
         Args:
             epoch (int): The current iteration
         """
-        r2 = np.random.uniform()  # R2 in [0, 1], the alarm value, random value
+        r2 = self.generator.uniform()  # R2 in [0, 1], the alarm value, random value
         pop_new = []
         for idx in range(0, self.pop_size):
             # Using equation (3) update the sparrow’s location;
             if idx < self.n1:
                 if r2 < self.ST:
-                    des = (idx + 1) / (np.random.uniform() * self.epoch + self.EPSILON)
+                    des = (idx + 1) / (self.generator.uniform() * self.epoch + self.EPSILON)
                     if des > 5:
-                        des = np.random.uniform()
+                        des = self.generator.uniform()
                     x_new = self.pop[idx][self.ID_POS] * np.exp(des)
                 else:
-                    x_new = self.pop[idx][self.ID_POS] + np.random.normal() * np.ones(self.problem.n_dims)
+                    x_new = self.pop[idx][self.ID_POS] + self.generator.normal() * np.ones(self.problem.n_dims)
             else:
                 # Using equation (4) update the sparrow’s location;
                 _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1)
                 g_best, g_worst = x_p[0], worst[0]
                 if idx > int(self.pop_size / 2):
-                    x_new = np.random.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
+                    x_new = self.generator.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
                 else:
                     L = np.ones((1, self.problem.n_dims))
-                    A = np.sign(np.random.uniform(-1, 1, (1, self.problem.n_dims)))
+                    A = np.sign(self.generator.uniform(-1, 1, (1, self.problem.n_dims)))
                     A1 = A.T * np.linalg.inv(np.matmul(A, A.T)) * L
                     x_new = g_best[self.ID_POS] + np.matmul(np.abs(self.pop[idx][self.ID_POS] - g_best[self.ID_POS]), A1)
             pos_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
@@ -241,10 +241,10 @@ class SSAAgent(BaseSSA):
             #  Using equation (5) update the sparrow’s location;
             if self.compare_agent(self.pop[idx], g_best):
                 x_new = pop2[idx][self.ID_POS] + \
-                        np.random.uniform(-1, 1) * (np.abs(pop2[idx][self.ID_POS] - g_worst[self.ID_POS]) /
+                        self.generator.uniform(-1, 1) * (np.abs(pop2[idx][self.ID_POS] - g_worst[self.ID_POS]) /
                                                     (pop2[idx][self.ID_TAR][self.ID_FIT] - g_worst[self.ID_TAR][self.ID_FIT] + self.EPSILON))
             else:
-                x_new = g_best[self.ID_POS] + np.random.normal() * np.abs(pop2[idx][self.ID_POS] - g_best[self.ID_POS])
+                x_new = g_best[self.ID_POS] + self.generator.normal() * np.abs(pop2[idx][self.ID_POS] - g_best[self.ID_POS])
             pos_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
             child.append([pos_new, None])
         child = self.update_target_wrapper_population(child)
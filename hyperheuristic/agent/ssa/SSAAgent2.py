@@ -15,7 +15,7 @@ class SSAAgent2(SSAAgent):
     def extend(self):
         SSAAgent.init_initial_positions(self, self.solutions_state)
         self.epoch = 1
-        self.solutions_state = SSAAgent.solve(self)[0]
+        self.solutions_state = SSAAgent.solve(self, self.mode)[0]
         self.window_iteration = self.window_iteration + 1
         self.solutions[self.window_iteration - 1] = self.solutions_state
         return self.solutions
@@ -6,8 +6,8 @@ class AOAOrchestrator(Orchestrator):
 
     def __init__(self, objective_func, dimensions, bounds, n_quota_of_particles,
                  window_size, overall_nr_iterations,
-                 maximize=True):
-        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize)
+                 maximize=True, seed=None):
+        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize, seed)
         self.overall_nr_iterations = overall_nr_iterations
 
     def compose(self, population, tournament_proportion=None):
@@ -16,16 +16,7 @@ class AOAOrchestrator(Orchestrator):
             options = {'alpha': genome_agent[0], 'miu': genome_agent[1]
                 , 'moa_min': genome_agent[2], 'moa_max': genome_agent[3]}
 
-            lb, ub = self.bounds
-            problem_dict1 = {
-                "fit_func": self.objective_func,
-                "lb": [lb[0], ] * self.dimensions,
-                "ub": [ub[0], ] * self.dimensions,
-                "minmax": "min",
-                "log_to": None,  # 'console',
-                "save_population": False,
-            }
-            aoa_agent = AOAAgent(id=id, overall_nr_iterations=self.overall_nr_iterations, problem=problem_dict1, window_size=self.window_size,
+            aoa_agent = AOAAgent(id=id, overall_nr_iterations=self.overall_nr_iterations, problem=self.get_problem(), window_size=self.window_size,
                                  pop_size=self.n_quota_of_solutions, alpha=options['alpha'], miu=options['miu'],
                                  moa_min=options['moa_min'], moa_max=options['moa_max'])
             initial_solutions = self.tournament_selection(self.overall_solutions_state,
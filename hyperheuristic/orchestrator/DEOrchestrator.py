@@ -6,8 +6,8 @@ from hyperheuristic.orchestrator.Orchestrator import Orchestrator
 class DEOrchestrator(Orchestrator):
 
     def __init__(self, objective_func, dimensions, bounds, n_quota_of_particles,
-                 window_size, maximize=True):
-        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize)
+                 window_size, maximize=True, seed=None):
+        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize, seed)
 
     def compose(self, population, tournament_proportion=None):
         agent_ensemble = []
@@ -15,17 +15,7 @@ class DEOrchestrator(Orchestrator):
             options = {'wf': genome_agent[0], 'cr': genome_agent[1]
             , 'strategy': genome_agent[2]}
 
-            lb, ub = self.bounds
-            problem_dict1 = {
-                "fit_func": self.objective_func,
-                "lb": [lb[0], ] * self.dimensions,
-                "ub": [ub[0], ] * self.dimensions,
-                "minmax": "min",
-                "log_to": None,  # 'console',
-                "save_population": False,
-            }
-
-            agent = DEAgent(id=id, problem=problem_dict1, epoch=self.window_size,
+            agent = DEAgent(id=id, problem=self.get_problem(), epoch=self.window_size,
                             pop_size=self.n_quota_of_solutions, wf=options['wf'], cr=options['cr'], strategy=options['strategy'])
             if tournament_proportion != None:
                 initial_solutions = self.tournament_selection(self.overall_solutions_state,
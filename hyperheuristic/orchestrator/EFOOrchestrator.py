@@ -20,17 +20,7 @@ class EFOOrchestrator(Orchestrator):
             options = {'r_rate': genome_agent[0], 'ps_rate': genome_agent[1],
                        'p_field': genome_agent[2], 'n_field': genome_agent[3]}
 
-            lb, ub = self.bounds
-            problem_dict1 = {
-                "fit_func": self.objective_func,
-                "lb": [lb[0], ] * self.dimensions,
-                "ub": [ub[0], ] * self.dimensions,
-                "minmax": "min",
-                "log_to": None,  # 'console',
-                "save_population": False,
-            }
-
-            efo_agent = EFOAgent(id=id, problem=problem_dict1, window_size=self.window_size,
+            efo_agent = EFOAgent(id=id, problem=self.get_problem(), window_size=self.window_size,
                                  pop_size=self.n_quota_of_solutions, r_rate=options['r_rate'],
                                  ps_rate=options['ps_rate'], p_field=options['p_field'], n_field=options['n_field'])
             initial_solutions = self.tournament_selection(self.overall_solutions_state,
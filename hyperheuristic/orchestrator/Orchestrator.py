@@ -3,11 +3,13 @@ import concurrent.futures
 import copy
 from operator import attrgetter
 import random
+import time
 
 import numpy as np
 
 from hyperheuristic.orchestrator.metrics.RelativeConvergenceMetric import RelativeConvergenceMetric
 from hyperheuristic.orchestrator.metrics.RelativeDiversityMetric import RelativeDiversityMetric
+from metaheuristic.optimizer.problem import Problem
 
 
 class Orchestrator(metaclass=abc.ABCMeta):
@@ -22,28 +24,59 @@ class Orchestrator(metaclass=abc.ABCMeta):
     overall_global_solutions_state = None
     bounds = None
     iteration = 0
+    mode = "sequential"  # mode of agent.solve(), i.e: 'async' for a coroutine objective function
+    problem = None  # Problem of the agents, validated once by get_problem()
+    construction_time = 0.0  # Time in seconds spent creating the agents of all the hypergenerations
+    construction_evaluations = 0  # Evaluations of the objective function done by the checks of the problems
 
     def __init__(self, objective_func, dimensions, bounds, n_quota_of_particles, window_size,
-                 maximize=True):
+                 maximize=True, seed=None):
         self.dimensions = dimensions
         self.objective_func = objective_func
         self.n_quota_of_solutions = n_quota_of_particles
         self.window_size = window_size
         self.maximize = maximize
         self.bounds = bounds
+        # Each agent of each hypergeneration gets its own child stream, None draws the seed from the global np.random state
+        self.seed_sequence = np.random.SeedSequence(np.random.randint(np.iinfo(np.int64).max) if seed is None else seed)
 
     @abc.abstractmethod
     def compose(self, population, tournament_proportion=None):
         pass
 
+    def get_problem(self):
+        # The checks (and the probe evaluations) of the problem are done once, each agent gets a copy of it
+        if self.problem is None:
+            lb, ub = self.bounds
+            self.problem = Problem(problem={
+                "fit_func": self.objective_func,
+                "lb": [lb[0], ] * self.dimensions,
+                "ub": [ub[0], ] * self.dimensions,
+                "minmax": "min",
+                "log_to": None,  # 'console',
+                "save_population": False,
+            })
+            self.construction_evaluations += self.problem.n_probe_evaluations
+        return self.problem
+
+    def build_ensemble(self, population, tournament_proportion=None):
+        start = time.perf_counter()
+        agent_ensemble = self.compose(population, tournament_proportion)
+        self.construction_time += time.perf_counter() - start
+        self.construction_evaluations += sum(agent.problem.n_probe_evaluations for agent in agent_ensemble)
+        for agent, seed in zip(agent_ensemble, self.seed_sequence.spawn(len(agent_ensemble))):
+            agent.set_seed(seed)
+        return agent_ensemble
+
     def orchestrate(self, population, tournament_proportion=None):
         ensemble_solutions_history = []
         ensemble_last_solutions = []
-        agent_ensemble = self.compose(population, tournament_proportion)
+        agent_ensemble = self.build_ensemble(population, tournament_proportion)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = {executor.submit(agent.solve): agent for agent in agent_ensemble}
-            for fut in concurrent.futures.as_completed(futures):
+            # The results are gathered in the order of the population, whatever the agent finishing first
+            futures = [executor.submit(agent.solve, self.mode) for agent in agent_ensemble]
+            for fut in futures:
                 solutions_per_iteration = fut.result()
                 ensemble_solutions_history.append(solutions_per_iteration)
                 ensemble_last_solutions = np.append(ensemble_last_solutions,
@@ -5,8 +5,8 @@ from hyperheuristic.orchestrator.Orchestrator import Orchestrator
 class SSAOrchestrator(Orchestrator):
 
     def __init__(self, objective_func, dimensions, bounds, n_quota_of_particles,
-                 window_size, maximize=True):
-        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize)
+                 window_size, maximize=True, seed=None):
+        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize, seed)
 
     def compose(self, population, tournament_proportion=None):
         agent_ensemble = []
@@ -14,17 +14,7 @@ class SSAOrchestrator(Orchestrator):
             options = {'ST': genome_agent[0], 'PD': genome_agent[1]
                 , 'SD': genome_agent[2]}
 
-            lb, ub = self.bounds
-            problem_dict1 = {
-                "fit_func": self.objective_func,
-                "lb": [lb[0], ] * self.dimensions,
-                "ub": [ub[0], ] * self.dimensions,
-                "minmax": "min",
-                "log_to": None,  # 'console',
-                "save_population": False,
-            }
-
-            agent = SSAAgent(id=id, problem=problem_dict1,
+            agent = SSAAgent(id=id, problem=self.get_problem(),
                              window_size=self.window_size, pop_size=self.n_quota_of_solutions, ST=options['ST'],
                              PD=options['PD'], SD=options['SD'])
             initial_solutions = self.tournament_selection(self.overall_solutions_state,
@@ -14,8 +14,8 @@ class SSAOrchestrator2(Orchestrator):
     consistency_metric = AggregatedConsistencyMetric(set_divisor=3)
 
     def __init__(self, objective_func, dimensions, bounds, n_quota_of_particles,
-                 window_size, maximize=True):
-        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize)
+                 window_size, maximize=True, seed=None):
+        super().__init__(objective_func, dimensions, bounds, n_quota_of_particles, window_size, maximize, seed)
 
     def compose(self, population, tournament_proportion=None):
         agent_ensemble = []
@@ -23,17 +23,7 @@ class SSAOrchestrator2(Orchestrator):
             options = {'ST': genome_agent[0], 'PD': genome_agent[1]
                 , 'SD': genome_agent[2]}
 
-            lb, ub = self.bounds
-            problem_dict1 = {
-                "fit_func": self.objective_func,
-                "lb": [lb[0], ] * self.dimensions,
-                "ub": [ub[0], ] * self.dimensions,
-                "minmax": "min",
-                "log_to": None,  # 'console',
-                "save_population": False,
-            }
-
-            agent = SSAAgent2(id=id, problem=problem_dict1,
+            agent = SSAAgent2(id=id, problem=self.get_problem(),
                               window_size=self.window_size, pop_size=self.n_quota_of_solutions, ST=options['ST'],
                               PD=options['PD'], SD=options['SD'])
             initial_solutions = self.tournament_selection(self.overall_solutions_state,
@@ -45,11 +35,11 @@ class SSAOrchestrator2(Orchestrator):
     def orchestrate(self, population):
         ensemble_solutions_history = []
         ensemble_last_solutions = []
-        agent_ensemble = self.compose(population)
+        agent_ensemble = self.build_ensemble(population)
 
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = {executor.submit(agent.solve): agent for agent in agent_ensemble}
-            for fut in concurrent.futures.as_completed(futures):
+            futures = [executor.submit(agent.solve, self.mode) for agent in agent_ensemble]
+            for fut in futures:
                 solutions_per_iteration = fut.result()
                 ensemble_solutions_history.append(solutions_per_iteration)
                 ensemble_last_solutions = np.append(ensemble_last_solutions,
@@ -60,8 +50,8 @@ class SSAOrchestrator2(Orchestrator):
             ensemble_solutions_history = []
             ensemble_last_solutions = []
             with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = {executor.submit(agent.extend): agent for agent in agent_ensemble}
-                for fut in concurrent.futures.as_completed(futures):
+                futures = [executor.submit(agent.extend) for agent in agent_ensemble]
+                for fut in futures:
                     solutions_per_iteration = fut.result()
                     ensemble_solutions_history.append(solutions_per_iteration)
                     ensemble_last_solutions = np.append(ensemble_last_solutions,
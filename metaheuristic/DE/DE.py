@@ -5,9 +5,10 @@
 # --------------------------------------------------%
 
 import numpy as np
-from scipy.stats import cauchy
 from copy import deepcopy
 
+from metaheuristic.DE.strategies import get_mutants, get_crossover, get_normal_cr, get_cauchy_f, get_sorted_index, \
+    get_current_to_pbest, get_binomial_crossover, ExternalArchive
 from metaheuristic.optimizer.optimizer import Optimizer
 
 
@@ -80,10 +81,6 @@ class BaseDE(Optimizer):
         self.sort_flag = False
 
 
-    def _mutation__(self, current_pos, new_pos):
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
-        return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-
     def evolve(self, epoch):
         """
         The main operations (equations) of algorithm. Inherit from Optimizer class
@@ -91,62 +88,11 @@ class BaseDE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop = []
-        if self.strategy == 0:
-            # Choose 3 random element and different to i
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 1:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 2:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 4, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[2]][self.ID_POS] - self.pop[idx_list[3]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 3:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 5, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[3]][self.ID_POS] - self.pop[idx_list[4]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 4:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.wf * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        elif self.strategy == 5:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.wf * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.wf * (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-        else:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                if self.pop[idx_list[0]][self.ID_FIT] < self.pop[idx_list[1]][self.ID_FIT]:
-                    pos_new = self.pop[idx_list[0]][self.ID_POS] + self.wf * \
-                              (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                else:
-                    pos_new = self.pop[idx_list[1]][self.ID_POS] + self.wf * (
-                            self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
-
+        # The donor vectors and the crossover of the whole population are computed at once, see strategies.py
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        mutants = get_mutants(self.generator, self.strategy, pos_matrix, self.g_best[self.ID_POS], self.wf)
+        pos_new = get_crossover(self.generator, pos_matrix, mutants, self.cr)
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
         # create new pop by comparing fitness of corresponding each member in pop and children
@@ -225,7 +171,7 @@ class JADE(Optimizer):
         ## Dynamic variable, changing in run time
         self.dyn_miu_cr = self.miu_cr
         self.dyn_miu_f = self.miu_f
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = ExternalArchive(self.pop_size, self.problem.n_dims)
 
     ### Survivor Selection
     def lehmer_mean(self, list_objects):
@@ -239,71 +185,31 @@ class JADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        temp_f = list()
-        temp_cr = list()
-
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            cr = np.random.normal(self.dyn_miu_cr, 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f, 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            temp_f.append(f)
-            temp_cr.append(cr)
-            top = int(self.pop_size * self.pt)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop.append([pos_new, None])
+        # The parameters, the donor vectors and the crossover of the whole population are computed at once
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        list_cr = get_normal_cr(self.generator, np.full(len(self.pop), self.dyn_miu_cr))
+        list_f = get_cauchy_f(self.generator, np.full(len(self.pop), self.dyn_miu_f))
+        mutants = get_current_to_pbest(self.generator, pos_matrix, fit_list, list_f, self.pt, self.dyn_pop_archive, self.problem.minmax)
+        pos_new = get_binomial_crossover(self.generator, pos_matrix, mutants, list_cr)
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop[idx], self.pop[idx]):
-                self.dyn_pop_archive.append(deepcopy(self.pop[idx]))
-                list_cr.append(temp_cr[idx])
-                list_f.append(temp_f[idx])
-                self.pop[idx] = deepcopy(pop[idx])
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        # The replaced parents go to the archive, the random surplus is removed
+        improved = np.array([self.compare_agent(pop[idx], self.pop[idx]) for idx in range(0, len(self.pop))], dtype=bool)
+        self.dyn_pop_archive.add(self.generator, pos_matrix[improved])
+        for idx in np.flatnonzero(improved):
+            self.pop[idx] = pop[idx]
 
         # Update miu_cr and miu_f
-        if len(list_cr) == 0:
+        if not np.any(improved):
             self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * 0.5
-        else:
-            self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * np.mean(np.array(list_cr))
-        if len(list_f) == 0:
             self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * 0.5
         else:
-            self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * self.lehmer_mean(np.array(list_f))
+            self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * np.mean(list_cr[improved])
+            self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * self.lehmer_mean(list_f[improved])
         return pop
 
-
 class SADE(Optimizer):
     """
     The original version of: Self-Adaptive Differential Evolution (SADE)
@@ -372,22 +278,22 @@ class SADE(Optimizer):
         list_cr = []
         for idx in range(0, self.pop_size):
             ## Calculate adaptive parameter cr and f
-            cr = np.random.normal(self.crm, 0.1)
+            cr = self.generator.normal(self.crm, 0.1)
             cr = np.clip(cr, 0, 1)
             list_cr.append(cr)
             while True:
-                f = np.random.normal(0.5, 0.3)
+                f = self.generator.normal(0.5, 0.3)
                 if f < 0:
                     continue
                 elif f > 1:
                     f = 1
                 break
 
-            id1, id2, id3 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-            if np.random.rand() < self.p1:
+            id1, id2, id3 = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+            if self.generator.random() < self.p1:
                 x_new = self.pop[id1][self.ID_POS] + f * (self.pop[id2][self.ID_POS] - self.pop[id3][self.ID_POS])
-                pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-                j_rand = np.random.randint(0, self.problem.n_dims)
+                pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
+                j_rand = self.generator.integers(0, self.problem.n_dims)
                 pos_new[j_rand] = x_new[j_rand]
                 pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                 pop.append([pos_new, None])
@@ -395,8 +301,8 @@ class SADE(Optimizer):
             else:
                 x_new = self.pop[idx][self.ID_POS] + f * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
                         f * (self.pop[id1][self.ID_POS] - self.pop[id2][self.ID_POS])
-                pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-                j_rand = np.random.randint(0, self.problem.n_dims)
+                pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
+                j_rand = self.generator.integers(0, self.problem.n_dims)
                 pos_new[j_rand] = x_new[j_rand]
                 pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                 pop.append([pos_new, None])
@@ -490,7 +396,7 @@ class SHADE(Optimizer):
         # Dynamic variable
         self.dyn_miu_f = miu_f * np.ones(self.pop_size)  # list the initial f,
         self.dyn_miu_cr = miu_cr * np.ones(self.pop_size)  # list the initial cr,
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = ExternalArchive(self.pop_size, self.problem.n_dims)
         self.k_counter = 0
 
     ### Survivor Selection
@@ -506,90 +412,39 @@ class SHADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        list_f_index = list()
-        list_cr_index = list()
-
-        list_f_new = np.ones(self.pop_size)
-        list_cr_new = np.ones(self.pop_size)
-        pop_old = deepcopy(self.pop)
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            idx_rand = np.random.randint(0, self.pop_size)
-            cr = np.random.normal(self.dyn_miu_cr[idx_rand], 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f[idx_rand], 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            list_cr_new[idx] = cr
-            list_f_new[idx] = f
-            p = np.random.uniform(2 / self.pop_size, 0.2)
-            top = int(self.pop_size * p)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop.append([pos_new, None])
+        # The parameters, the donor vectors and the crossover of the whole population are computed at once
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        idx_rand = self.generator.integers(0, self.pop_size, size=len(self.pop))
+        list_cr = get_normal_cr(self.generator, self.dyn_miu_cr[idx_rand])
+        list_f = get_cauchy_f(self.generator, self.dyn_miu_f[idx_rand])
+        list_p = self.generator.uniform(2 / len(self.pop), 0.2, size=len(self.pop))
+        mutants = get_current_to_pbest(self.generator, pos_matrix, fit_list, list_f, list_p, self.dyn_pop_archive, self.problem.minmax)
+        pos_new = get_binomial_crossover(self.generator, pos_matrix, mutants, list_cr)
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
-        for i in range(0, self.pop_size):
-            if self.compare_agent(pop[i], self.pop[i]):
-                list_cr.append(list_cr_new[i])
-                list_f.append(list_f_new[i])
-                list_f_index.append(i)
-                list_cr_index.append(i)
-                self.pop[i] = deepcopy(pop[i])
-                self.dyn_pop_archive.append(deepcopy(pop[i]))
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        improved = np.array([self.compare_agent(pop[idx], self.pop[idx]) for idx in range(0, len(self.pop))], dtype=bool)
+        list_idx = np.flatnonzero(improved)
+        fit_old = fit_list[list_idx]
+        for idx in list_idx:
+            self.pop[idx] = pop[idx]
+            fit_list[idx] = pop[idx][self.ID_TAR][self.ID_FIT]
+        # The random surplus of the archive is removed
+        self.dyn_pop_archive.add(self.generator, [pop[idx][self.ID_POS] for idx in list_idx])
 
         # Update miu_cr and miu_f
-        if len(list_f) != 0 and len(list_cr) != 0:
+        if len(list_idx) != 0:
             # Eq.13, 14, 10
-            list_fit_old = np.ones(len(list_cr_index))
-            list_fit_new = np.ones(len(list_cr_index))
-            idx_increase = 0
-            for i in range(0, self.pop_size):
-                if i in list_cr_index:
-                    list_fit_old[idx_increase] = pop_old[i][self.ID_TAR][self.ID_FIT]
-                    list_fit_new[idx_increase] = self.pop[i][self.ID_TAR][self.ID_FIT]
-                    idx_increase += 1
-            temp = sum(abs(list_fit_new - list_fit_old))
-            if temp == 0:
-                list_weights = 1.0 / len(list_fit_new) * np.ones(len(list_fit_new))
-            else:
-                list_weights = abs(list_fit_new - list_fit_old) / temp
-            self.dyn_miu_cr[self.k_counter] = sum(list_weights * np.array(list_cr))
-            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(np.array(list_f), list_weights)
+            delta = np.abs(fit_list[list_idx] - fit_old)
+            total_fit = np.sum(delta)
+            list_weights = np.full(len(list_idx), 1.0 / len(list_idx)) if total_fit == 0 else delta / total_fit
+            self.dyn_miu_cr[self.k_counter] = np.sum(list_weights * list_cr[list_idx])
+            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(list_f[list_idx], list_weights)
             self.k_counter += 1
             if self.k_counter >= self.pop_size:
                 self.k_counter = 0
 
-
 class L_SHADE(Optimizer):
     """
     The original version of: Linear Population Size Reduction Success-History Adaptation Differential Evolution (LSHADE)
@@ -652,10 +507,19 @@ class L_SHADE(Optimizer):
         # Dynamic variable
         self.dyn_miu_f = self.miu_f * np.ones(self.pop_size)  # list the initial f,
         self.dyn_miu_cr = self.miu_cr * np.ones(self.pop_size)  # list the initial cr,
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = ExternalArchive(self.pop_size, self.problem.n_dims)
+        self.dyn_pop_size = self.pop_size
+        self.k_counter = 0
+        self.n_min = max(4, int(self.pop_size / 5))
+
+    def initialization(self):
+        super().initialization()
+        # A new run starts again from the full population size and the initial memories of f and cr
+        self.dyn_miu_f = self.miu_f * np.ones(self.pop_size)
+        self.dyn_miu_cr = self.miu_cr * np.ones(self.pop_size)
+        self.dyn_pop_archive = ExternalArchive(self.pop_size, self.problem.n_dims)
         self.dyn_pop_size = self.pop_size
         self.k_counter = 0
-        self.n_min = int(self.pop_size / 5)
 
     ### Survivor Selection
     def weighted_lehmer_mean(self, list_objects, list_weights):
@@ -670,89 +534,46 @@ class L_SHADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        list_f_index = list()
-        list_cr_index = list()
-
-        list_f_new = np.ones(self.pop_size)
-        list_cr_new = np.ones(self.pop_size)
-        pop_old = deepcopy(self.pop)
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            idx_rand = np.random.randint(0, self.pop_size)
-            cr = np.random.normal(self.dyn_miu_cr[idx_rand], 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f[idx_rand], 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            list_cr_new[idx] = cr
-            list_f_new[idx] = f
-            p = np.random.uniform(0.15, 0.2)
-            top = int(self.dyn_pop_size * p)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.dyn_pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop.append([pos_new, None])
+        # The parameters, the donor vectors and the crossover of the whole population are computed at once
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        idx_rand = self.generator.integers(0, self.pop_size, size=len(self.pop))
+        list_cr = get_normal_cr(self.generator, self.dyn_miu_cr[idx_rand])
+        list_f = get_cauchy_f(self.generator, self.dyn_miu_f[idx_rand])
+        list_p = self.generator.uniform(0.15, 0.2, size=len(self.pop))
+        mutants = get_current_to_pbest(self.generator, pos_matrix, fit_list, list_f, list_p, self.dyn_pop_archive, self.problem.minmax)
+        pos_new = get_binomial_crossover(self.generator, pos_matrix, mutants, list_cr)
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
-        for i in range(0, self.pop_size):
-            if self.compare_agent(pop[i], self.pop[i]):
-                list_cr.append(list_cr_new[i])
-                list_f.append(list_f_new[i])
-                list_f_index.append(i)
-                list_cr_index.append(i)
-                self.pop[i] = deepcopy(pop[i])
-                self.dyn_pop_archive.append(deepcopy(self.pop[i]))
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        improved = np.array([self.compare_agent(pop[idx], self.pop[idx]) for idx in range(0, len(self.pop))], dtype=bool)
+        list_idx = np.flatnonzero(improved)
+        fit_old = fit_list[list_idx]
+        for idx in list_idx:
+            self.pop[idx] = pop[idx]
+            fit_list[idx] = pop[idx][self.ID_TAR][self.ID_FIT]
+        # The random surplus of the archive is removed
+        self.dyn_pop_archive.add(self.generator, [pop[idx][self.ID_POS] for idx in list_idx])
 
         # Update miu_cr and miu_f
-        if len(list_f) != 0 and len(list_cr) != 0:
+        if len(list_idx) != 0:
             # Eq.13, 14, 10
-            list_fit_old = np.ones(len(list_cr_index))
-            list_fit_new = np.ones(len(list_cr_index))
-            idx_increase = 0
-            for i in range(0, self.dyn_pop_size):
-                if i in list_cr_index:
-                    list_fit_old[idx_increase] = pop_old[i][self.ID_TAR][self.ID_FIT]
-                    list_fit_new[idx_increase] = self.pop[i][self.ID_TAR][self.ID_FIT]
-                    idx_increase += 1
-            total_fit = sum(np.abs(list_fit_new - list_fit_old))
-            list_weights = 0 if total_fit == 0 else np.abs(list_fit_new - list_fit_old) / total_fit
-            self.dyn_miu_cr[self.k_counter] = sum(list_weights * np.array(list_cr))
-            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(np.array(list_f), list_weights)
+            delta = np.abs(fit_list[list_idx] - fit_old)
+            total_fit = np.sum(delta)
+            list_weights = 0 if total_fit == 0 else delta / total_fit
+            self.dyn_miu_cr[self.k_counter] = np.sum(list_weights * list_cr[list_idx])
+            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(list_f[list_idx], list_weights)
             self.k_counter += 1
             if self.k_counter >= self.dyn_pop_size:
                 self.k_counter = 0
 
-        # Linear Population Size Reduction
-        self.dyn_pop_size = round(self.pop_size + epoch * ((self.n_min - self.pop_size) / self.epoch))
-
+        # Linear Population Size Reduction: the worst agents are removed, the archive shrinks to the population size
+        self.dyn_pop_size = max(self.n_min, round(self.pop_size + epoch * ((self.n_min - self.pop_size) / self.epoch)))
+        if len(self.pop) > self.dyn_pop_size:
+            list_keep = np.sort(get_sorted_index(fit_list, self.problem.minmax)[:self.dyn_pop_size])
+            self.pop[:] = [self.pop[idx] for idx in list_keep]
+            self.dyn_pop_archive.resize(self.generator, self.dyn_pop_size)
+        self.nfe_per_epoch = self.dyn_pop_size
 
 class SAP_DE(Optimizer):
     """
@@ -825,12 +646,12 @@ class SAP_DE(Optimizer):
         position = self.generate_position(lb, ub)
         position = self.amend_position(position, lb, ub)
         target = self.get_target_wrapper(position)
-        crossover_rate = np.random.uniform(0, 1)
-        mutation_rate = np.random.uniform(0, 1)
+        crossover_rate = self.generator.uniform(0, 1)
+        mutation_rate = self.generator.uniform(0, 1)
         if self.branch == "ABS":
-            pop_size = int(10 * self.problem.n_dims + np.random.normal(0, 1))
+            pop_size = int(10 * self.problem.n_dims + self.generator.normal(0, 1))
         else:  # elif self.branch == "REL":
-            pop_size = int(10 * self.problem.n_dims + np.random.uniform(-0.5, 0.5))
+            pop_size = int(10 * self.problem.n_dims + self.generator.uniform(-0.5, 0.5))
         return [position, target, crossover_rate, mutation_rate, pop_size]
 
     def edit_to_range(self, var=None, lower=0, upper=1, func_value=None):
@@ -851,12 +672,12 @@ class SAP_DE(Optimizer):
         pop = []
         for idx in range(0, self.pop_size):
             # Choose 3 random element and different to idx
-            idxs = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-            j = np.random.randint(0, self.pop_size)
-            self.F = np.random.uniform(0, 1)
+            idxs = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+            j = self.generator.integers(0, self.pop_size)
+            self.F = self.generator.uniform(0, 1)
 
             ## Crossover
-            if np.random.uniform(0, 1) < self.pop[idx][self.ID_CR] or idx == j:
+            if self.generator.uniform(0, 1) < self.pop[idx][self.ID_CR] or idx == j:
                 pos_new = self.pop[idxs[0]][self.ID_POS] + self.F * (self.pop[idxs[1]][self.ID_POS] - self.pop[idxs[2]][self.ID_POS])
                 cr_new = self.pop[idxs[0]][self.ID_CR] + self.F * (self.pop[idxs[1]][self.ID_CR] - self.pop[idxs[2]][self.ID_CR])
                 mr_new = self.pop[idxs[0]][self.ID_MR] + self.F * (self.pop[idxs[1]][self.ID_MR] - self.pop[idxs[2]][self.ID_MR])
@@ -865,20 +686,20 @@ class SAP_DE(Optimizer):
                 else:  # elif self.branch == "REL":
                     ps_new = self.pop[idxs[0]][self.ID_PS] + self.F * (self.pop[idxs[1]][self.ID_PS] - self.pop[idxs[2]][self.ID_PS])
                 pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-                cr_new = self.edit_to_range(cr_new, 0, 1, np.random.random)
-                mr_new = self.edit_to_range(mr_new, 0, 1, np.random.random)
+                cr_new = self.edit_to_range(cr_new, 0, 1, self.generator.random)
+                mr_new = self.edit_to_range(mr_new, 0, 1, self.generator.random)
                 pop.append([pos_new, None, cr_new, mr_new, ps_new])
             else:
                 pop.append(deepcopy(self.pop[idx]))
             ## Mutation
-            if np.random.uniform(0, 1) < self.pop[idxs[0]][self.ID_MR]:
-                pos_new = self.pop[idx][self.ID_POS] + np.random.normal(0, self.pop[idxs[0]][self.ID_MR])
-                cr_new = np.random.normal(0, 1)
-                mr_new = np.random.normal(0, 1)
+            if self.generator.uniform(0, 1) < self.pop[idxs[0]][self.ID_MR]:
+                pos_new = self.pop[idx][self.ID_POS] + self.generator.normal(0, self.pop[idxs[0]][self.ID_MR])
+                cr_new = self.generator.normal(0, 1)
+                mr_new = self.generator.normal(0, 1)
                 if self.branch == "ABS":
-                    ps_new = self.pop[idx][self.ID_PS] + int(np.random.normal(0.5, 1))
+                    ps_new = self.pop[idx][self.ID_PS] + int(self.generator.normal(0.5, 1))
                 else:  # elif self.branch == "REL":
-                    ps_new = self.pop[idx][self.ID_PS] + np.random.normal(0, self.pop[idxs[0]][self.ID_MR])
+                    ps_new = self.pop[idx][self.ID_PS] + self.generator.normal(0, self.pop[idxs[0]][self.ID_MR])
                 pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                 pop.append([pos_new, None, cr_new, mr_new, ps_new])
         pop = self.update_target_wrapper_population(pop)
@@ -890,9 +711,9 @@ class SAP_DE(Optimizer):
         else:  # elif self.branch == "REL":
             m_new = int(self.pop_size + total)
         if m_new <= 4:
-            m_new = self.fixed_pop_size + int(np.random.uniform(0, 4))
+            m_new = self.fixed_pop_size + int(self.generator.uniform(0, 4))
         elif m_new > 4 * self.fixed_pop_size:
-            m_new = self.fixed_pop_size - int(np.random.uniform(0, 4))
+            m_new = self.fixed_pop_size - int(self.generator.uniform(0, 4))
 
         ## Change population by population size
         if m_new <= self.pop_size:
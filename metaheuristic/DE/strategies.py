@@ -0,0 +1,265 @@
+import numpy as np
+
+
+def get_distinct_indices(generator, pop_size, n_indices, n_rows=None):
+    """
+    Random indices of the donors of each agent: the indices of a row are distinct and different from the row index,
+    drawn for the whole population at once without building the list of the other agents
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pop_size (int): number of agents the indices are drawn from
+        n_indices (int): number of indices of each row, lower than pop_size
+        n_rows (int): number of rows (the first n_rows agents), default = pop_size
+
+    Returns:
+        np.ndarray: (n_rows, n_indices) matrix of indices
+    """
+    n_rows = pop_size if n_rows is None else n_rows
+    chosen = np.arange(0, n_rows)[:, None]
+    for idx in range(0, n_indices):
+        # Uniform index among the pop_size - 1 - idx agents not chosen yet: skip the chosen indices in increasing order
+        rand = generator.integers(0, pop_size - 1 - idx, size=n_rows)
+        for column in np.sort(chosen, axis=1).T:
+            rand += rand >= column
+        chosen = np.hstack([chosen, rand[:, None]])
+    return chosen[:, 1:]
+
+
+def get_distinct_pairs(generator, pop_size, n_dims):
+    """
+    Random pair of agents of each variable of each agent: the 2 indices are distinct and different from the row index,
+    drawn for the whole population at once (i.e: the competitors of CL_PSO, the 2 random agents of OriginalSMA)
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pop_size (int): number of agents, at least 3
+        n_dims (int): number of variables
+
+    Returns:
+        tuple: 2 (pop_size, n_dims) matrices of indices
+    """
+    rows = np.arange(0, pop_size)[:, None]
+    # Skip the indices already chosen in increasing order
+    id1 = generator.integers(0, pop_size - 1, (pop_size, n_dims))
+    id1 += id1 >= rows
+    id2 = generator.integers(0, pop_size - 2, (pop_size, n_dims))
+    id2 += id2 >= np.minimum(rows, id1)
+    id2 += id2 >= np.maximum(rows, id1)
+    return id1, id2
+
+
+def get_mutants(generator, strategy, pos_matrix, best_pos, wf, fit_list=None, minmax="min"):
+    """
+    Donor vectors of the DE strategies for the whole population
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        strategy (int): [0, 6]
+
+            * 0: DE/rand/1
+            * 1: DE/best/1
+            * 2: DE/best/2
+            * 3: DE/rand/2
+            * 4: DE/current-to-best/1
+            * 5: DE/current-to-rand/1
+            * 6: DE/current-to-rand/1 with the 3 random agents sorted by fitness (the best one is the target)
+
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        best_pos (np.ndarray): position of the global best solution
+        wf (float): weighting factor
+        fit_list (np.ndarray): fitness of the population, only needed by the strategy 6
+        minmax (str): "min" or "max" problem, only needed by the strategy 6
+
+    Returns:
+        np.ndarray: (pop_size, n_dims) donor vectors
+    """
+    n_indices = (3, 2, 4, 5, 2, 3, 3)[strategy]
+    idx = get_distinct_indices(generator, len(pos_matrix), n_indices)
+    x = pos_matrix[idx]  # (pop_size, n_indices, n_dims)
+    if strategy == 0:
+        return x[:, 0] + wf * (x[:, 1] - x[:, 2])
+    elif strategy == 1:
+        return best_pos + wf * (x[:, 0] - x[:, 1])
+    elif strategy == 2:
+        return best_pos + wf * (x[:, 0] - x[:, 1]) + wf * (x[:, 2] - x[:, 3])
+    elif strategy == 3:
+        return x[:, 0] + wf * (x[:, 1] - x[:, 2]) + wf * (x[:, 3] - x[:, 4])
+    elif strategy == 4:
+        return pos_matrix + wf * (best_pos - pos_matrix) + wf * (x[:, 0] - x[:, 1])
+    elif strategy == 5:
+        return pos_matrix + wf * (x[:, 0] - pos_matrix) + wf * (x[:, 1] - x[:, 2])
+    fit_donors = fit_list[idx] if minmax == "min" else -fit_list[idx]
+    order = np.argsort(fit_donors, axis=1, kind="stable")
+    x = np.take_along_axis(x, order[:, :, None], axis=1)
+    return pos_matrix + wf * (x[:, 0] - pos_matrix) + wf * (x[:, 1] - x[:, 2])
+
+
+def get_crossover(generator, pos_matrix, mutants, cr):
+    """
+    Crossover of the DE agents as a single mask, each variable keeps the current position with probability cr
+    (the rule of the original _mutation__() of BaseDE), the donor vector otherwise
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        mutants (np.ndarray): (pop_size, n_dims) donor vectors
+        cr (float): crossover rate
+
+    Returns:
+        np.ndarray: (pop_size, n_dims) trial vectors
+    """
+    return np.where(generator.uniform(0, 1, pos_matrix.shape) < cr, pos_matrix, mutants)
+
+
+def get_normal_cr(generator, loc, scale=0.1):
+    """
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        loc (np.ndarray): mean crossover rate of each agent
+        scale (float): standard deviation
+
+    Returns:
+        np.ndarray: the crossover rates, drawn from a normal distribution and clipped to [0, 1]
+    """
+    return np.clip(generator.normal(loc, scale), 0, 1)
+
+
+def get_cauchy_f(generator, loc, scale=0.1):
+    """
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        loc (np.ndarray): location of the weighting factor of each agent
+        scale (float): scale of the Cauchy distribution
+
+    Returns:
+        np.ndarray: the weighting factors, drawn from a Cauchy distribution again while negative and truncated to 1
+    """
+    loc = np.asarray(loc, dtype=float)
+    f = loc + scale * generator.standard_cauchy(loc.shape)
+    bad = f < 0
+    while np.any(bad):
+        f[bad] = loc[bad] + scale * generator.standard_cauchy(int(np.sum(bad)))
+        bad = f < 0
+    return np.minimum(f, 1)
+
+
+def get_sorted_index(fit_list, minmax="min"):
+    """
+    Args:
+        fit_list (np.ndarray): fitness of the population
+        minmax (str): "min" or "max" problem
+
+    Returns:
+        np.ndarray: indices of the agents from the best one to the worst one
+    """
+    return np.argsort(fit_list if minmax == "min" else -fit_list, kind="stable")
+
+
+def get_current_to_pbest(generator, pos_matrix, fit_list, f, p, archive=None, minmax="min", max_tries=100):
+    """
+    DE/current-to-pbest/1 donor vectors of the whole population (JADE, SHADE, L_SHADE):
+    v = x + f * (x_pbest - x) + f * (x_r1 - x_r2), x_pbest among the top p of the population, x_r1 in the population
+    (different from x), x_r2 in the population and the archive (with a position different from x and x_r1)
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        fit_list (np.ndarray): fitness of the population
+        f (np.ndarray): weighting factor of each agent
+        p (float, np.ndarray): proportion of the top agents (one value or one per agent), at least one agent is used
+        archive (ExternalArchive): archive of the replaced solutions, None for no archive
+        minmax (str): "min" or "max" problem
+        max_tries (int): number of draws of x_r2 before the last draw is accepted (i.e: converged population)
+
+    Returns:
+        np.ndarray: (pop_size, n_dims) donor vectors
+    """
+    pop_size = len(pos_matrix)
+    top = np.maximum(1, (pop_size * np.asarray(p)).astype(int))
+    x_pbest = pos_matrix[get_sorted_index(fit_list, minmax)[generator.integers(0, top, size=pop_size)]]
+    x_r1 = pos_matrix[get_distinct_indices(generator, pop_size, 1)[:, 0]]
+    union = pos_matrix if archive is None or archive.size == 0 else np.vstack([pos_matrix, archive.positions])
+    x_r2 = union[generator.integers(0, len(union), size=pop_size)]
+    for _ in range(0, max_tries):
+        bad = ~(np.any(x_r2 != x_r1, axis=1) & np.any(x_r2 != pos_matrix, axis=1))
+        if not np.any(bad):
+            break
+        x_r2[bad] = union[generator.integers(0, len(union), size=int(np.sum(bad)))]
+    f = np.asarray(f)[:, None]
+    return pos_matrix + f * (x_pbest - pos_matrix) + f * (x_r1 - x_r2)
+
+
+def get_binomial_crossover(generator, pos_matrix, mutants, cr):
+    """
+    Binomial crossover as a single mask: each variable comes from the donor vector with probability cr (one rate per
+    agent), and at least the variable j_rand of each agent
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        mutants (np.ndarray): (pop_size, n_dims) donor vectors
+        cr (np.ndarray): crossover rate of each agent
+
+    Returns:
+        np.ndarray: (pop_size, n_dims) trial vectors
+    """
+    pop_size, n_dims = pos_matrix.shape
+    mask = generator.uniform(0, 1, (pop_size, n_dims)) < np.asarray(cr)[:, None]
+    mask[np.arange(0, pop_size), generator.integers(0, n_dims, size=pop_size)] = True
+    return np.where(mask, mutants, pos_matrix)
+
+
+class ExternalArchive:
+    """
+    External archive of JADE/SHADE/L_SHADE in a preallocated array: the positions are written after the stored ones,
+    the random surplus is dropped when the archive is full
+    """
+
+    def __init__(self, capacity, n_dims):
+        """
+        Args:
+            capacity (int): maximum number of positions
+            n_dims (int): number of dimensions
+        """
+        self.capacity, self.size = capacity, 0
+        self.buffer = np.empty((capacity, n_dims))
+
+    @property
+    def positions(self):
+        """
+        Returns:
+            np.ndarray: (size, n_dims) view of the stored positions
+        """
+        return self.buffer[:self.size]
+
+    def add(self, generator, positions):
+        """
+        Args:
+            generator (np.random.Generator): the generator of the optimizer
+            positions (np.ndarray): (n, n_dims) positions to store
+        """
+        positions = np.asarray(positions).reshape(-1, self.buffer.shape[1])
+        n_total = self.size + len(positions)
+        if n_total <= self.capacity:
+            self.buffer[self.size:n_total] = positions
+            self.size = n_total
+            return
+        # Randomly remove the surplus of the stored and the new positions
+        keep = np.sort(generator.choice(n_total, self.capacity, replace=False))
+        self.buffer[:self.capacity] = np.vstack([self.positions, positions])[keep]
+        self.size = self.capacity
+
+    def resize(self, generator, capacity):
+        """
+        Shrink the archive in place, the random surplus is dropped
+
+        Args:
+            generator (np.random.Generator): the generator of the optimizer
+            capacity (int): new maximum number of positions
+        """
+        if capacity < self.size:
+            keep = np.sort(generator.choice(self.size, capacity, replace=False))
+            self.buffer[:capacity] = self.buffer[keep]
+            self.size = capacity
+        self.capacity = min(self.capacity, capacity)
@@ -4,7 +4,6 @@
 #       Github: https://github.com/thieu1995        %
 # --------------------------------------------------%
 
-import numpy as np
 from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
@@ -93,10 +92,10 @@ class BaseABC(Optimizer):
         """
         pop_neigh = []
         for idx in range(0, neigh_size):
-            t1 = np.random.randint(0, len(parent[self.ID_POS]) - 1)
+            t1 = self.generator.integers(0, len(parent[self.ID_POS]) - 1)
             new_bee = deepcopy(parent[self.ID_POS])
-            new_bee[t1] = (parent[self.ID_POS][t1] + np.random.uniform() * self.patch_size) if np.random.uniform() < 0.5 \
-                else (parent[self.ID_POS][t1] - np.random.uniform() * self.patch_size)
+            new_bee[t1] = (parent[self.ID_POS][t1] + self.generator.uniform() * self.patch_size) if self.generator.uniform() < 0.5 \
+                else (parent[self.ID_POS][t1] - self.generator.uniform() * self.patch_size)
             new_bee = self.amend_position(new_bee, self.problem.lb, self.problem.ub)
             pop_neigh.append([new_bee, None])
         pop_neigh = self.update_target_wrapper_population(pop_neigh)
@@ -15,7 +15,7 @@ class BaseACOR(Optimizer):
 
     Notes
     ~~~~~
-    + Use Gaussian Distribution instead of random number (np.random.normal() function)
+    + Use Gaussian Distribution instead of random number (self.generator.normal() function)
     + Amend solution when they went out of space
 
     Hyper-parameters should fine tuned in approximate range to get faster convergen toward the global optimum:
@@ -69,9 +69,37 @@ class BaseACOR(Optimizer):
         self.sample_count = self.validator.check_int("sample_count", sample_count, [2, int(self.pop_size/2)])
         self.intent_factor = self.validator.check_float("intent_factor", intent_factor, (0, 1.0))
         self.zeta = self.validator.check_float("zeta", zeta, (0, 5))
-        self.nfe_per_epoch = self.pop_size
+        self.nfe_per_epoch = self.sample_count
         self.sort_flag = True
 
+    def get_sigma_matrix(self, matrix_pos):
+        """
+        Standard deviations of the Gaussian kernels: sigma_i = zeta * sum_j |x_j - x_i| / (pop_size - 1)
+
+        Notes
+        ~~~~~
+        + The sums of the pairwise L1 distances are computed per dimension from the sorted values and their prefix sums,
+          O(pop_size * log(pop_size)) instead of O(pop_size^2) for each dimension: at the rank k of the sorted column s,
+          sum_j |s_j - s_k| = s_k * (2k - pop_size) + sum(s) - 2 * sum(s[:k])
+        + The columns are centered first so the prefix sums keep the precision of the small distances
+
+        Args:
+            matrix_pos (np.ndarray): (pop_size, n_dims) positions of the archive
+
+        Returns:
+            np.ndarray: (pop_size, n_dims) standard deviations
+        """
+        pop_size = len(matrix_pos)
+        matrix_pos = matrix_pos - np.median(matrix_pos, axis=0)
+        list_order = np.argsort(matrix_pos, axis=0, kind="stable")
+        sorted_pos = np.take_along_axis(matrix_pos, list_order, axis=0)
+        prefix_sum = np.cumsum(sorted_pos, axis=0) - sorted_pos
+        list_rank = np.arange(0, pop_size)[:, None]
+        sorted_dist = sorted_pos * (2 * list_rank - pop_size) + np.sum(sorted_pos, axis=0) - 2 * prefix_sum
+        matrix_dist = np.empty(matrix_pos.shape)
+        np.put_along_axis(matrix_dist, list_order, sorted_dist, axis=0)
+        return self.zeta * matrix_dist / (pop_size - 1)
+
     def evolve(self, epoch):
         """
         The main operations (equations) of algorithm. Inherit from Optimizer class
@@ -86,25 +114,17 @@ class BaseACOR(Optimizer):
         matrix_w = 1 / (np.sqrt(2 * np.pi) * qn) * np.exp(-0.5 * ((pop_rank - 1) / qn) ** 2)
         matrix_p = matrix_w / np.sum(matrix_w)  # Normalize to find the probability.
 
+        # Guiding kernel of each dimension of each sample, drawn with the selection probabilities
+        list_idx = self.generator.choice(self.pop_size, size=(self.sample_count, self.problem.n_dims), p=matrix_p)
+
         # Means and Standard Deviations
         matrix_pos = np.array([solution[self.ID_POS] for solution in pop])
-        matrix_sigma = []
-        for i in range(0, self.pop_size):
-            matrix_i = np.repeat(pop[i][self.ID_POS].reshape((1, -1)), self.pop_size, axis=0)
-            D = np.sum(np.abs(matrix_pos - matrix_i), axis=0)
-            temp = self.zeta * D / (self.pop_size - 1)
-            matrix_sigma.append(temp)
-        matrix_sigma = np.array(matrix_sigma)
+        matrix_sigma = self.get_sigma_matrix(matrix_pos)
 
         # Generate Samples
-        pop_new = []
-        for idx in range(0, self.sample_count):
-            # Generate Samples
-            child = np.zeros(self.problem.n_dims)
-            for j in range(0, self.problem.n_dims):
-                idx = self.get_index_roulette_wheel_selection(matrix_p)
-                child[j] = pop[idx][self.ID_POS][j] + np.random.normal() * matrix_sigma[idx, j]  # (1)
-            pos_new = self.amend_position(child, self.problem.lb, self.problem.ub)  # (2)
-            pop_new.append([pos_new, None])
+        list_dims = np.arange(0, self.problem.n_dims)
+        matrix_child = matrix_pos[list_idx, list_dims] + \
+                       self.generator.normal(size=(self.sample_count, self.problem.n_dims)) * matrix_sigma[list_idx, list_dims]  # (1)
+        pop_new = [[self.amend_position(pos_new, self.problem.lb, self.problem.ub), None] for pos_new in matrix_child]  # (2)
         pop_new = self.update_target_wrapper_population(pop_new)
         self.pop = pop + pop_new
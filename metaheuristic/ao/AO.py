@@ -5,9 +5,9 @@
 # --------------------------------------------------%
 
 import numpy as np
-from math import gamma
 
 from metaheuristic.optimizer.optimizer import Optimizer
+from metaheuristic.optimizer.levy import get_mantegna_sigma
 
 
 class OriginalAO(Optimizer):
@@ -61,9 +61,8 @@ class OriginalAO(Optimizer):
 
     def get_simple_levy_step(self):
         beta = 1.5
-        sigma = (gamma(1 + beta) * np.sin(np.pi * beta / 2) / (gamma((1 + beta) / 2) * beta * 2 ** ((beta - 1) / 2))) ** (1 / beta)
-        u = np.random.normal(0, 1, self.problem.n_dims) * sigma
-        v = np.random.normal(1, self.problem.n_dims)
+        u = self.generator.normal(0, 1, self.problem.n_dims) * get_mantegna_sigma(beta)
+        v = self.generator.normal(1, self.problem.n_dims)
         step = u / abs(v) ** (1 / beta)
         return step
 
@@ -74,7 +73,7 @@ class OriginalAO(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        g1 = 2 * np.random.rand() - 1  # Eq. 16
+        g1 = 2 * self.generator.random() - 1  # Eq. 16
         g2 = 2 * (1 - epoch / self.epoch)  # Eq. 17
 
         dim_list = np.array(list(range(1, self.problem.n_dims + 1)))
@@ -86,26 +85,26 @@ class OriginalAO(Optimizer):
         phi = -w * dim_list + phi0
         x = r * np.sin(phi)  # Eq.(9)
         y = r * np.cos(phi)  # Eq.(10)
-        QF = (epoch + 1) ** ((2 * np.random.rand() - 1) / (1 - self.epoch) ** 2)  # Eq.(15)        Quality function
+        QF = (epoch + 1) ** ((2 * self.generator.random() - 1) / (1 - self.epoch) ** 2)  # Eq.(15)        Quality function
 
         pop_new = []
         for idx in range(0, self.pop_size):
             x_mean = np.mean(np.array([item[self.ID_TAR][self.ID_FIT] for item in self.pop]), axis=0)
             if (epoch + 1) <= (2 / 3) * self.epoch:  # Eq. 3, 4
-                if np.random.rand() < 0.5:
+                if self.generator.random() < 0.5:
                     pos_new = self.g_best[self.ID_POS] * (1 - (epoch + 1) / self.epoch) + \
-                              np.random.rand() * (x_mean - self.g_best[self.ID_POS])
+                              self.generator.random() * (x_mean - self.g_best[self.ID_POS])
                 else:
-                    idx = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+                    idx = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}))
                     pos_new = self.g_best[self.ID_POS] * self.get_simple_levy_step() + \
-                              self.pop[idx][self.ID_POS] + np.random.rand() * (y - x)  # Eq. 5
+                              self.pop[idx][self.ID_POS] + self.generator.random() * (y - x)  # Eq. 5
             else:
-                if np.random.rand() < 0.5:
-                    pos_new = self.alpha * (self.g_best[self.ID_POS] - x_mean) - np.random.rand() * \
-                              (np.random.rand() * (self.problem.ub - self.problem.lb) + self.problem.lb) * self.delta  # Eq. 13
+                if self.generator.random() < 0.5:
+                    pos_new = self.alpha * (self.g_best[self.ID_POS] - x_mean) - self.generator.random() * \
+                              (self.generator.random() * (self.problem.ub - self.problem.lb) + self.problem.lb) * self.delta  # Eq. 13
                 else:
-                    pos_new = QF * self.g_best[self.ID_POS] - (g2 * self.pop[idx][self.ID_POS] * np.random.rand()) - \
-                              g2 * self.get_simple_levy_step() + np.random.rand() * g1  # Eq. 14
+                    pos_new = QF * self.g_best[self.ID_POS] - (g2 * self.pop[idx][self.ID_POS] * self.generator.random()) - \
+                              g2 * self.get_simple_levy_step() + self.generator.random() * g1  # Eq. 14
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         pop_new = self.update_target_wrapper_population(pop_new)
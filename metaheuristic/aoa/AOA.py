@@ -4,7 +4,6 @@
 #       Github: https://github.com/thieu1995        %
 # --------------------------------------------------%
 
-import numpy as np
 from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
@@ -89,7 +88,7 @@ class OriginalAOA(Optimizer):
         for idx in range(0, self.pop_size):
             pos_new = deepcopy(self.pop[idx][self.ID_POS])
             for j in range(0, self.problem.n_dims):
-                r1, r2, r3 = np.random.rand(3)
+                r1, r2, r3 = self.generator.random(3)
                 if r1 > moa:  # Exploration phase
                     if r2 < 0.5:
                         pos_new[j] = self.g_best[self.ID_POS][j] / (mop + self.EPSILON) * \
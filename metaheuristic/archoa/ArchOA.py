@@ -103,9 +103,9 @@ class OriginalArchOA(Optimizer):
         position = self.generate_position(lb, ub)
         position = self.amend_position(position, lb, ub)
         target = self.get_target_wrapper(position)
-        den = np.random.uniform(lb, ub)
-        vol = np.random.uniform(lb, ub)
-        acc = lb + np.random.uniform(lb, ub) * (ub - lb)
+        den = self.generator.uniform(lb, ub)
+        vol = self.generator.uniform(lb, ub)
+        acc = lb + self.generator.uniform(lb, ub) * (ub - lb)
         return [position, target, den, vol, acc]
 
     def evolve(self, epoch):
@@ -124,13 +124,13 @@ class OriginalArchOA(Optimizer):
         ## Calculate new density, volume and acceleration
         for i in range(0, self.pop_size):
             # Update density and volume of each object using Eq. 7
-            new_den = self.pop[i][self.ID_DEN] + np.random.uniform() * (self.g_best[self.ID_DEN] - self.pop[i][self.ID_DEN])
-            new_vol = self.pop[i][self.ID_VOL] + np.random.uniform() * (self.g_best[self.ID_VOL] - self.pop[i][self.ID_VOL])
+            new_den = self.pop[i][self.ID_DEN] + self.generator.uniform() * (self.g_best[self.ID_DEN] - self.pop[i][self.ID_DEN])
+            new_vol = self.pop[i][self.ID_VOL] + self.generator.uniform() * (self.g_best[self.ID_VOL] - self.pop[i][self.ID_VOL])
 
             # Exploration phase
             if tf <= 0.5:
                 # Update acceleration using Eq. 10 and normalize acceleration using Eq. 12
-                id_rand = np.random.choice(list(set(range(0, self.pop_size)) - {i}))
+                id_rand = self.generator.choice(list(set(range(0, self.pop_size)) - {i}))
                 new_acc = (self.pop[id_rand][self.ID_DEN] + self.pop[id_rand][self.ID_VOL] * self.pop[id_rand][self.ID_ACC]) / (new_den * new_vol)
             else:
                 new_acc = (self.g_best[self.ID_DEN] + self.g_best[self.ID_VOL] * self.g_best[self.ID_ACC]) / (new_den * new_vol)
@@ -147,14 +147,14 @@ class OriginalArchOA(Optimizer):
         for idx in range(0, self.pop_size):
             solution = deepcopy(self.pop[idx])
             if tf <= 0.5:  # update position using Eq. 13
-                id_rand = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
-                pos_new = self.pop[idx][self.ID_POS] + self.c1 * np.random.uniform() * \
+                id_rand = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}))
+                pos_new = self.pop[idx][self.ID_POS] + self.c1 * self.generator.uniform() * \
                           self.pop[idx][self.ID_ACC] * ddf * (self.pop[id_rand][self.ID_POS] - self.pop[idx][self.ID_POS])
             else:
-                p = 2 * np.random.rand() - self.c4
+                p = 2 * self.generator.random() - self.c4
                 f = 1 if p <= 0.5 else -1
                 t = self.c3 * tf
-                pos_new = self.g_best[self.ID_POS] + f * self.c2 * np.random.rand() * self.pop[idx][self.ID_ACC] * \
+                pos_new = self.g_best[self.ID_POS] + f * self.c2 * self.generator.random() * self.pop[idx][self.ID_ACC] * \
                           ddf * (t * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
             solution[self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append(solution)
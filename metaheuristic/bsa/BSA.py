@@ -122,18 +122,18 @@ class BaseBSA(Optimizer):
             pop_new = []
             for i in range(0, self.pop_size):
                 agent = deepcopy(self.pop[i])
-                prob = np.random.uniform() * 0.2 + self.pff  # The probability of foraging for food
-                if np.random.uniform() < prob:  # Birds forage for food. Eq. 1
+                prob = self.generator.uniform() * 0.2 + self.pff  # The probability of foraging for food
+                if self.generator.uniform() < prob:  # Birds forage for food. Eq. 1
                     x_new = self.pop[i][self.ID_POS] + self.c_couples[0] * \
-                            np.random.uniform() * (self.pop[i][self.ID_LBP] - self.pop[i][self.ID_POS]) + \
-                            self.c_couples[1] * np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
+                            self.generator.uniform() * (self.pop[i][self.ID_LBP] - self.pop[i][self.ID_POS]) + \
+                            self.c_couples[1] * self.generator.uniform() * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
                 else:  # Birds keep vigilance. Eq. 2
                     A1 = self.a_couples[0] * np.exp(-self.pop_size * self.pop[i][self.ID_LBF][self.ID_FIT] / (self.EPSILON + fit_sum))
-                    k = np.random.choice(list(set(range(0, self.pop_size)) - {i}))
+                    k = self.generator.choice(list(set(range(0, self.pop_size)) - {i}))
                     t1 = (fit_list[i] - fit_list[k]) / (abs(fit_list[i] - fit_list[k]) + self.EPSILON)
                     A2 = self.a_couples[1] * np.exp(t1 * self.pop_size * fit_list[k] / (fit_sum + self.EPSILON))
-                    x_new = self.pop[i][self.ID_POS] + A1 * np.random.uniform(0, 1) * (pos_mean - self.pop[i][self.ID_POS]) + \
-                            A2 * np.random.uniform(-1, 1) * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
+                    x_new = self.pop[i][self.ID_POS] + A1 * self.generator.uniform(0, 1) * (pos_mean - self.pop[i][self.ID_POS]) + \
+                            A2 * self.generator.uniform(-1, 1) * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
                 agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                 pop_new.append(agent)
             pop_new = self.update_target_wrapper_population(pop_new)
@@ -157,37 +157,37 @@ class BaseBSA(Optimizer):
             if choose < 3:  # Producing (Equation 5)
                 for i in range(int(self.pop_size / 2 + 1), self.pop_size):
                     agent = deepcopy(self.pop[i])
-                    x_new = self.pop[i][self.ID_POS] + np.random.uniform(self.problem.lb, self.problem.ub) * self.pop[i][self.ID_POS]
+                    x_new = self.pop[i][self.ID_POS] + self.generator.uniform(self.problem.lb, self.problem.ub) * self.pop[i][self.ID_POS]
                     agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                     pop_new[i] = agent
                 if choose == 1:
-                    x_new = self.pop[min_idx][self.ID_POS] + np.random.uniform(self.problem.lb, self.problem.ub) * self.pop[min_idx][self.ID_POS]
+                    x_new = self.pop[min_idx][self.ID_POS] + self.generator.uniform(self.problem.lb, self.problem.ub) * self.pop[min_idx][self.ID_POS]
                     agent = deepcopy(self.pop[min_idx])
                     agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                     pop_new[min_idx] = agent
                 for i in range(0, int(self.pop_size / 2)):
                     if choose == 2 or min_idx != i:
                         agent = deepcopy(self.pop[i])
-                        FL = np.random.uniform() * 0.4 + self.fl
-                        idx = np.random.randint(0.5 * self.pop_size + 1, self.pop_size)
+                        FL = self.generator.uniform() * 0.4 + self.fl
+                        idx = self.generator.integers(0.5 * self.pop_size + 1, self.pop_size)
                         x_new = self.pop[i][self.ID_POS] + (self.pop[idx][self.ID_POS] - self.pop[i][self.ID_POS]) * FL
                         agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                         pop_new[i] = agent
             else:  # Scrounging (Equation 6)
                 for i in range(0, int(0.5 * self.pop_size)):
                     agent = deepcopy(self.pop[i])
-                    x_new = self.pop[i][self.ID_POS] + np.random.uniform(self.problem.lb, self.problem.ub) * self.pop[i][self.ID_POS]
+                    x_new = self.pop[i][self.ID_POS] + self.generator.uniform(self.problem.lb, self.problem.ub) * self.pop[i][self.ID_POS]
                     agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                     pop_new[i] = agent
                 if choose == 4:
                     agent = deepcopy(self.pop[min_idx])
-                    x_new = self.pop[min_idx][self.ID_POS] + np.random.uniform(self.problem.lb, self.problem.ub) * self.pop[min_idx][self.ID_POS]
+                    x_new = self.pop[min_idx][self.ID_POS] + self.generator.uniform(self.problem.lb, self.problem.ub) * self.pop[min_idx][self.ID_POS]
                     agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                 for i in range(int(self.pop_size / 2 + 1), self.pop_size):
                     if choose == 3 or min_idx != i:
                         agent = deepcopy(self.pop[i])
-                        FL = np.random.uniform() * 0.4 + self.fl
-                        idx = np.random.randint(0, 0.5 * self.pop_size)
+                        FL = self.generator.uniform() * 0.4 + self.fl
+                        idx = self.generator.integers(0, 0.5 * self.pop_size)
                         x_new = self.pop[i][self.ID_POS] + (self.pop[idx][self.ID_POS] - self.pop[i][self.ID_POS]) * FL
                         agent[self.ID_POS] = self.amend_position(x_new, self.problem.lb, self.problem.ub)
                         pop_new[i] = agent
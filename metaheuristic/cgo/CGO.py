@@ -4,7 +4,6 @@
 #       Github: https://github.com/thieu1995        %                         
 # --------------------------------------------------%
 
-import numpy as np
 from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
@@ -74,29 +73,29 @@ class OriginalCGO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
 
-            s1, s2, s3 = np.random.choice(range(0, self.pop_size), 3, replace=False)
+            s1, s2, s3 = self.generator.choice(range(0, self.pop_size), 3, replace=False)
             MG = (self.pop[s1][self.ID_POS] + self.pop[s2][self.ID_POS] + self.pop[s3][self.ID_POS]) / 3
 
             ## Calculating alpha based on Eq. 7
-            alpha1 = np.random.rand()
-            alpha2 = 2 * np.random.rand()
-            alpha3 = 1 + np.random.random() * np.random.rand()
-            esp = np.random.random()
+            alpha1 = self.generator.random()
+            alpha2 = 2 * self.generator.random()
+            alpha3 = 1 + self.generator.random() * self.generator.random()
+            esp = self.generator.random()
             # There is no usage of this variable in the paper
-            alpha4 = esp + esp * np.random.rand()
+            alpha4 = esp + esp * self.generator.random()
 
-            beta = np.random.randint(0, 2, 3)
-            gama = np.random.randint(0, 2, 3)
+            beta = self.generator.integers(0, 2, 3)
+            gama = self.generator.integers(0, 2, 3)
             ## The seed4 is mutation process, but not sure k is multiple variables or 1 variable.
             ## In the text said, multiple variables, but the defination of k is 1 variable. So confused
-            k = np.random.randint(0, self.problem.n_dims)
-            k_idx = np.random.choice(range(0, self.problem.n_dims), k, replace=False)
+            k = self.generator.integers(0, self.problem.n_dims)
+            k_idx = self.generator.choice(range(0, self.problem.n_dims), k, replace=False)
 
             seed1 = self.pop[idx][self.ID_POS] + alpha1 * (beta[0] * self.g_best[self.ID_POS] - gama[0] * MG)  # Eq. 3
             seed2 = self.g_best[self.ID_POS] + alpha2 * (beta[1] * self.pop[idx][self.ID_POS] - gama[1] * MG)  # Eq. 4
             seed3 = MG + alpha3 * (beta[2] * self.pop[idx][self.ID_POS] - gama[2] * self.g_best[self.ID_POS])  # Eq. 5
             seed4 = deepcopy(self.pop[idx][self.ID_POS]).astype(float)
-            seed4[k_idx] += np.random.uniform(0, 1, k)
+            seed4[k_idx] += self.generator.uniform(0, 1, k)
 
             # Check if solutions go outside the search space and bring them back
             seed1 = self.amend_position(seed1, self.problem.lb, self.problem.ub)
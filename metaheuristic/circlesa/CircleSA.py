@@ -64,9 +64,9 @@ class OriginalCircleSA(Optimizer):
         threshold = self.c_factor * self.epoch
         pop_new = []
         for idx in range(0, self.pop_size):
-            w = a * np.random.rand() - a
+            w = a * self.generator.random() - a
             if (epoch+1) > threshold:
-                x_new = self.g_best[self.ID_POS] + (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) * np.tan(w * np.random.rand())
+                x_new = self.g_best[self.ID_POS] + (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) * np.tan(w * self.generator.random())
             else:
                 x_new = self.g_best[self.ID_POS] - (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) * np.tan(w * p)
             x_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
@@ -6,6 +6,7 @@
 
 import numpy as np
 
+from metaheuristic.cro.reef import Reef
 from metaheuristic.optimizer.optimizer import Optimizer
 
 
@@ -92,64 +93,62 @@ class BaseCRO(Optimizer):
 
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = False
-        self.reef = np.array([])
-        self.occupied_position = []  # after a gen, you should update the occupied_position
         self.alpha = 10 * self.Pd / self.epoch
         self.gama = 10 * (self.G[1] - self.G[0]) / self.epoch
         self.num_occupied = int(self.pop_size / (1 + self.po))
         self.dyn_Pd = 0
-        self.occupied_list = np.zeros(self.pop_size)
-        self.occupied_idx_list = np.random.choice(list(range(self.pop_size)), self.num_occupied, replace=False)
-        self.occupied_list[self.occupied_idx_list] = 1
 
-    def _gaussian_mutation(self, position):
-        temp = position + self.G1 * (self.problem.ub - self.problem.lb) * np.random.normal(0, 1, self.problem.n_dims)
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.GCR, temp, position)
-        return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
+    def initialization(self):
+        super().initialization()
+        # The reef is a grid of pop_size cells, num_occupied of them hold a coral at the beginning
+        self.pop = self.create_reef(self.pop)
+
+    def create_reef(self, pop):
+        """
+        Args:
+            pop (list): the population, one agent per cell
+
+        Returns:
+            Reef: the reef of the population with num_occupied random occupied cells
+        """
+        occupied = np.zeros(len(pop), dtype=bool)
+        occupied[self.generator.choice(len(pop), self.num_occupied, replace=False)] = True
+        return Reef.from_list(pop, self.problem.minmax, occupied)
+
+    def _gaussian_mutation(self, pos_matrix):
+        temp = pos_matrix + self.G1 * (self.problem.ub - self.problem.lb) * self.generator.normal(0, 1, pos_matrix.shape)
+        pos_new = np.where(self.generator.uniform(0, 1, pos_matrix.shape) < self.GCR, temp, pos_matrix)
+        return np.array([self.amend_position(pos, self.problem.lb, self.problem.ub) for pos in pos_new]).reshape(pos_matrix.shape)
 
     ### Crossover
     def _multi_point_cross(self, pos1, pos2):
-        p1, p2 = np.random.choice(list(range(len(pos1))), 2, replace=False)
-        start = min(p1, p2)
-        end = max(p1, p2)
-        return np.concatenate((pos1[:start], pos2[start:end], pos1[end:]), axis=0)
+        # 2 distinct cut points of each pair, the segment [start, end) comes from pos2
+        p1 = self.generator.integers(0, self.problem.n_dims, len(pos1))
+        p2 = self.generator.integers(0, self.problem.n_dims - 1, len(pos1))
+        p2 += p2 >= p1
+        start, end = np.minimum(p1, p2)[:, None], np.maximum(p1, p2)[:, None]
+        dims = np.arange(0, self.problem.n_dims)
+        return np.where((dims >= start) & (dims < end), pos2, pos1)
 
     def _larvae_setting(self, larvae):
         # Trial to land on a square of reefs
-        for larva in larvae:
-            for i in range(self.n_trials):
-                p = np.random.randint(0, self.pop_size - 1)
-                if self.occupied_list[p] == 0:
-                    self.pop[p] = larva
-                    self.occupied_idx_list = np.append(self.occupied_idx_list, p)  # Update occupied id
-                    self.occupied_list[p] = 1  # Update occupied list
-                    break
-                else:
-                    if self.compare_agent(larva, self.pop[p]):
-                        self.pop[p] = larva
-                        break
+        return self.pop.settle(self.generator, larvae, self.n_trials)
 
     def _sort_occupied_reef(self):
-        def reef_fitness(idx):
-            return self.pop[idx][self.ID_TAR][self.ID_FIT]
-
-        idx_list_sorted = sorted(self.occupied_idx_list, key=reef_fitness)
-        return idx_list_sorted
+        return self.pop.get_occupied_index()
 
     def broadcast_spawning_brooding(self):
         # Step 1a
-        larvae = []
-        selected_corals = np.random.choice(self.occupied_idx_list, int(len(self.occupied_idx_list) * self.Fb), replace=False)
-        for i in self.occupied_idx_list:
-            if i not in selected_corals:
-                pos_new = self._gaussian_mutation(self.pop[i][self.ID_POS])
-                larvae.append([pos_new, None])
-        # Step 1b
-        while len(selected_corals) >= 2:
-            id1, id2 = np.random.choice(range(len(selected_corals)), 2, replace=False)
-            pos_new = self._multi_point_cross(self.pop[selected_corals[id1]][self.ID_POS], self.pop[selected_corals[id2]][self.ID_POS])
-            larvae.append([pos_new, None])
-            selected_corals = np.delete(selected_corals, [id1, id2])
+        list_occupied = np.flatnonzero(self.pop.occupied)
+        list_selected = self.generator.permutation(list_occupied)[:int(len(list_occupied) * self.Fb)]
+        mask_brooding = self.pop.occupied.copy()
+        mask_brooding[list_selected] = False
+        pos_brooding = self._gaussian_mutation(self.pop.positions[mask_brooding])
+        # Step 1b: random pairs of the selected corals, the last one is left out when their number is odd
+        n_pairs = len(list_selected) // 2
+        pos_spawning = self._multi_point_cross(self.pop.positions[list_selected[:n_pairs]],
+                                               self.pop.positions[list_selected[n_pairs:2 * n_pairs]])
+        larvae = self.pop.get_larvae(np.concatenate([pos_brooding, pos_spawning]))
         return self.update_target_wrapper_population(larvae)
 
     def evolve(self, epoch):
@@ -165,20 +164,18 @@ class BaseCRO(Optimizer):
         self._larvae_setting(larvae)
         nfe_epoch += len(larvae)
 
-        ## Asexual Reproduction
-        num_duplicate = int(len(self.occupied_idx_list) * self.Fa)
-        pop_best = [self.pop[idx] for idx in self.occupied_idx_list]
-        pop_best = self.get_sorted_strim_population(pop_best, num_duplicate)
-        self._larvae_setting(pop_best)
+        ## Asexual Reproduction: the best corals are duplicated, their fitness is already known
+        list_occupied = self._sort_occupied_reef()
+        num_duplicate = int(len(list_occupied) * self.Fa)
+        if num_duplicate > 0:
+            self._larvae_setting(self.pop.get_corals(list_occupied[:num_duplicate]))
 
         ## Depredation
-        if np.random.random() < self.dyn_Pd:
-            num__depredation__ = int(len(self.occupied_idx_list) * self.Fd)
-            idx_list_sorted = self._sort_occupied_reef()
-            selected_depredator = idx_list_sorted[-num__depredation__:]
-            self.occupied_idx_list = np.setdiff1d(self.occupied_idx_list, selected_depredator)
-            for idx in selected_depredator:
-                self.occupied_list[idx] = 0
+        if self.generator.random() < self.dyn_Pd:
+            list_occupied = self._sort_occupied_reef()
+            num__depredation__ = int(len(list_occupied) * self.Fd)
+            if num__depredation__ > 0:
+                self.pop.occupied[list_occupied[len(list_occupied) - num__depredation__:]] = False
 
         if self.dyn_Pd <= self.Pd:
             self.dyn_Pd += self.alpha
@@ -266,19 +263,17 @@ class OCRO(BaseCRO):
         self.reset_count = 0
 
     def _local_search(self, pop=None):
-        pop_new = []
-        for idx in range(0, len(pop)):
-            temp = np.random.uniform(self.problem.lb, self.problem.ub)
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < 0.5, self.g_best[self.ID_POS], temp)
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop_new.append([pos_new, None])
-        return self.update_target_wrapper_population(pop_new)
+        n_rows = len(pop)
+        temp = self.generator.uniform(self.problem.lb, self.problem.ub, (n_rows, self.problem.n_dims))
+        pos_new = np.where(self.generator.uniform(0, 1, (n_rows, self.problem.n_dims)) < 0.5, self.g_best[self.ID_POS], temp)
+        pos_new = np.array([self.amend_position(pos, self.problem.lb, self.problem.ub) for pos in pos_new])
+        return self.update_target_wrapper_population(self.pop.get_larvae(pos_new.reshape(-1, self.problem.n_dims)))
 
     def _opposition_based_position(self, reef, g_best):
-        pos_new = self.problem.ub + self.problem.lb - g_best[self.ID_POS] + np.random.uniform() * (g_best[self.ID_POS] - reef[self.ID_POS])
-        pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-        target = self.get_target_wrapper(pos_new)
-        return [pos_new, target]
+        pos_new = self.problem.ub + self.problem.lb - g_best[self.ID_POS] + \
+                  self.generator.uniform(size=(len(reef), 1)) * (g_best[self.ID_POS] - reef.positions)
+        pos_new = np.array([self.amend_position(pos, self.problem.lb, self.problem.ub) for pos in pos_new])
+        return self.update_target_wrapper_population(self.pop.get_larvae(pos_new.reshape(-1, self.problem.n_dims)))
 
     def evolve(self, epoch):
         """
@@ -293,25 +288,33 @@ class OCRO(BaseCRO):
         self._larvae_setting(larvae)
         nfe_epoch += len(larvae)
 
-        ## Asexual Reproduction
-        num_duplicate = int(len(self.occupied_idx_list) * self.Fa)
-        pop_best = [self.pop[idx] for idx in self.occupied_idx_list]
-        pop_best = self.get_sorted_strim_population(pop_best, num_duplicate)
-        pop_local_search = self._local_search(pop_best)
-        self._larvae_setting(pop_local_search)
-
-        ## Depredation
-        if np.random.random() < self.dyn_Pd:
-            num__depredation__ = int(len(self.occupied_idx_list) * self.Fd)
-            idx_list_sorted = self._sort_occupied_reef()
-            selected_depredator = idx_list_sorted[-num__depredation__:]
-            for idx in selected_depredator:
-                opposite_reef = self._opposition_based_position(self.pop[idx], self.g_best)
-                if self.compare_agent(opposite_reef, self.pop[idx]):
-                    self.pop[idx] = opposite_reef
-                else:
-                    self.occupied_idx_list = self.occupied_idx_list[~np.isin(self.occupied_idx_list, [idx])]
-                    self.occupied_list[idx] = 0
+        ## Asexual Reproduction: local search around the global best solution instead of the duplicates of the best corals
+        list_occupied = self._sort_occupied_reef()
+        num_duplicate = int(len(list_occupied) * self.Fa)
+        if num_duplicate > 0:
+            pop_local_search = self._local_search(self.pop.get_corals(list_occupied[:num_duplicate]))
+            self._larvae_setting(pop_local_search)
+            nfe_epoch += len(pop_local_search)
+
+        ## Depredation: a worst coral is replaced by its opposite position when it is better, otherwise it is removed
+        if self.generator.random() < self.dyn_Pd:
+            list_occupied = self._sort_occupied_reef()
+            num__depredation__ = int(len(list_occupied) * self.Fd)
+        else:
+            num__depredation__ = 0
+        if num__depredation__ > 0:
+            selected_depredator = list_occupied[len(list_occupied) - num__depredation__:]
+            opposite_reef = self._opposition_based_position(self.pop.get_corals(selected_depredator), self.g_best)
+            nfe_epoch += len(opposite_reef)
+            if self.problem.minmax == "min":
+                mask = opposite_reef.fitness < self.pop.fitness[selected_depredator]
+            else:
+                mask = opposite_reef.fitness >= self.pop.fitness[selected_depredator]
+            list_idx = selected_depredator[mask]
+            self.pop.positions[list_idx] = opposite_reef.positions[mask]
+            self.pop.fitness[list_idx] = opposite_reef.fitness[mask]
+            self.pop.objectives[list_idx] = opposite_reef.objectives[mask]
+            self.pop.occupied[selected_depredator[~mask]] = False
 
         if self.dyn_Pd <= self.Pd:
             self.dyn_Pd += self.alpha
@@ -319,15 +322,12 @@ class OCRO(BaseCRO):
             self.G1 -= self.gama
 
         self.reset_count += 1
-        _, local_best = self.get_global_best_solution(self.pop)
+        local_best = self.pop[self.pop.get_best_index()]
         if self.compare_agent(local_best, self.g_best):
             self.reset_count = 0
 
         if self.reset_count == self.restart_count:
             nfe_epoch += self.pop_size
-            self.pop = self.create_population(self.pop_size)
-            self.occupied_list = np.zeros(self.pop_size)
-            self.occupied_idx_list = np.random.choice(range(self.pop_size), self.num_occupied, replace=False)
-            self.occupied_list[self.occupied_idx_list] = 1
+            self.pop = self.create_reef(self.create_population(self.pop_size))
             self.reset_count = 0
         self.nfe_per_epoch = nfe_epoch
@@ -0,0 +1,120 @@
+import numpy as np
+
+from metaheuristic.optimizer.population import Population
+
+
+class Reef(Population):
+    """
+    Reef of the CRO algorithms: a fixed grid of pop_size cells stored as the Population arrays plus an occupancy mask
+
+    Notes
+    ~~~~~
+    + occupied: 1-D boolean numpy array with shape (pop_size,), True where a coral lives in the cell
+    + A free cell keeps the last coral that lived in it, the cells are compared by the Optimizer as a whole population
+    + The occupancy mask follows its cell when the reef is sorted (update_global_best_solution() sorts a Population in
+      place), the cells are chosen uniformly at random so their order doesn't matter
+    """
+
+    def __init__(self, positions, fitness, objectives=None, minmax="min", occupied=None):
+        """
+        Args:
+            positions (np.ndarray): 2-D array with shape (pop_size, n_dims)
+            fitness (np.ndarray): 1-D array with shape (pop_size,)
+            objectives (np.ndarray): 2-D array with shape (pop_size, n_objs), default = fitness as a single objective
+            minmax (str): "min" or "max" problem
+            occupied (np.ndarray): 1-D boolean array with shape (pop_size,), default = every cell is occupied
+        """
+        super().__init__(positions, fitness, objectives, minmax)
+        self.occupied = np.ones(len(self.fitness), dtype=bool) if occupied is None else np.array(occupied, dtype=bool)
+
+    @classmethod
+    def from_list(cls, pop, minmax="min", occupied=None):
+        """
+        Args:
+            pop (list): population in the format [[position, [fitness, [obj1, obj2, ...]]], ...]
+            minmax (str): "min" or "max" problem
+            occupied (np.ndarray): occupancy mask of the cells, default = every cell is occupied
+
+        Returns:
+            Reef: the reef of the population
+        """
+        reef = super().from_list(pop, minmax)
+        if occupied is not None:
+            reef.occupied = np.array(occupied, dtype=bool)
+        return reef
+
+    def copy(self):
+        return Reef(self.positions.copy(), self.fitness.copy(), self.objectives.copy(), self.minmax, self.occupied.copy())
+
+    def sort(self):
+        sorted_idx = self.get_sorted_index()
+        self.positions = self.positions[sorted_idx]
+        self.fitness = self.fitness[sorted_idx]
+        self.objectives = self.objectives[sorted_idx]
+        self.occupied = self.occupied[sorted_idx]
+        return self
+
+    def get_occupied_index(self):
+        """
+        Returns:
+            np.ndarray: indexes of the occupied cells, from the best coral to the worst one
+        """
+        sorted_idx = self.get_sorted_index()
+        return sorted_idx[self.occupied[sorted_idx]]
+
+    def get_corals(self, list_idx):
+        """
+        Args:
+            list_idx (np.ndarray): indexes of the cells
+
+        Returns:
+            Population: copy of the corals of the cells
+        """
+        return Population(self.positions[list_idx], self.fitness[list_idx], self.objectives[list_idx], self.minmax)
+
+    def get_larvae(self, positions):
+        """
+        Args:
+            positions (np.ndarray): 2-D array with shape (n_larvae, n_dims), the positions of the new larvae
+
+        Returns:
+            Population: the larvae, to evaluate with update_target_wrapper_population()
+        """
+        n_rows = len(positions)
+        return Population(positions, np.zeros(n_rows), np.zeros((n_rows, self.objectives.shape[1])), self.minmax)
+
+    def settle(self, generator, larvae, n_trials):
+        """
+        Settlement of the larvae, all the larvae try a random cell at each trial: a larva takes a free cell, or an
+        occupied cell when it is strictly better than the coral. When several larvae try the same cell, the best one
+        tries first and the others fail this trial. A larva stops trying once it is settled
+
+        Args:
+            generator (np.random.Generator): the generator of the optimizer
+            larvae (Population): the evaluated larvae
+            n_trials (int): number of attempts of each larva
+
+        Returns:
+            int: number of settled larvae
+        """
+        waiting = larvae.get_sorted_index()
+        for _ in range(0, n_trials):
+            if len(waiting) == 0:
+                break
+            cells = generator.integers(0, len(self.fitness), len(waiting))
+            # np.unique() gives the first larva of each cell: the best one because the waiting larvae are sorted
+            cells, first = np.unique(cells, return_index=True)
+            if self.minmax == "min":
+                better = larvae.fitness[waiting[first]] < self.fitness[cells]
+            else:
+                better = larvae.fitness[waiting[first]] > self.fitness[cells]
+            win = better | ~self.occupied[cells]
+            cells, list_idx = cells[win], waiting[first[win]]
+            self.positions[cells] = larvae.positions[list_idx]
+            self.fitness[cells] = larvae.fitness[list_idx]
+            self.objectives[cells] = larvae.objectives[list_idx]
+            self.occupied[cells] = True
+            settled = np.zeros(len(waiting), dtype=bool)
+            settled[first[win]] = True
+            waiting = waiting[~settled]
+        return len(larvae) - len(waiting)
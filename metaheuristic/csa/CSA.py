@@ -72,10 +72,11 @@ class BaseCSA(Optimizer):
             epoch (int): The current iteration
         """
         pop_new = deepcopy(self.pop)
+        list_levy_step = self.get_levy_flight_step(multiplier=0.001, case=-1, size=self.pop_size)
         for i in range(0, self.pop_size):
             ## Generate levy-flight solution
-            levy_step = self.get_levy_flight_step(multiplier=0.001, case=-1)
-            pos_new = self.pop[i][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * \
+            levy_step = list_levy_step[i]
+            pos_new = self.pop[i][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(self.generator.random() - 0.5) * \
                       levy_step * (self.pop[i][self.ID_POS] - self.g_best[self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             target = self.get_target_wrapper(pos_new)
@@ -86,7 +87,7 @@ class BaseCSA(Optimizer):
         pop = self.get_sorted_strim_population(pop_new, self.pop_size)
         pop_new = []
         for i in range(0, self.n_cut):
-            pos_new = np.random.uniform(self.problem.lb, self.problem.ub)
+            pos_new = self.generator.uniform(self.problem.lb, self.problem.ub)
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         pop_new = self.update_target_wrapper_population(pop_new)
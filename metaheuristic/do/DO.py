@@ -5,10 +5,10 @@
 # --------------------------------------------------%
 
 import numpy as np
-import math
 from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
+from metaheuristic.optimizer.levy import get_mantegna_sigma
 
 
 class BaseDO(Optimizer):
@@ -63,9 +63,8 @@ class BaseDO(Optimizer):
     def dragonfly_levy(self):
         beta = 3 / 2
         # Eq.(3.10)
-        sigma = (math.gamma(1 + beta) * np.sin(np.pi * beta / 2) / (math.gamma((1 + beta) / 2) * beta * 2 ** ((beta - 1) / 2))) ** (1 / beta)
-        u = np.random.randn(self.problem.n_dims) * sigma
-        v = np.random.randn(self.problem.n_dims)
+        u = self.generator.standard_normal(self.problem.n_dims) * get_mantegna_sigma(beta)
+        v = self.generator.standard_normal(self.problem.n_dims)
         step = u / np.abs(v) ** (1 / beta)
         # Eq.(3.9)
         return 0.01 * step
@@ -95,10 +94,10 @@ class BaseDO(Optimizer):
         my_c = 0.1 - (epoch + 1) * ((0.1 - 0) / (self.epoch / 2))
         my_c = 0 if my_c < 0 else my_c
 
-        s = 2 * np.random.rand() * my_c  # Seperation weight
-        a = 2 * np.random.rand() * my_c  # Alignment weight
-        c = 2 * np.random.rand() * my_c  # Cohesion weight
-        f = 2 * np.random.rand()  # Food attraction weight
+        s = 2 * self.generator.random() * my_c  # Seperation weight
+        a = 2 * self.generator.random() * my_c  # Alignment weight
+        c = 2 * self.generator.random() * my_c  # Cohesion weight
+        f = 2 * self.generator.random()  # Food attraction weight
         e = my_c  # Enemy distraction weight
 
         for i in range(0, self.pop_size):
@@ -145,8 +144,8 @@ class BaseDO(Optimizer):
             pos_delta_new = deepcopy(self.pop_delta[i][self.ID_POS]).astype(float)
             if np.any(dist_to_food > r):
                 if neighbours_num > 1:
-                    temp = w * self.pop_delta[i][self.ID_POS] + np.random.uniform(0, 1, self.problem.n_dims) * A + \
-                           np.random.uniform(0, 1, self.problem.n_dims) * C + np.random.uniform(0, 1, self.problem.n_dims) * S
+                    temp = w * self.pop_delta[i][self.ID_POS] + self.generator.uniform(0, 1, self.problem.n_dims) * A + \
+                           self.generator.uniform(0, 1, self.problem.n_dims) * C + self.generator.uniform(0, 1, self.problem.n_dims) * S
                     temp = np.clip(temp, -1 * self.delta_max, self.delta_max)
                     pos_delta_new = deepcopy(temp)
                     pos_new += temp
@@ -80,25 +80,25 @@ class BaseEFO(Optimizer):
         """
         pop_new = []
         for idx in range(0, self.pop_size):
-            r_idx1 = np.random.randint(0, int(self.pop_size * self.p_field))  # top
-            r_idx2 = np.random.randint(int(self.pop_size * (1 - self.n_field)), self.pop_size)  # bottom
-            r_idx3 = np.random.randint(int((self.pop_size * self.p_field) + 1), int(self.pop_size * (1 - self.n_field)))  # middle
-            if np.random.uniform() < self.ps_rate:
+            r_idx1 = self.generator.integers(0, int(self.pop_size * self.p_field))  # top
+            r_idx2 = self.generator.integers(int(self.pop_size * (1 - self.n_field)), self.pop_size)  # bottom
+            r_idx3 = self.generator.integers(int((self.pop_size * self.p_field) + 1), int(self.pop_size * (1 - self.n_field)))  # middle
+            if self.generator.uniform() < self.ps_rate:
                 # new = g_best + phi* r1 * (top - middle) + r2 (top - bottom)
                 # pos_new = g_best[self.ID_POS] + \
                 #            phi * np.random.uniform() * (pop[r_idx1][self.ID_POS] - pop[r_idx3][self.ID_POS]) + \
                 #            np.random.uniform() * (pop[r_idx1][self.ID_POS] - pop[r_idx2][self.ID_POS])
                 # new = top + phi * r1 * (g_best - bottom) + r2 * (g_best - middle)
-                pos_new = self.pop[r_idx1][self.ID_POS] + self.phi * np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[r_idx3][self.ID_POS]) \
-                          + np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[r_idx2][self.ID_POS])
+                pos_new = self.pop[r_idx1][self.ID_POS] + self.phi * self.generator.uniform() * (self.g_best[self.ID_POS] - self.pop[r_idx3][self.ID_POS]) \
+                          + self.generator.uniform() * (self.g_best[self.ID_POS] - self.pop[r_idx2][self.ID_POS])
             else:
                 pos_new = self.generate_position(self.problem.lb, self.problem.ub)
 
             # replacement of one electromagnet of generated particle with a random number
             # (only for some generated particles) to bring diversity to the population
-            if np.random.uniform() < self.r_rate:
-                RI = np.random.randint(0, self.problem.n_dims)
-                pos_new[np.random.randint(0, self.problem.n_dims)] = np.random.uniform(self.problem.lb[RI], self.problem.ub[RI])
+            if self.generator.uniform() < self.r_rate:
+                RI = self.generator.integers(0, self.problem.n_dims)
+                pos_new[self.generator.integers(0, self.problem.n_dims)] = self.generator.uniform(self.problem.lb[RI], self.problem.ub[RI])
 
             # checking whether the generated number is inside boundary or not
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
@@ -180,7 +180,7 @@ class OriginalEFO(BaseEFO):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def initialization(self):
         pop = self.create_population(self.pop_size)
@@ -188,19 +188,19 @@ class OriginalEFO(BaseEFO):
 
         # %random vectors (this is to increase the calculation speed instead of determining the random values in each
         # iteration we allocate them in the beginning before algorithm start
-        self.r_index1 = np.random.randint(0, int(self.pop_size * self.p_field), (self.problem.n_dims, self.epoch))
+        self.r_index1 = self.generator.integers(0, int(self.pop_size * self.p_field), (self.problem.n_dims, self.epoch))
         # random particles from positive field
-        self.r_index2 = np.random.randint(int(self.pop_size * (1 - self.n_field)), self.pop_size, (self.problem.n_dims, self.epoch))
+        self.r_index2 = self.generator.integers(int(self.pop_size * (1 - self.n_field)), self.pop_size, (self.problem.n_dims, self.epoch))
         # random particles from negative field
-        self.r_index3 = np.random.randint(int((self.pop_size * self.p_field) + 1), int(self.pop_size * (1 - self.n_field)), (self.problem.n_dims, self.epoch))
+        self.r_index3 = self.generator.integers(int((self.pop_size * self.p_field) + 1), int(self.pop_size * (1 - self.n_field)), (self.problem.n_dims, self.epoch))
         # random particles from neutral field
-        self.ps = np.random.uniform(0, 1, (self.problem.n_dims, self.epoch))
+        self.ps = self.generator.uniform(0, 1, (self.problem.n_dims, self.epoch))
         # Probability of selecting electromagnets of generated particle from the positive field
-        self.r_force = np.random.uniform(0, 1, self.epoch)
+        self.r_force = self.generator.uniform(0, 1, self.epoch)
         # random force in each generation
-        self.rp = np.random.uniform(0, 1, self.epoch)
+        self.rp = self.generator.uniform(0, 1, self.epoch)
         # Some random numbers for checking randomness probability in each generation
-        self.randomization = np.random.uniform(0, 1, self.epoch)
+        self.randomization = self.generator.uniform(0, 1, self.epoch)
         # Coefficient of randomization when generated electro magnet is out of boundary
         self.RI = 0
         # index of the electromagnet (variable) which is going to be initialized by random number
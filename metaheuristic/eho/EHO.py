@@ -101,7 +101,7 @@ class BaseEHO(Optimizer):
                 center = np.mean(np.array([item[self.ID_POS] for item in self.pop_group[clan_idx]]), axis=0)
                 pos_new = self.beta * center
             else:
-                pos_new = self.pop_group[clan_idx][pos_clan_idx][self.ID_POS] + self.alpha * np.random.uniform() * \
+                pos_new = self.pop_group[clan_idx][pos_clan_idx][self.ID_POS] + self.alpha * self.generator.uniform() * \
                           (self.pop_group[clan_idx][0][self.ID_POS] - self.pop_group[clan_idx][pos_clan_idx][self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
@@ -110,14 +110,14 @@ class BaseEOA(Optimizer):
             ### Reproduction 2: the second way of reproducing
             if idx >= self.n_best:  ### Select two parents to mate and create two children
                 idx = int(self.pop_size * 0.2)
-                if np.random.uniform() < 0.5:  ## 80% parents selected from best population
-                    idx1, idx2 = np.random.choice(range(0, idx), 2, replace=False)
+                if self.generator.uniform() < 0.5:  ## 80% parents selected from best population
+                    idx1, idx2 = self.generator.choice(range(0, idx), 2, replace=False)
                 else:  ## 20% left parents selected from worst population (make more diversity)
-                    idx1, idx2 = np.random.choice(range(idx, self.pop_size), 2, replace=False)
-                r = np.random.uniform()
+                    idx1, idx2 = self.generator.choice(range(idx, self.pop_size), 2, replace=False)
+                r = self.generator.uniform()
                 x_child = r * self.pop[idx2][self.ID_POS] + (1 - r) * self.pop[idx1][self.ID_POS]
             else:
-                r1 = np.random.randint(0, self.pop_size)
+                r1 = self.generator.integers(0, self.pop_size)
                 x_child = self.pop[r1][self.ID_POS]
             x_t1 = self.dyn_beta * x_t1 + (1.0 - self.dyn_beta) * x_child
             pos_new = self.amend_position(x_t1, self.problem.lb, self.problem.ub)
@@ -132,7 +132,7 @@ class BaseEOA(Optimizer):
         ## Cauchy mutation (CM)
         cauchy_w = deepcopy(self.g_best[self.ID_POS])
         for i in range(self.n_best, self.pop_size):  # Don't allow the elites to be mutated
-            cauchy_w = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.p_m, x_mean, cauchy_w)
+            cauchy_w = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < self.p_m, x_mean, cauchy_w)
             x_t1 = (cauchy_w + self.g_best[self.ID_POS]) / 2
             pos_new = self.amend_position(x_t1, self.problem.lb, self.problem.ub)
             pop[i][self.ID_POS] = pos_new
@@ -5,7 +5,6 @@
 # --------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
 
@@ -80,6 +79,44 @@ class BaseFA(Optimizer):
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = False
 
+    def get_sparks(self, fit_list):
+        """
+        Number of explosion sparks and explosion amplitude of every firework
+
+        Args:
+            fit_list (np.ndarray): fitness of the fireworks
+
+        Returns:
+            tuple: (number of sparks, amplitude) of each firework
+        """
+        fit_min, fit_max, fit_sum = np.min(fit_list), np.max(fit_list), np.sum(fit_list)
+        list_si = self.max_sparks * (fit_max - fit_list + self.EPSILON) / (len(fit_list) * fit_max - fit_sum + self.EPSILON)
+        list_ai = self.max_ea * (fit_list - fit_min + self.EPSILON) / (fit_sum - fit_min + self.EPSILON)
+        list_count = np.where(list_si < self.p_a * self.max_sparks, round(self.p_a * self.max_sparks) + 1,
+                              np.where(list_si > self.p_b * self.max_sparks, round(self.p_b * self.max_sparks) + 1, np.round(list_si) + 1))
+        return list_count.astype(int), list_ai
+
+    def create_sparks(self, pos_matrix, list_owner, list_step):
+        """
+        Move a random subset of the dimensions of each spark from its firework, all the sparks at once
+
+        Args:
+            pos_matrix (np.ndarray): (pop_size, n_dims) positions of the fireworks
+            list_owner (np.ndarray): index of the firework of each spark (ragged offsets: the sparks of a firework follow each other)
+            list_step (np.ndarray): displacement of each spark, added to all its moved dimensions
+
+        Returns:
+            np.ndarray: (n_sparks, n_dims) positions of the sparks, mapped back into the bounds
+        """
+        n_sparks, n_dims = len(list_owner), self.problem.n_dims
+        # round(uniform * n_dims) dimensions of each spark: the dimensions with the smallest random keys
+        list_size = np.round(self.generator.uniform(size=n_sparks) * n_dims)
+        list_rank = np.argsort(np.argsort(self.generator.uniform(size=(n_sparks, n_dims)), axis=1), axis=1)
+        pos_new = pos_matrix[list_owner] + np.where(list_rank < list_size[:, None], list_step[:, None], 0)
+        pos_new = np.where(np.logical_or(pos_new < self.problem.lb, pos_new > self.problem.ub),
+                           self.problem.lb + np.abs(pos_new) % (self.problem.ub - self.problem.lb), pos_new)
+        return np.array([self.amend_position(pos, self.problem.lb, self.problem.ub) for pos in pos_new])
+
     def evolve(self, epoch):
         """
         The main operations (equations) of algorithm. Inherit from Optimizer class
@@ -87,48 +124,22 @@ class BaseFA(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        nfe_epoch = 0
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
         fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
-        fit_list = sorted(fit_list)
-
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            si = self.max_sparks * (fit_list[-1] - self.pop[idx][self.ID_TAR][self.ID_FIT] + self.EPSILON) / \
-                 (self.pop_size * fit_list[-1] - np.sum(fit_list) + self.EPSILON)
-            Ai = self.max_ea * (self.pop[idx][self.ID_TAR][self.ID_FIT] - fit_list[0] + self.EPSILON) / \
-                 (np.sum(fit_list) - fit_list[0] + self.EPSILON)
-            if si < self.p_a * self.max_sparks:
-                si_ = int(round(self.p_a * self.max_sparks) + 1)
-            elif si > self.p_b * self.m_sparks:
-                si_ = int(round(self.p_b * self.max_sparks) + 1)
-            else:
-                si_ = int(round(si) + 1)
-
-            ## Algorithm 1
-            pop_new = []
-            for j in range(0, si_):
-                pos_new = deepcopy(self.pop[idx][self.ID_POS])
-                list_idx = np.random.choice(range(0, self.problem.n_dims), round(np.random.uniform() * self.problem.n_dims), replace=False)
-                displacement = Ai * np.random.uniform(-1, 1)
-                pos_new[list_idx] = pos_new[list_idx] + displacement
-                pos_new = np.where(np.logical_or(pos_new < self.problem.lb, pos_new > self.problem.ub),
-                                   self.problem.lb + np.abs(pos_new) % (self.problem.ub - self.problem.lb), pos_new)
-                pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-                pop_new.append([pos_new, None])
-                nfe_epoch += 1
-            pop_new = self.update_target_wrapper_population(pop_new)
-
-        for _ in range(0, self.m_sparks):
-            idx = np.random.randint(0, self.pop_size)
-            pos_new = deepcopy(self.pop[idx][self.ID_POS])
-            list_idx = np.random.choice(range(0, self.problem.n_dims), round(np.random.uniform() * self.problem.n_dims), replace=False)
-            pos_new[list_idx] = pos_new[list_idx] + np.random.normal(0, 1)  # Gaussian
-            pos_new = np.where(np.logical_or(pos_new < self.problem.lb, pos_new > self.problem.ub), self.problem.lb + \
-                               np.abs(pos_new) % (self.problem.ub - self.problem.lb), pos_new)
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop_new.append([pos_new, None])
-            nfe_epoch += 1
+        list_count, list_ai = self.get_sparks(fit_list)
+
+        ## Algorithm 1: the explosion sparks of all the fireworks, then the Gaussian sparks
+        list_owner = np.concatenate([np.repeat(np.arange(0, len(self.pop)), list_count),
+                                     self.generator.integers(0, len(self.pop), self.m_sparks)])
+        list_step = np.concatenate([np.repeat(list_ai, list_count) * self.generator.uniform(-1, 1, np.sum(list_count)),
+                                    self.generator.normal(0, 1, self.m_sparks)])  # Gaussian
+        pop_new = [[pos_new, None] for pos_new in self.create_sparks(pos_matrix, list_owner, list_step)]
         pop_new = self.update_target_wrapper_population(pop_new)
+        self.nfe_per_epoch = len(pop_new)
 
-        ## Update the global best
-        self.pop = self.get_sorted_strim_population(pop_new + self.pop, self.pop_size)
+        ## Keep the pop_size best solutions among the fireworks and the sparks
+        pop_all = pop_new + self.pop
+        fit_all = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop_all])
+        if self.problem.minmax != "min":
+            fit_all = -fit_all
+        self.pop = [pop_all[idx] for idx in np.argpartition(fit_all, self.pop_size - 1)[:self.pop_size]]
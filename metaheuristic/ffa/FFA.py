@@ -106,9 +106,9 @@ class BaseFFA(Optimizer):
                     rij = np.linalg.norm(agent[self.ID_POS] - self.pop[j][self.ID_POS]) / dmax
                     beta = self.beta_base * np.exp(-self.gamma * rij ** self.exponent)
                     # Mutation Vector
-                    mutation_vector = self.delta * np.random.uniform(0, 1, self.problem.n_dims)
+                    mutation_vector = self.delta * self.generator.uniform(0, 1, self.problem.n_dims)
                     temp = np.matmul((self.pop[j][self.ID_POS] - agent[self.ID_POS]),
-                                     np.random.uniform(0, 1, (self.problem.n_dims, self.problem.n_dims)))
+                                     self.generator.uniform(0, 1, (self.problem.n_dims, self.problem.n_dims)))
                     pos_new = agent[self.ID_POS] + self.dyn_alpha * mutation_vector + beta * temp
                     pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                     pop_child.append([pos_new, None])
@@ -119,5 +119,5 @@ class BaseFFA(Optimizer):
             # Compare to Previous Solution
             if self.compare_agent(local_best, agent):
                 self.pop[idx] = local_best
-        self.pop.append(self.g_best)
+        self.pop.append(deepcopy(self.g_best))
         self.dyn_alpha = self.alpha_damp * self.alpha
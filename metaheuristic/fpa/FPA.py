@@ -76,7 +76,7 @@ class BaseFPA(Optimizer):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def evolve(self, epoch):
         """
@@ -86,14 +86,15 @@ class BaseFPA(Optimizer):
             epoch (int): The current iteration
         """
         pop = []
+        list_levy = self.get_levy_flight_step(multiplier=self.levy_multiplier, case=-1, size=self.pop_size)
         for idx in range(0, self.pop_size):
-            if np.random.uniform() < self.p_s:
-                levy = self.get_levy_flight_step(multiplier=self.levy_multiplier, case=-1)
-                pos_new = self.pop[idx][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * \
+            if self.generator.uniform() < self.p_s:
+                levy = list_levy[idx]
+                pos_new = self.pop[idx][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(self.generator.random() - 0.5) * \
                           levy * (self.pop[idx][self.ID_POS] - self.g_best[self.ID_POS])
             else:
-                id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + np.random.uniform() * (self.pop[id1][self.ID_POS] - self.pop[id2][self.ID_POS])
+                id1, id2 = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+                pos_new = self.pop[idx][self.ID_POS] + self.generator.uniform() * (self.pop[id1][self.ID_POS] - self.pop[id2][self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop.append([pos_new, None])
         self.pop = self.update_target_wrapper_population(pop)
@@ -125,14 +125,27 @@ class BaseGA(Optimizer):
         Returns:
             list: The position of dad and mom
         """
+        id_c1, id_c2 = self.selection_process_batch(list_fitness, 1)[0]
+        return self.pop[id_c1][self.ID_POS], self.pop[id_c2][self.ID_POS]
+
+    def selection_process_batch(self, list_fitness, n_pairs):
+        """
+        Select the parents of all the pairs at once, same strategies as selection_process()
+
+        Args:
+            list_fitness (np.array): list of fitness values.
+            n_pairs (int): number of pairs of parents
+
+        Returns:
+            np.ndarray: The indexes of dad and mom, shape (n_pairs, 2)
+        """
         if self.selection == "roulette":
-            id_c1 = self.get_index_roulette_wheel_selection(list_fitness)
-            id_c2 = self.get_index_roulette_wheel_selection(list_fitness)
+            return self.get_index_roulette_wheel_selection_batch(list_fitness, 2 * n_pairs).reshape(n_pairs, 2)
         elif self.selection == "random":
-            id_c1, id_c2 = np.random.choice(range(self.pop_size), 2, replace=False)
+            # The 2 smallest random keys of each row give 2 distinct parents
+            return np.argpartition(self.generator.random((n_pairs, self.pop_size)), 1, axis=1)[:, :2]
         else:   ## tournament
-            id_c1, id_c2 = self.get_index_kway_tournament_selection(self.pop, k_way=self.k_way, output=2)
-        return self.pop[id_c1][self.ID_POS], self.pop[id_c2][self.ID_POS]
+            return self.get_index_kway_tournament_selection_batch(list_fitness, k_way=self.k_way, output=2, size=n_pairs)
 
     def crossover_process(self, dad, mom):
         """
@@ -152,16 +165,16 @@ class BaseGA(Optimizer):
         if self.crossover == "arithmetic":
             w1, w2 = self.crossover_arithmetic(dad, mom)
         elif self.crossover == "one_point":
-            cut = np.random.randint(1, self.problem.n_dims-1)
+            cut = self.generator.integers(1, self.problem.n_dims-1)
             w1 = np.concatenate([ dad[:cut], mom[cut:] ])
             w2 = np.concatenate([ mom[:cut], dad[cut:] ])
         elif self.crossover == "multi_points":
-            idxs = np.random.choice(range(1, self.problem.n_dims-1), 2, replace=False)
+            idxs = self.generator.choice(range(1, self.problem.n_dims-1), 2, replace=False)
             cut1, cut2 = np.min(idxs), np.max(idxs)
             w1 = np.concatenate([ dad[:cut1], mom[cut1:cut2], dad[cut2:] ])
             w2 = np.concatenate([ mom[:cut1], dad[cut1:cut2], mom[cut2:] ])
         else:           # uniform
-            flip = np.random.randint(0, 2, self.problem.n_dims)
+            flip = self.generator.integers(0, 2, self.problem.n_dims)
             w1 = dad * flip + mom * (1 - flip)
             w2 = mom * flip + dad * (1 - flip)
         return w1, w2
@@ -191,33 +204,33 @@ class BaseGA(Optimizer):
         if self.mutation_multipoints:
             if self.mutation == "swap":
                 for idx in range(self.problem.n_dims):
-                    idx_swap = np.random.choice(list(set(range(0, self.problem.n_dims)) - {idx}))
+                    idx_swap = self.generator.choice(list(set(range(0, self.problem.n_dims)) - {idx}))
                     child[idx], child[idx_swap] = child[idx_swap], child[idx]
                     return child
             else:       # "flip"
                 mutation_child = self.generate_position(self.problem.lb, self.problem.ub)
-                flag_child = np.random.uniform(0, 1, self.problem.n_dims) < self.pm
+                flag_child = self.generator.uniform(0, 1, self.problem.n_dims) < self.pm
                 return np.where(flag_child, mutation_child, child)
         else:
             if self.mutation == "swap":
-                idx1, idx2 = np.random.choice(range(0, self.problem.n_dims), 2, replace=False)
+                idx1, idx2 = self.generator.choice(range(0, self.problem.n_dims), 2, replace=False)
                 child[idx1], child[idx2] = child[idx2], child[idx1]
                 return child
             elif self.mutation == "inversion":
-                cut1, cut2 = np.random.choice(range(0, self.problem.n_dims), 2, replace=False)
+                cut1, cut2 = self.generator.choice(range(0, self.problem.n_dims), 2, replace=False)
                 temp = child[cut1:cut2]
                 temp = temp[::-1]
                 child[cut1:cut2] = temp
                 return child
             elif self.mutation == "scramble":
-                cut1, cut2 = np.random.choice(range(0, self.problem.n_dims), 2, replace=False)
+                cut1, cut2 = self.generator.choice(range(0, self.problem.n_dims), 2, replace=False)
                 temp = child[cut1:cut2]
-                np.random.shuffle(temp)
+                self.generator.shuffle(temp)
                 child[cut1:cut2] = temp
                 return child
             else:   # "flip"
-                idx = np.random.randint(0, self.problem.n_dims)
-                child[idx] = np.random.uniform(self.problem.lb[idx], self.problem.ub[idx])
+                idx = self.generator.integers(0, self.problem.n_dims)
+                child[idx] = self.generator.uniform(self.problem.lb[idx], self.problem.ub[idx])
                 return child
 
     def survivor_process(self, pop, pop_child):
@@ -232,14 +245,15 @@ class BaseGA(Optimizer):
         Returns:
             The new population
         """
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            id_child = self.get_index_kway_tournament_selection(pop, k_way=0.1, output=1, reverse=True)[0]
-            if self.compare_agent(pop_child[idx], pop[id_child]):
-                pop_new.append(pop_child[idx])
-            else:
-                pop_new.append(pop[id_child])
-        return pop_new
+        list_fitness = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop])
+        list_fit_child = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop_child])
+        list_id = self.get_index_kway_tournament_selection_batch(list_fitness, k_way=0.1, output=1, size=self.pop_size, reverse=True)[:, 0]
+        # Same rule as compare_agent(), the child also wins the ties of a max problem
+        if self.problem.minmax == "min":
+            mask = list_fit_child < list_fitness[list_id]
+        else:
+            mask = list_fit_child >= list_fitness[list_id]
+        return [pop_child[idx] if mask[idx] else pop[list_id[idx]] for idx in range(0, self.pop_size)]
 
     def evolve(self, epoch):
         """
@@ -249,13 +263,14 @@ class BaseGA(Optimizer):
             epoch (int): The current iteration
         """
         list_fitness = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        list_parents = self.selection_process_batch(list_fitness, int(self.pop_size/2))
         pop_new = []
         for i in range(0, int(self.pop_size/2)):
             ### Selection
-            child1, child2 = self.selection_process(list_fitness)
+            child1, child2 = self.pop[list_parents[i][0]][self.ID_POS], self.pop[list_parents[i][1]][self.ID_POS]
 
             ### Crossover
-            if np.random.uniform() < self.pc:
+            if self.generator.uniform() < self.pc:
                 child1, child2 = self.crossover_process(child1, child2)
 
             ### Mutation
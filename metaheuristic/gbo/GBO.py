@@ -81,49 +81,49 @@ class OriginalGBO(Optimizer):
 
         pop_new = []
         for idx in range(0, self.pop_size):
-            p1 = 2 * np.random.rand() * alpha - alpha
-            p2 = 2 * np.random.rand() * alpha - alpha
+            p1 = 2 * self.generator.random() * alpha - alpha
+            p2 = 2 * self.generator.random() * alpha - alpha
             #  Four positions randomly selected from population
-            r1, r2, r3, r4 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 4, replace=False)
+            r1, r2, r3, r4 = self.generator.choice(list(set(range(0, self.pop_size)) - {idx}), 4, replace=False)
             # Average of Four positions randomly selected from population
             r0 = (self.pop[r1][self.ID_POS] + self.pop[r2][self.ID_POS] + self.pop[r3][self.ID_POS] + self.pop[r4][self.ID_POS]) / 4
             # Randomization Epsilon
-            epsilon = 5e-3 * np.random.rand()
+            epsilon = 5e-3 * self.generator.random()
 
-            delta = 2 * np.random.rand() * np.abs(r0 - self.pop[idx][self.ID_POS])
+            delta = 2 * self.generator.random() * np.abs(r0 - self.pop[idx][self.ID_POS])
             step = (self.g_best[self.ID_POS] - self.pop[r1][self.ID_POS] + delta) / 2
-            delta_x = np.random.choice(range(0, self.pop_size)) * np.abs(step)
-            x1 = self.pop[idx][self.ID_POS] - np.random.normal() * p1 * 2 * delta_x * \
+            delta_x = self.generator.choice(range(0, self.pop_size)) * np.abs(step)
+            x1 = self.pop[idx][self.ID_POS] - self.generator.normal() * p1 * 2 * delta_x * \
                  self.pop[idx][self.ID_POS] / (self.g_worst[self.ID_POS] - self.g_best[self.ID_POS] + epsilon) + \
-                 np.random.rand() * p2 * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
+                 self.generator.random() * p2 * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
 
-            z = self.pop[idx][self.ID_POS] - np.random.normal() * 2 * delta_x * \
+            z = self.pop[idx][self.ID_POS] - self.generator.normal() * 2 * delta_x * \
                 self.pop[idx][self.ID_POS] / (self.g_worst[self.ID_POS] - self.g_best[self.ID_POS] + epsilon)
-            y_p = np.random.rand() * ((z + self.pop[idx][self.ID_POS]) / 2 + np.random.rand() * delta_x)
-            y_q = np.random.rand() * ((z + self.pop[idx][self.ID_POS]) / 2 - np.random.rand() * delta_x)
-            x2 = self.g_best[self.ID_POS] - np.random.normal() * p1 * 2 * delta_x * self.pop[idx][self.ID_POS] / (y_p - y_q + epsilon) + \
-                 np.random.rand() * p2 * (self.pop[r1][self.ID_POS] - self.pop[r2][self.ID_POS])
+            y_p = self.generator.random() * ((z + self.pop[idx][self.ID_POS]) / 2 + self.generator.random() * delta_x)
+            y_q = self.generator.random() * ((z + self.pop[idx][self.ID_POS]) / 2 - self.generator.random() * delta_x)
+            x2 = self.g_best[self.ID_POS] - self.generator.normal() * p1 * 2 * delta_x * self.pop[idx][self.ID_POS] / (y_p - y_q + epsilon) + \
+                 self.generator.random() * p2 * (self.pop[r1][self.ID_POS] - self.pop[r2][self.ID_POS])
 
             x3 = self.pop[idx][self.ID_POS] - p1 * (x2 - x1)
-            ra = np.random.rand()
-            rb = np.random.rand()
+            ra = self.generator.random()
+            rb = self.generator.random()
             pos_new = ra * (rb * x1 + (1 - rb) * x2) + (1 - ra) * x3
 
             # Local escaping operator
-            if np.random.rand() < self.pr:
-                f1 = np.random.uniform(-1, 1)
-                f2 = np.random.normal(0, 1)
-                L1 = np.round(1 - np.random.rand())
-                u1 = L1 * 2 * np.random.rand() + (1 - L1)
-                u2 = L1 * np.random.rand() + (1 - L1)
-                u3 = L1 * np.random.rand() + (1 - L1)
-
-                L2 = np.round(1 - np.random.rand())
+            if self.generator.random() < self.pr:
+                f1 = self.generator.uniform(-1, 1)
+                f2 = self.generator.normal(0, 1)
+                L1 = np.round(1 - self.generator.random())
+                u1 = L1 * 2 * self.generator.random() + (1 - L1)
+                u2 = L1 * self.generator.random() + (1 - L1)
+                u3 = L1 * self.generator.random() + (1 - L1)
+
+                L2 = np.round(1 - self.generator.random())
                 x_rand = self.generate_position(self.problem.lb, self.problem.ub)
-                x_p = self.pop[np.random.choice(range(0, self.pop_size))][self.ID_POS]
+                x_p = self.pop[self.generator.choice(range(0, self.pop_size))][self.ID_POS]
                 x_m = L2 * x_p + (1 - L2) * x_rand
 
-                if np.random.rand() < 0.5:
+                if self.generator.random() < 0.5:
                     pos_new = pos_new + f1 * (u1 * self.g_best[self.ID_POS] - u2 * x_m) + \
                               f2 * p1 * (u3 * (x2 - x1) + u2 * (self.pop[r1][self.ID_POS] - self.pop[r2][self.ID_POS])) / 2
                 else:
@@ -81,7 +81,7 @@ class OriginalHGS(Optimizer):
         Returns:
             list: wrapper of solution with format [position, target, hunger]
         """
-        position = np.random.uniform(lb, ub)
+        position = self.generator.uniform(lb, ub)
         position = self.amend_position(position, lb, ub)
         target = self.get_target_wrapper(position)
         hunger = 1.0
@@ -96,7 +96,7 @@ class OriginalHGS(Optimizer):
         # min_index = pop.index(min(pop, key=lambda x: x[self.ID_TAR][self.ID_FIT]))
         # Eq (2.8) and (2.9)
         for i in range(0, self.pop_size):
-            r = np.random.rand()
+            r = self.generator.random()
             # space: since we pass lower bound and upper bound as list. Better take the np.mean of them.
             space = np.mean(self.problem.ub - self.problem.lb)
             H = (pop[i][self.ID_TAR][self.ID_FIT] - g_best[self.ID_TAR][self.ID_FIT]) / \
@@ -133,20 +133,20 @@ class OriginalHGS(Optimizer):
             E = self.sech(current_agent[self.ID_TAR][self.ID_FIT] - g_best[self.ID_TAR][self.ID_FIT])
 
             # R is a ranging controller added to limit the range of activity, in which the range of R is gradually reduced to 0
-            R = 2 * shrink * np.random.rand() - shrink  # Eq. (2.3)
+            R = 2 * shrink * self.generator.random() - shrink  # Eq. (2.3)
 
             ## Calculate the hungry weight of each position
-            if np.random.rand() < self.PUP:
-                W1 = current_agent[self.ID_HUN] * self.pop_size / (total_hunger + self.EPSILON) * np.random.rand()
+            if self.generator.random() < self.PUP:
+                W1 = current_agent[self.ID_HUN] * self.pop_size / (total_hunger + self.EPSILON) * self.generator.random()
             else:
                 W1 = 1
-            W2 = (1 - np.exp(-abs(current_agent[self.ID_HUN] - total_hunger))) * np.random.rand() * 2
+            W2 = (1 - np.exp(-abs(current_agent[self.ID_HUN] - total_hunger))) * self.generator.random() * 2
 
             ### Udpate position of individual Eq. (2.1)
-            r1 = np.random.rand()
-            r2 = np.random.rand()
+            r1 = self.generator.random()
+            r2 = self.generator.random()
             if r1 < self.PUP:
-                pos_new = current_agent[self.ID_POS] * (1 + np.random.normal(0, 1))
+                pos_new = current_agent[self.ID_POS] * (1 + self.generator.normal(0, 1))
             else:
                 if r2 > E:
                     pos_new = W1 * g_best[self.ID_POS] + R * W2 * abs(g_best[self.ID_POS] - current_agent[self.ID_POS])
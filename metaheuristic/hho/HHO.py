@@ -58,6 +58,9 @@ class BaseHHO(Optimizer):
 
         self.nfe_per_epoch = 1.5 * self.pop_size
         self.sort_flag = False
+        # Constant of the Levy-flight step, computed once
+        self.xichma = np.power((gamma(1 + 1.5) * np.sin(np.pi * 1.5 / 2.0)) /
+                               (gamma((1 + 1.5) * 1.5 * np.power(2, (1.5 - 1) / 2)) / 2.0), 1.0 / 1.5)
 
     def evolve(self, epoch):
         """
@@ -69,22 +72,22 @@ class BaseHHO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
             # -1 < E0 < 1
-            E0 = 2 * np.random.uniform() - 1
+            E0 = 2 * self.generator.uniform() - 1
             # factor to show the decreasing energy of rabbit
             E = 2 * E0 * (1 - (epoch + 1) * 1.0 / self.epoch)
-            J = 2 * (1 - np.random.uniform())
+            J = 2 * (1 - self.generator.uniform())
 
             # -------- Exploration phase Eq. (1) in paper -------------------
             if np.abs(E) >= 1:
                 # Harris' hawks perch randomly based on 2 strategy:
-                if np.random.rand() >= 0.5:  # perch based on other family members
-                    X_rand = deepcopy(self.pop[np.random.randint(0, self.pop_size)][self.ID_POS])
-                    pos_new = X_rand - np.random.uniform() * np.abs(X_rand - 2 * np.random.uniform() * self.pop[idx][self.ID_POS])
+                if self.generator.random() >= 0.5:  # perch based on other family members
+                    X_rand = deepcopy(self.pop[self.generator.integers(0, self.pop_size)][self.ID_POS])
+                    pos_new = X_rand - self.generator.uniform() * np.abs(X_rand - 2 * self.generator.uniform() * self.pop[idx][self.ID_POS])
 
                 else:  # perch on a random tall tree (random site inside group's home range)
                     X_m = np.mean([x[self.ID_POS] for x in self.pop])
-                    pos_new = (self.g_best[self.ID_POS] - X_m) - np.random.uniform() * \
-                              (self.problem.lb + np.random.uniform() * (self.problem.ub - self.problem.lb))
+                    pos_new = (self.g_best[self.ID_POS] - X_m) - self.generator.uniform() * \
+                              (self.problem.lb + self.generator.uniform() * (self.problem.ub - self.problem.lb))
                 pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                 pop_new.append([pos_new, None])
             # -------- Exploitation phase -------------------
@@ -92,7 +95,7 @@ class BaseHHO(Optimizer):
                 # Attacking the rabbit using 4 strategies regarding the behavior of the rabbit
                 # phase 1: ----- surprise pounce (seven kills) ----------
                 # surprise pounce (seven kills): multiple, short rapid dives by different hawks
-                if (np.random.rand() >= 0.5):
+                if (self.generator.random() >= 0.5):
                     delta_X = self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]
                     if np.abs(E) >= 0.5:  # Hard besiege Eq. (6) in paper
                         pos_new = delta_X - E * np.abs(J * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
@@ -101,9 +104,7 @@ class BaseHHO(Optimizer):
                     pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                     pop_new.append([pos_new, None])
                 else:
-                    xichma = np.power((gamma(1 + 1.5) * np.sin(np.pi * 1.5 / 2.0)) /
-                                      (gamma((1 + 1.5) * 1.5 * np.power(2, (1.5 - 1) / 2)) / 2.0), 1.0 / 1.5)
-                    LF_D = 0.01 * np.random.uniform() * xichma / np.power(np.abs(np.random.uniform()), 1.0 / 1.5)
+                    LF_D = 0.01 * self.generator.uniform() * self.xichma / np.power(np.abs(self.generator.uniform()), 1.0 / 1.5)
                     if np.abs(E) >= 0.5:  # Soft besiege Eq. (10) in paper
                         Y = self.g_best[self.ID_POS] - E * np.abs(J * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
                     else:  # Hard besiege Eq. (11) in paper
@@ -111,7 +112,7 @@ class BaseHHO(Optimizer):
                         Y = self.g_best[self.ID_POS] - E * np.abs(J * self.g_best[self.ID_POS] - X_m)
                     pos_Y = self.amend_position(Y, self.problem.lb, self.problem.ub)
                     target_Y = self.get_target_wrapper(pos_Y)
-                    Z = Y + np.random.uniform(self.problem.lb, self.problem.ub) * LF_D
+                    Z = Y + self.generator.uniform(self.problem.lb, self.problem.ub) * LF_D
                     pos_Z = self.amend_position(Z, self.problem.lb, self.problem.ub)
                     target_Z = self.get_target_wrapper(pos_Z)
                     if self.compare_agent([pos_Y, target_Y], self.pop[idx]):
@@ -79,7 +79,7 @@ class BaseMFO(Optimizer):
         for idx in range(0, self.pop_size):
             #   D in Eq.(3.13)
             distance_to_flame = np.abs(pop_flames[idx][self.ID_POS] - self.pop[idx][self.ID_POS])
-            t = (a - 1) * np.random.uniform(0, 1, self.problem.n_dims) + 1
+            t = (a - 1) * self.generator.uniform(0, 1, self.problem.n_dims) + 1
             b = 1
 
             # Update the position of the moth with respect to its corresponding flame, Eq.(3.12).
@@ -165,7 +165,7 @@ class OriginalMFO(BaseMFO):
             for j in range(self.problem.n_dims):
                 #   D in Eq.(3.13)
                 distance_to_flame = np.abs(pop_flames[idx][self.ID_POS][j] - self.pop[idx][self.ID_POS][j])
-                t = (a - 1) * np.random.uniform() + 1
+                t = (a - 1) * self.generator.uniform() + 1
                 b = 1
                 if idx <= num_flame:  # Update the position of the moth with respect to its corresponding flame
                     # Eq.(3.12)
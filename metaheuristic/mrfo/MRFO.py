@@ -73,28 +73,28 @@ class BaseMRFO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
             # Cyclone foraging (Eq. 5, 6, 7)
-            if np.random.rand() < 0.5:
-                r1 = np.random.uniform()
+            if self.generator.random() < 0.5:
+                r1 = self.generator.uniform()
                 beta = 2 * np.exp(r1 * (self.epoch - epoch) / self.epoch) * np.sin(2 * np.pi * r1)
 
-                if (epoch + 1) / self.epoch < np.random.rand():
-                    x_rand = np.random.uniform(self.problem.lb, self.problem.ub)
+                if (epoch + 1) / self.epoch < self.generator.random():
+                    x_rand = self.generator.uniform(self.problem.lb, self.problem.ub)
                     if idx == 0:
-                        x_t1 = x_rand + np.random.uniform() * (x_rand - self.pop[idx][self.ID_POS]) + \
+                        x_t1 = x_rand + self.generator.uniform() * (x_rand - self.pop[idx][self.ID_POS]) + \
                                beta * (x_rand - self.pop[idx][self.ID_POS])
                     else:
-                        x_t1 = x_rand + np.random.uniform() * (self.pop[idx - 1][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
+                        x_t1 = x_rand + self.generator.uniform() * (self.pop[idx - 1][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
                                beta * (x_rand - self.pop[idx][self.ID_POS])
                 else:
                     if idx == 0:
-                        x_t1 = self.g_best[self.ID_POS] + np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
+                        x_t1 = self.g_best[self.ID_POS] + self.generator.uniform() * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
                                beta * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
                     else:
-                        x_t1 = self.g_best[self.ID_POS] + np.random.uniform() * (self.pop[idx - 1][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
+                        x_t1 = self.g_best[self.ID_POS] + self.generator.uniform() * (self.pop[idx - 1][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
                                beta * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
             # Chain foraging (Eq. 1,2)
             else:
-                r = np.random.uniform()
+                r = self.generator.uniform()
                 alpha = 2 * r * np.sqrt(np.abs(np.log(r)))
                 if idx == 0:
                     x_t1 = self.pop[idx][self.ID_POS] + r * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
@@ -111,7 +111,7 @@ class BaseMRFO(Optimizer):
         for idx in range(0, self.pop_size):
             # Somersault foraging   (Eq. 8)
             x_t1 = pop_new[idx][self.ID_POS] + self.somersault_range * \
-                   (np.random.uniform() * g_best[self.ID_POS] - np.random.uniform() * pop_new[idx][self.ID_POS])
+                   (self.generator.uniform() * g_best[self.ID_POS] - self.generator.uniform() * pop_new[idx][self.ID_POS])
             pos_new = self.amend_position(x_t1, self.problem.lb, self.problem.ub)
             pop_child.append([pos_new, None])
         pop_child = self.update_target_wrapper_population(pop_child)
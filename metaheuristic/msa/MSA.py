@@ -88,8 +88,8 @@ class BaseMSA(Optimizer):
     def _levy_walk(self, iteration):
         beta = 1.5  # Eq. 2.23
         sigma = (gamma(1 + beta) * np.sin(np.pi * (beta - 1) / 2) / (gamma(beta / 2) * (beta - 1) * 2 ** ((beta - 2) / 2))) ** (1 / (beta - 1))
-        u = np.random.uniform(self.problem.lb, self.problem.ub) * sigma
-        v = np.random.uniform(self.problem.lb, self.problem.ub)
+        u = self.generator.uniform(self.problem.lb, self.problem.ub) * sigma
+        v = self.generator.uniform(self.problem.lb, self.problem.ub)
         step = u / np.abs(v) ** (1.0 / (beta - 1))  # Eq. 2.21
         scale = self.max_step_size / (iteration + 1)
         delta_x = scale * step
@@ -109,14 +109,14 @@ class BaseMSA(Optimizer):
             # Migration operator
             if idx < self.n_moth1:
                 # scale = self.max_step_size / (epoch+1)       # Smaller step for local walk
-                pos_new = self.pop[idx][self.ID_POS] + np.random.normal() * self._levy_walk(epoch)
+                pos_new = self.pop[idx][self.ID_POS] + self.generator.normal() * self._levy_walk(epoch)
             else:
                 # Flying in a straight line
-                temp_case1 = self.pop[idx][self.ID_POS] + np.random.normal() * \
+                temp_case1 = self.pop[idx][self.ID_POS] + self.generator.normal() * \
                              self.golden_ratio * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-                temp_case2 = self.pop[idx][self.ID_POS] + np.random.normal() * \
+                temp_case2 = self.pop[idx][self.ID_POS] + self.generator.normal() * \
                              (1.0 / self.golden_ratio) * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-                pos_new = np.where(np.random.uniform(self.problem.n_dims) < 0.5, temp_case2, temp_case1)
+                pos_new = np.where(self.generator.uniform(1, self.problem.n_dims) < 0.5, temp_case2, temp_case1)
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         pop_new = self.update_target_wrapper_population(pop_new)
@@ -0,0 +1,77 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of target wrappers [fitness, [obj1, obj2, ...]], keyed by the quantised position
+
+    Notes
+    ~~~~~
+    + The position is rounded to 'decimals' decimals, so positions closer than 10^-decimals share the same entry
+    + When the cache is full, the least recently used entry is evicted
+    + hits and misses count the lookups, they are saved in the History of the Optimizer after each generation
+    """
+
+    def __init__(self, max_size=10000, decimals=10):
+        """
+        Args:
+            max_size (int): maximum number of cached positions
+            decimals (int): number of decimals kept when quantising a position
+        """
+        self.max_size, self.decimals = max_size, decimals
+        self.hits, self.misses = 0, 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_key(self, position):
+        # + 0.0 turns -0.0 into 0.0, so both give the same key
+        return (np.round(np.asarray(position, dtype=float), self.decimals) + 0.0).tobytes()
+
+    def get(self, key):
+        """
+        Args:
+            key (bytes): key of the position, given by get_key()
+
+        Returns:
+            list: a copy of the cached target wrapper, None when the position is not cached
+        """
+        with self._lock:
+            target = self._data.get(key)
+            if target is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return [target[0], np.copy(target[1])]
+
+    def put(self, key, target):
+        """
+        Args:
+            key (bytes): key of the position, given by get_key()
+            target (list): target wrapper [fitness, [obj1, obj2, ...]] of the position
+        """
+        with self._lock:
+            self._data[key] = [target[0], np.copy(target[1])]
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits, self.misses = 0, 0
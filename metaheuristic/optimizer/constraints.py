@@ -0,0 +1,164 @@
+import threading
+
+import numpy as np
+
+
+class ConstraintHandler:
+    """
+    Penalty engine of a constrained problem, used as problem.fit_func when the problem sets "constraints"
+
+    Notes
+    ~~~~~
+    + objective(X) and constraints(X) take a (n, n_dims) batch of solutions, they return the (n,) or (n, n_objs)
+      objectives and the (n, n_cons) constraint matrix, a solution is feasible when all its constraints are <= 0
+      (an equality constraint h(x) = 0 can be given as |h(x)| - epsilon)
+    + violation = sum of max(0, g_j(x)) over the constraints, the fitness of each objective is:
+        + static: f + weight * violation
+        + adaptive: same as static, the weight is multiplied by beta when no solution of the last epoch was feasible
+          and divided by beta when all of them were feasible (bounded by weight_min and weight_max)
+        + deb: feasibility rules of Deb (2000), f for a feasible solution, max(weight, worst feasible objective found
+          so far) + violation for an infeasible one: a feasible solution is always better (as long as the weight is
+          bigger than the feasible objectives) and two infeasible solutions are compared by their violation only
+    + The penalties are computed when the solutions are evaluated: with the adaptive weight (or a better worst feasible
+      objective for deb) the fitness of the older solutions is not computed again, neither in the fitness cache
+    + n_evaluated and n_feasible count the solutions of the current epoch, update() ends the epoch (called once per
+      epoch by the Optimizer). In 'process'/'shared' mode the workers only call evaluate(), the penalties are computed by
+      the handler of the parent (see Optimizer.get_penalized_targets()), in the order of the population
+    """
+
+    PENALTIES = ("static", "adaptive", "deb")
+
+    def __init__(self, objective, constraints, penalty="static", weight=1e8, minmax="min", beta=2.0, weight_min=1.0, weight_max=1e12):
+        """
+        Args:
+            objective (callable): batch objective function
+            constraints (callable): batch constraint function
+            penalty (str): "static", "adaptive" or "deb"
+            weight (float): penalty weight of the static and adaptive penalties (starting value of the adaptive one),
+                smallest fitness of an infeasible solution with the deb penalty
+            minmax (str): "min" or "max" problem, the penalty makes the fitness worse
+            beta (float): factor of the adaptive weight
+            weight_min (float): lower bound of the adaptive weight
+            weight_max (float): upper bound of the adaptive weight
+        """
+        self.objective, self.constraints, self.penalty, self.minmax = objective, constraints, penalty, minmax
+        self.weight_start, self.beta, self.weight_min, self.weight_max = weight, beta, weight_min, weight_max
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Start a new run: initial weight, no worst feasible objective and no counted solution
+        """
+        self.weight, self.f_worst = self.weight_start, None
+        self.n_evaluated, self.n_feasible, self.feasible_ratio = 0, 0, None
+
+    def spawn(self):
+        """
+        Returns:
+            ConstraintHandler: new handler with the same functions and settings, for another optimizer
+        """
+        return ConstraintHandler(self.objective, self.constraints, self.penalty, self.weight_start, self.minmax, self.beta,
+                                 self.weight_min, self.weight_max)
+
+    def get_state(self):
+        """
+        Returns:
+            dict: the adaptive state of the handler, saved in the checkpoints of the Optimizer
+        """
+        return {key: getattr(self, key) for key in ("weight", "f_worst", "n_evaluated", "n_feasible", "feasible_ratio")}
+
+    def set_state(self, state):
+        """
+        Args:
+            state (dict): state given by get_state()
+        """
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def get_violations(self, cons_matrix):
+        """
+        Args:
+            cons_matrix (np.ndarray): (n, n_cons) constraint matrix
+
+        Returns:
+            np.ndarray: (n,) total violation of each solution
+        """
+        # A NaN constraint is counted as satisfied, same as Engineer.default_penalty()
+        return np.sum(np.fmax(0, cons_matrix), axis=1)
+
+    def get_fitness(self, objs_matrix, violations):
+        """
+        Args:
+            objs_matrix (np.ndarray): (n, n_objs) objectives
+            violations (np.ndarray): (n,) total violations
+
+        Returns:
+            np.ndarray: (n, n_objs) penalized objectives
+        """
+        sign = 1 if self.minmax == "min" else -1
+        feasible = violations <= 0
+        with self._lock:
+            self.n_evaluated += len(violations)
+            self.n_feasible += int(np.sum(feasible))
+            if self.penalty != "deb":
+                return objs_matrix + sign * self.weight * violations[:, None]
+            if np.any(feasible):
+                # Worst feasible objective found so far (biggest one for a min problem)
+                f_worst = np.max(sign * objs_matrix[feasible], axis=0)
+                self.f_worst = f_worst if self.f_worst is None else np.maximum(self.f_worst, f_worst)
+            offset = self.weight if self.f_worst is None else np.maximum(self.f_worst, self.weight)
+        return np.where(feasible[:, None], objs_matrix, sign * (offset + violations[:, None]))
+
+    def evaluate(self, X):
+        """
+        Args:
+            X (np.ndarray): (n, n_dims) batch of solutions
+
+        Returns:
+            tuple: (n, n_objs) objectives and (n,) total violations, without penalty
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        objs_matrix = np.asarray(self.objective(X), dtype=float).reshape(len(X), -1)
+        cons_matrix = np.asarray(self.constraints(X), dtype=float).reshape(len(X), -1)
+        return objs_matrix, self.get_violations(cons_matrix)
+
+    def __call__(self, X):
+        """
+        Args:
+            X (np.ndarray): (n, n_dims) batch of solutions
+
+        Returns:
+            np.ndarray: (n,) penalized fitness for a single objective, (n_objs,) for one solution, (n, n_objs) otherwise
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        fitness = self.get_fitness(*self.evaluate(X))
+        if fitness.shape[1] == 1:
+            return fitness[:, 0]
+        return fitness[0] if len(X) == 1 else fitness
+
+    def update(self):
+        """
+        End the epoch: feasibility ratio of the solutions evaluated in the epoch and update of the adaptive weight
+
+        Returns:
+            float: the feasibility ratio, None when no solution was counted
+        """
+        with self._lock:
+            self.feasible_ratio = None if self.n_evaluated == 0 else self.n_feasible / self.n_evaluated
+            if self.penalty == "adaptive" and self.feasible_ratio is not None:
+                if self.n_feasible == 0:
+                    self.weight = min(self.weight * self.beta, self.weight_max)
+                elif self.n_feasible == self.n_evaluated:
+                    self.weight = max(self.weight / self.beta, self.weight_min)
+            self.n_evaluated, self.n_feasible = 0, 0
+            return self.feasible_ratio
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import threading
+
+
+class AsyncEvaluator:
+    """
+    Evaluation backend of an async objective (async def fit_func(solution)), used by the 'async' mode of Optimizer.solve()
+
+    Notes
+    ~~~~~
+    + The coroutines run in an event loop owned by the evaluator, in a background thread started by the first call, so
+      the client sessions of the objective (i.e: aiohttp, grpc.aio) live in the same loop for the whole run
+    + evaluate_many() submits all the solutions at once, at most max_in_flight of them are awaited at the same time
+    + Each call is cancelled after timeout seconds and tried again up to retries times, then the last error is raised
+      and the pending calls of the batch are cancelled
+    + evaluate() is the synchronous wrapper used as problem.fit_func by the other modes
+    + The loop is neither pickled nor inherited by a forked process, each worker process starts its own loop
+    """
+
+    def __init__(self, fit_func, max_in_flight=16, timeout=None, retries=0):
+        """
+        Args:
+            fit_func (callable): coroutine function, called with the same argument as a synchronous fit_func
+            max_in_flight (int): maximum number of calls awaited at the same time
+            timeout (float): maximum time in seconds of a call, None for no limit
+            retries (int): number of times a failed (or timed out) call is tried again
+        """
+        self.fit_func, self.max_in_flight, self.timeout, self.retries = fit_func, max_in_flight, timeout, retries
+        self.n_calls, self.n_retries = 0, 0
+        self._loop, self._thread, self._lock, self._pid = None, None, threading.Lock(), os.getpid()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_loop"], state["_thread"], state["_lock"] = None, None, None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock, self._pid = threading.Lock(), os.getpid()
+
+    def get_loop(self):
+        """
+        Returns:
+            asyncio.AbstractEventLoop: the event loop of the evaluator, started when needed
+        """
+        if self._pid != os.getpid():
+            # Forked worker process, the thread running the loop of the parent doesn't exist here
+            self._loop, self._thread, self._lock, self._pid = None, None, threading.Lock(), os.getpid()
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="AsyncEvaluator", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def run(self, coroutine):
+        """
+        Run a coroutine in the loop of the evaluator and wait for its result (from any thread but the loop one)
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.get_loop()).result()
+
+    async def _call(self, solution):
+        for attempt in range(0, self.retries + 1):
+            self.n_calls += 1
+            try:
+                if self.timeout is None:
+                    return await self.fit_func(solution)
+                return await asyncio.wait_for(self.fit_func(solution), self.timeout)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                self.n_retries += 1
+
+    async def _bounded_call(self, solution, semaphore):
+        async with semaphore:
+            return await self._call(solution)
+
+    async def _gather(self, solutions):
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        tasks = [asyncio.ensure_future(self._bounded_call(solution, semaphore)) for solution in solutions]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def evaluate(self, solution):
+        """
+        Args:
+            solution (np.ndarray): the solution, given to fit_func as it is
+
+        Returns:
+            the value (or list of values) returned by fit_func
+        """
+        return self.run(self._call(solution))
+
+    def evaluate_many(self, solutions):
+        """
+        Args:
+            solutions (list): the solutions, all of them are submitted concurrently
+
+        Returns:
+            list: the values returned by fit_func, in the order of the solutions
+        """
+        return self.run(self._gather(solutions))
+
+    def close(self):
+        """
+        Stop the event loop of the evaluator, a later call starts a new one
+        """
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop, self._thread = None, None
@@ -0,0 +1,77 @@
+import csv
+import json
+
+from mealpy.utils.history import History as BaseHistory
+
+from metaheuristic.optimizer.logger import create_logger
+
+
+class History(BaseHistory):
+    """
+    History of the Optimizer, the mealpy History with some extra records
+
+    Notes
+    ~~~~~
+    + list_nfe: exact number of function evaluations done since the start of solve() after each generation
+    + list_cache_hits: cumulative number of fitness cache hits after each generation (only when the problem has a cache)
+    + list_cache_misses: cumulative number of fitness cache misses after each generation (only when the problem has a cache)
+    + list_profile: one record per profiled generation (only when the problem sets profile_every), with the time in
+        seconds of the phases variation, evaluation, selection, bookkeeping and the counts n_calls, n_positions
+    + list_feasible_ratio: ratio of feasible solutions among the solutions evaluated since the previous generation
+        (only when the problem has constraints, see ConstraintHandler)
+    + store: the HistoryStore of the run (only when the problem sets history_dir). Then list_population is read lazily
+        from the store, and list_current_best/list_global_best only keep the last solutions needed by the Optimizer
+    + The records of the mealpy History are set here, its constructor is not called: the logger is configured once by
+        create_logger() instead of once per History
+    """
+
+    def __init__(self, **kwargs):
+        self.list_global_best = []  # List of global best solution found so far in all previous generations
+        self.list_current_best = []  # List of current best solution in each previous generations
+        self.list_epoch_time = []  # List of runtime for each generation
+        self.list_global_best_fit = []  # List of global best fitness found so far in all previous generations
+        self.list_current_best_fit = []  # List of current best fitness in each previous generations
+        self.list_population = []  # List of population in each generations
+        self.list_diversity = []  # List of diversity of swarm in all generations
+        self.list_exploitation = []  # List of exploitation percentages for all generations
+        self.list_exploration = []  # List of exploration percentages for all generations
+        self.list_nfe = []
+        self.list_cache_hits = []
+        self.list_cache_misses = []
+        self.list_profile = []
+        self.list_feasible_ratio = []
+        self.store = None
+        self.epoch, self.log_to, self.log_file = None, None, None
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self.logger = create_logger(f"{__name__}.{__class__.__name__}", self.log_to, self.log_file,
+                                    format_str='%(asctime)s, %(levelname)s, %(name)s [line: %(lineno)d]: %(message)s')
+
+    def trim_best(self, window=2):
+        """
+        Keep only the last window solutions of list_current_best and list_global_best (bounded memory with a store)
+        """
+        if len(self.list_global_best) > window:
+            del self.list_global_best[:-window]
+        if len(self.list_current_best) > window:
+            del self.list_current_best[:-window]
+
+    def save_profile(self, filename="profile.json"):
+        """
+        Export list_profile, the format is given by the extension of the file: ".json" or ".csv"
+
+        Args:
+            filename (str): path of the file
+        """
+        if filename.endswith(".csv"):
+            fields = list(self.list_profile[0].keys()) if len(self.list_profile) > 0 else ["epoch"]
+            with open(filename, "w", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(self.list_profile)
+        elif filename.endswith(".json"):
+            with open(filename, "w") as file:
+                json.dump(self.list_profile, file, indent=2)
+        else:
+            self.logger.error("The profile can only be saved to a .json or .csv file.")
+            exit(0)
@@ -0,0 +1,66 @@
+from functools import lru_cache
+from math import gamma
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def get_mantegna_sigma(beta=1.0):
+    """
+    Standard deviation of the numerator of the Mantegna algorithm, computed once for each beta
+
+    Args:
+        beta (float): Should be in range [0, 2]
+
+    Returns:
+        float: sigma_u
+    """
+    return np.power(gamma(1 + beta) * np.sin(np.pi * beta / 2) / (gamma((1 + beta) / 2) * beta * np.power(2, (beta - 1) / 2)), 1 / beta)
+
+
+def get_levy_steps(generator, beta=1.0, multiplier=0.001, case=0, size=None):
+    """
+    Levy-flight steps of Optimizer.get_levy_flight_step(), all the steps are drawn at once
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        beta (float): Should be in range [0, 2]
+        multiplier (float): default = 0.001
+        case (int): Should be one of these value [0, 1, -1]
+
+            * 0: multiplier * s * uniform()
+            * 1: multiplier * s * normal(0, 1)
+            * -1: multiplier * s
+
+        size (int, tuple): None for a single step, i.e: pop_size for one step per agent, (pop_size, n_dims) for one step per dimension
+
+    Returns:
+        float or np.ndarray: The step size(s) of Levy-flight trajectory
+    """
+    # u and v are two random variables which follow normal distribution
+    sigma_u = get_mantegna_sigma(beta)
+    u = generator.normal(0, sigma_u ** 2, size)
+    v = generator.normal(0, 1, size)
+    s = u / np.power(np.abs(v), 1 / beta)
+    if case == 0:
+        return multiplier * s * generator.uniform(size=size)
+    elif case == 1:
+        return multiplier * s * generator.normal(0, 1, size)
+    return multiplier * s
+
+
+def get_uniform_levy_steps(generator, alpha=1.5, size=None):
+    """
+    Levy steps drawn with two uniform random variables (the variant used by TCO)
+
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        alpha (float): Parameter controlling the tail heaviness (typically > 1)
+        size (int, tuple): None for a single step
+
+    Returns:
+        float or np.ndarray: The step size(s)
+    """
+    u = generator.uniform(0, 1, size)
+    v = generator.uniform(0, 1, size)
+    return (u / np.abs(v) ** (1 / alpha)) * get_mantegna_sigma(alpha)
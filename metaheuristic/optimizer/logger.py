@@ -0,0 +1,46 @@
+import logging
+import threading
+
+from mealpy.utils.logger import Logger
+from mealpy.utils.validator import Validator
+
+# Loggers already configured by create_logger(): (name, log_to, log_file, format_str)
+_configured = set()
+# Validators shared by the optimizers: (log_to, log_file) -> Validator
+_validators = {}
+_lock = threading.Lock()
+
+
+def create_logger(name, log_to="console", log_file=None, format_str=None):
+    """
+    Same logger as mealpy Logger(log_to, log_file=log_file).create_logger(name, format_str), configured only once.
+    mealpy adds one more handler to the named logger for each object created, so after N optimizers every message
+    was written N times
+
+    Args:
+        name (str): name of the logger
+        log_to (str): "console", "file" or None (errors only)
+        log_file (str): path of the log file when log_to = "file"
+        format_str (str): format of the messages, None for the mealpy format
+
+    Returns:
+        logging.Logger: the logger
+    """
+    key = (name, log_to, log_file, format_str)
+    with _lock:
+        if key in _configured:
+            return logging.getLogger(name)
+        _configured.add(key)
+        return Logger(log_to, log_file=log_file).create_logger(name=name, format_str=format_str)
+
+
+def get_validator(log_to="console", log_file=None):
+    """
+    Returns:
+        Validator: the mealpy Validator shared by the optimizers logging to the same place (it has no other state)
+    """
+    key = (log_to, log_file)
+    with _lock:
+        if key not in _validators:
+            _validators[key] = Validator(log_to=log_to, log_file=log_file)
+        return _validators[key]
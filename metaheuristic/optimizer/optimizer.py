@@ -5,16 +5,21 @@
 # --------------------------------------------------%
 
 import numpy as np
-from math import gamma
+import pickle
 from copy import deepcopy
-from mealpy.utils.history import History
 from mealpy.utils.termination import Termination
-from mealpy.utils.logger import Logger
-from mealpy.utils.validator import Validator
 import concurrent.futures as parallel
+import os
 import time
 
-from metaheuristic.optimizer.problem import Problem
+from metaheuristic.optimizer.population import Population
+from metaheuristic.optimizer.history import History
+from metaheuristic.optimizer.logger import create_logger, get_validator
+from metaheuristic.optimizer.profiler import PhaseProfiler
+from metaheuristic.optimizer.stagnation import StagnationTracker
+from metaheuristic.optimizer.problem import Problem, EvaluationBudgetExhausted
+from metaheuristic.optimizer.store import HistoryStore
+from metaheuristic.optimizer import levy, workers
 
 
 class Optimizer:
@@ -25,11 +30,36 @@ class Optimizer:
     ~~~~~
     + The solve() is the most important method, trained the model
     + The parallel (multithreading or multiprocessing) is used in method: create_population(), update_target_wrapper_population()
+        + The pool of workers is started once per solve() call and shut down at the end of it
+        + In process mode, the optimizer (and the objective function) is shipped once per worker, then only chunks of positions
+        + In shared mode, the positions and objectives live in shared memory, only the row slices are sent to the workers
+    + The batch mode evaluates the whole population with a single call of fit_func in update_target_wrapper_population()
     + The general format of:
         + population = [agent_1, agent_2, ..., agent_N]
         + agent = global_best = solution = [position, target]
         + target = [fitness value, objective_list]
         + objective_list = [obj_1, obj_2, ..., obj_M]
+    + The population can also be a Population (structure-of-arrays: positions matrix, fitness vector, objectives matrix),
+    accepted by: update_target_wrapper_population(), get_global_best_solution(), update_global_best_solution(),
+    get_special_solutions(), greedy_selection_population()
+    + Every function evaluation is counted by problem.n_evaluations, the 'FE' termination stops in the middle of an epoch
+    as soon as the budget is used up, then the best solution evaluated in this epoch is used to update the global best
+    + Every random number is drawn from self.generator (np.random.Generator), created from the keyword argument "seed".
+    seed=None draws the seed from the global np.random state, so np.random.seed() still makes a run reproducible.
+    spawn_seeds() gives independent child streams (SeedSequence) to the agents, executions and workers
+    + In 'process'/'shared' mode, create_population() gives a child stream to each task: same population whatever the
+    scheduling of the workers. In 'thread' mode the threads share self.generator, the order of their draws is not reproducible
+    + With an async fit_func (async def), the 'async' mode submits the whole population to the event loop of
+    problem.evaluator at once, see Problem for the in-flight limit, the timeout and the retries
+    + With problem "checkpoint_file", solve() saves a checkpoint every "checkpoint_every" epochs or "checkpoint_seconds"
+    seconds, resume(path) continues the run from it: same results as an uninterrupted run in 'sequential'/'batch'/'thread'
+    mode. The state of the algorithm is given by get_algorithm_state(), override it (and set_algorithm_state()) when
+    the algorithm keeps something that can't be pickled
+    + With problem "profile_every", the epochs are split into phases (variation, evaluation, selection, bookkeeping) by
+    self.profiler and saved in self.history.list_profile, see History.save_profile() to export them
+    + self.stagnation (StagnationTracker) is updated once per epoch, it gives the 'ES' termination without scanning the
+    history. With the problem "stagnation_*" parameters, a stagnation of the global best or a collapse of the diversity
+    terminates solve() or restarts the population, the stalled agents are restarted, see handle_stagnation()
     + Access to the:
         + position of solution/agent: solution[0] or solution[self.ID_POS] or model.solution[model.ID_POS]
         + fitness: solution[1][0] or solution[self.ID_TAR][self.ID_FIT] or model.solution[model.ID_TAR][model.ID_FIT]
@@ -47,7 +77,8 @@ class Optimizer:
     def __init__(self, problem, kwargs=None):
         """
         Args:
-            problem: an instance of Problem class or a dictionary
+            problem: an instance of Problem class or a dictionary. A Problem is reused without its checks and the probe
+                evaluations of fit_func (see Problem.spawn()), i.e: the agents created by an orchestrator
 
         Examples:
             problem = {
@@ -63,16 +94,26 @@ class Optimizer:
         super(Optimizer, self).__init__()
         self.epoch, self.pop_size, self.solution = None, None, None
         self.mode, self._print_model = "sequential", ""
+        self.n_workers, self.executor, self.shared_buffer = None, None, None
+        self.nfe_start, self.epoch_best, self.sorted_index = 0, None, None
+        self.checkpoint, self.checkpoint_time = None, None
         self.pop, self.g_best = None, None
         if kwargs is None: kwargs = {}
         self.__set_keyword_arguments(kwargs)
-        self.problem = Problem(problem=problem)
+        if isinstance(problem, Problem):
+            self.problem = problem.spawn()
+        else:
+            self.problem = Problem(problem=problem)
         self.amend_position = self.problem.amend_position
         self.generate_position = self.problem.generate_position
-        self.logger = Logger(self.problem.log_to, log_file=self.problem.log_file).create_logger(name=f"{self.__module__}.{self.__class__.__name__}")
+        self.set_seed(kwargs.get("seed"))
+        self.logger = create_logger(f"{self.__module__}.{self.__class__.__name__}", self.problem.log_to, self.problem.log_file)
         self.logger.info(self.problem.msg)
         self.history = History(log_to=self.problem.log_to, log_file=self.problem.log_file)
-        self.validator = Validator(log_to=self.problem.log_to, log_file=self.problem.log_file)
+        self.profiler = PhaseProfiler(self.problem.profile_every)
+        self.stagnation = StagnationTracker(self.problem.minmax, self.EPSILON, self.problem.stagnation_epochs,
+                                            self.problem.stagnation_diversity, self.problem.stagnation_agent_epochs)
+        self.validator = get_validator(self.problem.log_to, self.problem.log_file)
         if "name" in kwargs: self._print_model += f"Model: {kwargs['name']}, "
         if "fit_name" in kwargs: self._print_model += f"Func: {kwargs['fit_name']}, "
         self.termination_flag = False
@@ -81,11 +122,42 @@ class Optimizer:
             self.termination_flag = True
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = False
+        # Everything set after this line (by the algorithm) is part of the state saved in the checkpoints
+        self._optimizer_attributes = set(self.__dict__) | {"_optimizer_attributes"}
 
     def __set_keyword_arguments(self, kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __getstate__(self):
+        # The pool of workers can't be pickled, the workers don't need it
+        state = self.__dict__.copy()
+        state["executor"], state["shared_buffer"] = None, None
+        return state
+
+    def set_seed(self, seed=None):
+        """
+        Create the random generator of the optimizer (and of its problem), every random number of the algorithm is drawn from it
+
+        Args:
+            seed (int, np.random.SeedSequence): None draws the seed from the global np.random state
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(np.random.randint(np.iinfo(np.int64).max) if seed is None else seed)
+        self.seed_sequence = seed
+        self.generator = np.random.default_rng(seed)
+        self.problem.generator = self.generator
+
+    def spawn_seeds(self, n_seeds):
+        """
+        Args:
+            n_seeds (int): number of child streams
+
+        Returns:
+            list: independent child SeedSequence of the stream of the optimizer, i.e: one per agent, execution or worker task
+        """
+        return self.seed_sequence.spawn(n_seeds)
+
     def termination_start(self):
         if self.termination_flag:
             if self.termination.mode == 'TB':
@@ -94,8 +166,8 @@ class Optimizer:
                 self.count_terminate = 0
             elif self.termination.mode == 'MG':
                 self.count_terminate = self.epoch
-            else:  # number of function evaluation (NFE)
-                self.count_terminate = 0 # self.pop_size  # First out of loop
+            else:  # number of function evaluation (NFE), counted by the problem
+                self.count_terminate = 0
             self.logger.warning(f"Stopping condition mode: {self.termination.name}, with maximum value is: {self.termination.quantity}")
 
     def initialization(self):
@@ -115,13 +187,119 @@ class Optimizer:
         Returns:
             [fitness, [obj1, obj2,...]]
         """
+        if self.problem.cache is not None:
+            key = self.problem.cache.get_key(position)
+            target = self.problem.cache.get(key)
+            if target is not None:
+                return target
+        if self.problem.reserve_evaluations(1) == 0:
+            raise EvaluationBudgetExhausted(f"Budget of {self.problem.max_evaluations} function evaluations is used up.")
         #objs = self.problem.fit_func(position)
+        token = self.profiler.start()
         objs = self.problem.fit_func(self.element_to_list(position, len(position)))
+        self.profiler.stop("evaluation", token, n_calls=1, n_positions=1)
         if not self.problem.obj_is_list:
             objs = [objs]
         fit = np.dot(objs, self.problem.obj_weights)
+        if self.problem.cache is not None:
+            self.problem.cache.put(key, [fit, objs])
+        self.update_epoch_best([position], [[fit, objs]])
         return [fit, objs]
 
+    def get_cached_targets(self, pos_list):
+        """
+        Args:
+            pos_list (list): list of 1-D numpy array positions
+
+        Returns:
+            list: cached target wrapper of each position (None when not cached) and the cache keys (None without cache)
+        """
+        if self.problem.cache is None:
+            return [None] * len(pos_list), None
+        list_keys = [self.problem.cache.get_key(pos) for pos in pos_list]
+        return [self.problem.cache.get(key) for key in list_keys], list_keys
+
+    def reserve_evaluations(self, list_idx):
+        """
+        Args:
+            list_idx (list): indexes of the positions to evaluate
+
+        Returns:
+            list: the indexes allowed by the budget of function evaluations, and True when the budget is used up before all of them
+        """
+        n_allowed = self.problem.reserve_evaluations(len(list_idx))
+        return list_idx[:n_allowed], n_allowed < len(list_idx)
+
+    def update_epoch_best(self, pos_list, list_targets):
+        """
+        Keep the best solution evaluated in the current epoch, only when there is a budget of function evaluations
+        (under the lock of the problem: in 'thread' mode get_target_wrapper() runs in the worker threads)
+        """
+        if self.problem.max_evaluations is None:
+            return
+        with self.problem._lock:
+            for pos, target in zip(pos_list, list_targets):
+                if self.epoch_best is None or self.compare_agent([pos, target], self.epoch_best):
+                    self.epoch_best = [np.copy(pos), target]
+
+    def put_cached_targets(self, list_targets, list_keys, list_idx, new_targets):
+        """
+        Fill the missing targets (list_idx) with the new evaluated targets and save them in the cache
+        """
+        for idx, target in zip(list_idx, new_targets):
+            list_targets[idx] = target
+            if list_keys is not None:
+                self.problem.cache.put(list_keys[idx], target)
+        return list_targets
+
+    def get_target_wrapper_batch(self, pos_list):
+        """
+        Args:
+            pos_list (list): list of 1-D numpy array positions
+
+        Returns:
+            list: [[fitness, [obj1, obj2,...]], ...], one target wrapper per position
+        """
+        list_targets, list_keys = self.get_cached_targets(pos_list)
+        list_idx, exhausted = self.reserve_evaluations([idx for idx, target in enumerate(list_targets) if target is None])
+        if len(list_idx) > 0:
+            pos_matrix = np.array([pos_list[idx] for idx in list_idx], dtype=float)
+            token = self.profiler.start()
+            objs_matrix = np.asarray(self.problem.fit_func(pos_matrix), dtype=float).reshape(len(pos_matrix), -1)
+            self.profiler.stop("evaluation", token, n_calls=1, n_positions=len(pos_matrix))
+            fit_list = np.dot(objs_matrix, self.problem.obj_weights)
+            new_targets = [[fit_list[idx], objs_matrix[idx]] for idx in range(0, len(pos_matrix))]
+            self.update_epoch_best(pos_matrix, new_targets)
+            list_targets = self.put_cached_targets(list_targets, list_keys, list_idx, new_targets)
+        if exhausted:
+            raise EvaluationBudgetExhausted(f"Budget of {self.problem.max_evaluations} function evaluations is used up.")
+        return list_targets
+
+    def get_target_wrapper_async(self, pos_list):
+        """
+        Args:
+            pos_list (list): list of 1-D numpy array positions, submitted at once to the event loop of problem.evaluator
+
+        Returns:
+            list: [[fitness, [obj1, obj2,...]], ...], one target wrapper per position
+        """
+        list_targets, list_keys = self.get_cached_targets(pos_list)
+        list_idx, exhausted = self.reserve_evaluations([idx for idx, target in enumerate(list_targets) if target is None])
+        if len(list_idx) > 0:
+            token = self.profiler.start()
+            list_objs = self.problem.evaluator.evaluate_many([self.element_to_list(pos_list[idx], len(pos_list[idx])) for idx in list_idx])
+            self.profiler.stop("evaluation", token, n_calls=len(list_idx), n_positions=len(list_idx))
+            new_targets = []
+            for objs in list_objs:
+                if not self.problem.obj_is_list:
+                    objs = [objs]
+                new_targets.append([np.dot(objs, self.problem.obj_weights), objs])
+            self.update_epoch_best([pos_list[idx] for idx in list_idx], new_targets)
+            list_targets = self.put_cached_targets(list_targets, list_keys, list_idx, new_targets)
+        if exhausted:
+            raise EvaluationBudgetExhausted(f"Budget of {self.problem.max_evaluations} function evaluations is used up.")
+        return list_targets
+
     def element_to_list(self, X, dim):
         x_temp_list = np.zeros((1, dim))
         x_temp_list[0] = X
@@ -153,71 +331,404 @@ class Optimizer:
     def after_evolve(self, epoch):
         pass
 
-    def solve(self, mode='sequential'):
+    def solve(self, mode='sequential', n_workers=None):
         """
         Args:
-            mode (str): 'sequential', 'thread', 'process'.
+            mode (str): 'sequential', 'batch', 'async', 'thread', 'process', 'shared'.
 
                 * 'sequential': recommended for simple and small task (< 10 seconds for calculating objective)
+                * 'batch': recommended for cheap vectorized objectives, needs a batch-capable fit_func (problem.batch_fit)
+                * 'async': recommended for IO bound objectives written as a coroutine function (async def fit_func), the
+                  population is evaluated concurrently by problem.evaluator
                 * 'thread': recommended for IO bound task, or small computing task (< 2 minutes for calculating objective)
                 * 'process': recommended for hard and big task (> 2 minutes for calculating objective)
+                * 'shared': same as 'process', positions exchanged through shared memory, recommended for high-dimensional problems
+
+            n_workers (int): number of workers of the pool in 'thread', 'process' and 'shared' mode, default = number of CPUs
 
         Returns:
             list: [position, fitness value]
         """
         self.mode = mode
-        self.termination_start()
-        self.initialization()
-        self.history.save_initial_best(self.g_best)
-        histogram = []
-        for epoch in range(0, self.epoch):
-            time_epoch = time.perf_counter()
+        if self.mode == "batch" and not self.problem.batch_fit:
+            self.logger.warning("Fitness function is not batch-capable, switch to sequential mode.")
+            self.mode = "sequential"
+        if self.mode == "async" and self.problem.evaluator is None:
+            self.logger.warning("Fitness function is not a coroutine function, switch to sequential mode.")
+            self.mode = "sequential"
+        self.n_workers = os.cpu_count() if n_workers is None else n_workers
+        self.start_workers()
+        try:
+            self.termination_start()
+            self.nfe_start = self.problem.n_evaluations
+            if self.problem.history_dir is not None:
+                self.history.store = HistoryStore(self.problem.history_dir, self.problem.history_keep_every,
+                                                  self.problem.history_keep_last, self.problem.history_chunk_size)
+            if self.checkpoint is None:
+                if self.problem.constraint_handler is not None:
+                    self.problem.constraint_handler.reset()
+                self.initialization()
+                self.history.save_initial_best(self.g_best)
+                self.stagnation.reset(self.g_best[self.ID_TAR][self.ID_FIT])
+                start_epoch, histogram = 0, []
+            else:
+                start_epoch, histogram = self.set_checkpoint_state(self.checkpoint)
+            if self.termination_flag and self.termination.mode == 'FE':
+                self.problem.max_evaluations = self.nfe_start + self.termination.quantity
+            self.checkpoint_time = time.perf_counter()
+            for epoch in range(start_epoch, self.epoch):
+                time_epoch = time.perf_counter()
+                self.epoch_best, budget_exhausted = None, False
+                self.profiler.start_epoch(epoch + 1)
+
+                try:
+                    ## Call before evolve function
+                    self.before_evolve(epoch)
+
+                    ## Evolve method will be called in child class
+                    self.evolve(epoch)
+
+                    ## Call after evolve function
+                    self.after_evolve(epoch)
+                except EvaluationBudgetExhausted:
+                    budget_exhausted = True
+                self.profiler.set_evolve_time(time.perf_counter() - time_epoch)
+
+                # The agents are tracked in the order given by evolve(), the counters then follow the sort of the population
+                fitness = None if self.stagnation.agent_epochs is None else [agent[self.ID_TAR][self.ID_FIT] for agent in self.pop]
+                sorted_index = None
+                # update global best position
+                if budget_exhausted:
+                    # The population may be half updated, only the solutions evaluated in this epoch are used
+                    if self.epoch_best is None:
+                        break
+                    _, self.g_best = self.update_global_best_solution([self.epoch_best])
+                elif self.sort_flag:
+                    self.pop, self.g_best = self.update_global_best_solution(self.pop)  # We sort the population
+                    sorted_index = self.sorted_index
+                else:
+                    _, self.g_best = self.update_global_best_solution(self.pop)  # We don't sort the population
+                    # A Population is sorted in place
+                    if isinstance(self.pop, Population):
+                        sorted_index = self.sorted_index
+                time_epoch = time.perf_counter() - time_epoch
+                with self.profiler.measure("bookkeeping"):
+                    self.track_optimize_step(self.pop, epoch+1, time_epoch)
+                    stagnation = self.stagnation.update(self.history.list_global_best_fit[-1], self.history.list_diversity[-1],
+                                                        fitness, sorted_index)
+
+                    best_solution_in_iteration = self.history.list_current_best[-1][self.ID_TAR][self.ID_FIT]
+                    histogram.append(best_solution_in_iteration)
+                self.profiler.end_epoch(epoch+1, self.history)
+
+                if budget_exhausted:
+                    self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred in the middle of the epoch. End program!")
+                    break
+
+                if self.termination_flag:
+                    if self.termination.mode == 'TB':
+                        if time.perf_counter() - self.count_terminate >= self.termination.quantity:
+                            self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
+                            break
+                    elif self.termination.mode == 'FE':
+                        self.count_terminate = self.problem.n_evaluations - self.nfe_start
+                        if self.count_terminate >= self.termination.quantity:
+                            self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
+                            break
+                    elif self.termination.mode == 'MG':
+                        if (epoch+1) >= self.termination.quantity:
+                            self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
+                            break
+                    else:  # Early Stopping
+                        temp = self.count_terminate + self.stagnation.n_repeated
+                        if temp >= self.termination.quantity:
+                            self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
+                            break
+                if self.handle_stagnation(stagnation):
+                    break
+
+                self.update_checkpoint(epoch, histogram)
+        finally:
+            self.problem.max_evaluations = None
+            self.checkpoint = None
+            self.stop_workers()
+        self.track_optimize_process()
+        return histogram, self.solution[self.ID_POS], self.solution[self.ID_TAR][self.ID_FIT]
 
+    def evolve(self, epoch):
+        pass
 
-            ## Call before evolve function
-            self.before_evolve(epoch)
+    def handle_stagnation(self, stagnation):
+        """
+        Apply the problem "stagnation_action" to the stagnation detected in this epoch and restart the stalled agents
 
-            ## Evolve method will be called in child class
-            self.evolve(epoch)
+        Args:
+            stagnation (str): the stagnation given by self.stagnation.update(), None when there is none
 
-            ## Call after evolve function
-            self.after_evolve(epoch)
+        Returns:
+            bool: True when solve() has to stop
+        """
+        list_idx = self.stagnation.get_stalled_agents()
+        if stagnation is None and len(list_idx) == 0:
+            return False
+        if stagnation is not None and self.problem.stagnation_action == "terminate":
+            self.logger.warning(f"Stagnation of the {stagnation} detected. End program!")
+            return True
+        # The best agent is never restarted
+        list_fit = [agent[self.ID_TAR][self.ID_FIT] for agent in self.pop]
+        idx_best = int(np.argmin(list_fit)) if self.problem.minmax == "min" else int(np.argmax(list_fit))
+        if stagnation is not None:
+            self.logger.info(f"Stagnation of the {stagnation} detected, restart the population.")
+            list_idx = [idx for idx in range(0, len(self.pop)) if idx != idx_best]
+        else:
+            list_idx = [idx for idx in list_idx if idx != idx_best]
+        try:
+            self.restart_agents(list_idx)
+        except EvaluationBudgetExhausted:
+            self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred in the middle of the restart. End program!")
+            return True
+        if stagnation is not None:
+            self.stagnation.restart()
+        else:
+            self.stagnation.restart(list_idx, [self.pop[idx][self.ID_TAR][self.ID_FIT] for idx in list_idx])
+        return False
 
-            # update global best position
-            if self.sort_flag:
-                self.pop, self.g_best = self.update_global_best_solution(self.pop)  # We sort the population
-            else:
-                _, self.g_best = self.update_global_best_solution(self.pop)  # We don't sort the population
-            time_epoch = time.perf_counter() - time_epoch
-            self.track_optimize_step(self.pop, epoch+1, time_epoch)
+    def restart_agents(self, list_idx):
+        """
+        Replace the agents list_idx of the population by new random agents (create_solution()), the other agents keep their place
 
-            best_solution_in_iteration = self.history.list_current_best[-1][self.ID_TAR][self.ID_FIT]
-            histogram.append(best_solution_in_iteration)
+        Args:
+            list_idx (list): indexes of the agents to restart
+        """
+        if len(list_idx) == 0:
+            return
+        pop_new = self.create_population(len(list_idx))
+        for idx, agent in zip(list_idx, pop_new):
+            self.pop[idx] = agent
 
-            if self.termination_flag:
-                if self.termination.mode == 'TB':
-                    if time.perf_counter() - self.count_terminate >= self.termination.quantity:
-                        self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
-                        break
-                elif self.termination.mode == 'FE':
-                    self.count_terminate += self.nfe_per_epoch
-                    if self.count_terminate >= self.termination.quantity:
-                        self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
-                        break
-                elif self.termination.mode == 'MG':
-                    if (epoch+1) >= self.termination.quantity:
-                        self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
-                        break
-                else:  # Early Stopping
-                    temp = self.count_terminate + self.history.get_global_repeated_times(self.ID_TAR, self.ID_FIT, self.EPSILON)
-                    if temp >= self.termination.quantity:
-                        self.logger.warning(f"Stopping criterion with mode {self.termination.name} occurred. End program!")
-                        break
-        self.track_optimize_process()
-        return histogram, self.solution[self.ID_POS], self.solution[self.ID_TAR][self.ID_FIT]
+    def get_algorithm_state(self):
+        """
+        State of the algorithm saved in the checkpoints, override it when the algorithm keeps an attribute that can't be pickled
 
-    def evolve(self, epoch):
-        pass
+        Returns:
+            dict: by default every attribute set by the algorithm (adaptive parameters, archives, memories, ...)
+        """
+        return {key: value for key, value in self.__dict__.items() if key not in self._optimizer_attributes}
+
+    def set_algorithm_state(self, state):
+        """
+        Args:
+            state (dict): state given by get_algorithm_state()
+        """
+        self.__dict__.update(state)
+
+    def update_checkpoint(self, epoch, results):
+        """
+        Save the checkpoint when checkpoint_every epochs or checkpoint_seconds seconds have passed
+
+        Args:
+            epoch (int): the finished iteration
+            results: the results of the previous iterations returned by solve()
+        """
+        if self.problem.checkpoint_file is None:
+            return
+        if (self.problem.checkpoint_every is not None and (epoch + 1) % self.problem.checkpoint_every == 0) or \
+                (self.problem.checkpoint_seconds is not None and time.perf_counter() - self.checkpoint_time >= self.problem.checkpoint_seconds):
+            self.save_checkpoint(self.problem.checkpoint_file, epoch, results)
+            self.checkpoint_time = time.perf_counter()
+
+    def save_checkpoint(self, path, epoch, results):
+        """
+        Args:
+            path (str): path of the checkpoint, written in a temporary file first so an interrupted save keeps the previous checkpoint
+            epoch (int): the finished iteration
+            results: the results of the previous iterations returned by solve()
+        """
+        state = {
+            "algorithm": f"{self.__module__}.{self.__class__.__name__}",
+            "epoch": epoch + 1,
+            "pop": self.pop,
+            "g_best": self.g_best,
+            "results": results,
+            "history": {key: value for key, value in self.history.__dict__.items() if key.startswith("list_")},
+            "store": None if self.history.store is None else self.history.store.get_state(),
+            "nfe": self.problem.n_evaluations - self.nfe_start,
+            "elapsed": time.perf_counter() - self.count_terminate if self.termination_flag and self.termination.mode == 'TB' else None,
+            "random_state": self.generator.bit_generator.state,
+            "seed_sequence": self.seed_sequence,
+            "stagnation": self.stagnation,
+            "constraints": None if self.problem.constraint_handler is None else self.problem.constraint_handler.get_state(),
+            "algorithm_state": self.get_algorithm_state(),
+        }
+        try:
+            with open(path + ".tmp", "wb") as file:
+                pickle.dump(state, file)
+            os.replace(path + ".tmp", path)
+            self.logger.info(f"Checkpoint of epoch {epoch + 1} saved to {path}")
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            self.logger.warning(f"Checkpoint can't be saved, override get_algorithm_state(): {error}")
+
+    def set_checkpoint_state(self, state):
+        """
+        Restore the run saved by save_checkpoint(), called by solve() instead of the initialization
+
+        Returns:
+            list: the next iteration and the results of the previous iterations
+        """
+        self.pop, self.g_best = state["pop"], state["g_best"]
+        for key, value in state["history"].items():
+            setattr(self.history, key, value)
+        if state["store"] is not None:
+            self.history.store = HistoryStore.from_state(state["store"])
+        self.nfe_start = self.problem.n_evaluations - state["nfe"]
+        if state["elapsed"] is not None:
+            self.count_terminate = time.perf_counter() - state["elapsed"]
+        self.generator.bit_generator.state = state["random_state"]
+        self.seed_sequence = state["seed_sequence"]
+        self.stagnation = state["stagnation"]
+        if state["constraints"] is not None:
+            self.problem.constraint_handler.set_state(state["constraints"])
+        self.set_algorithm_state(state["algorithm_state"])
+        return state["epoch"], state["results"]
+
+    def resume(self, path, mode='sequential', n_workers=None):
+        """
+        Continue a run from its checkpoint, the model must be created with the same problem and parameters
+
+        Args:
+            path (str): path of the checkpoint
+            mode (str): same as solve()
+            n_workers (int): same as solve()
+
+        Returns:
+            same as solve()
+        """
+        with open(path, "rb") as file:
+            state = pickle.load(file)
+        if state["algorithm"] != f"{self.__module__}.{self.__class__.__name__}":
+            self.logger.error(f"The checkpoint was saved by {state['algorithm']}, it can't be resumed by {self.__class__.__name__}.")
+            exit(0)
+        self.logger.warning(f"Resume the run from the checkpoint of epoch {state['epoch']}: {path}")
+        self.checkpoint = state
+        return self.solve(mode, n_workers)
+
+    def start_workers(self):
+        """
+        Start the pool of workers used by 'thread', 'process' and 'shared' mode, once per solve() call
+        """
+        if self.mode == "thread":
+            self.executor = parallel.ThreadPoolExecutor(max_workers=self.n_workers)
+        elif self.mode in ("process", "shared"):
+            if self.mode == "shared":
+                workers.prepare_shared_memory()
+            self.executor = parallel.ProcessPoolExecutor(max_workers=self.n_workers, initializer=workers.init_worker, initargs=(self,))
+
+    def stop_workers(self):
+        """
+        Shut down the pool of workers started by start_workers() and release the shared memory
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.shared_buffer is not None:
+            self.shared_buffer.close()
+            self.shared_buffer = None
+
+    def get_target_wrapper_parallel(self, pos_list):
+        """
+        Evaluate the positions with the pool of workers, the positions are dispatched by chunks
+
+        Args:
+            pos_list (list): list of 1-D numpy array positions
+
+        Returns:
+            list: [[fitness, [obj1, obj2,...]], ...], one target wrapper per position
+        """
+        owner = self.executor is None
+        if owner:
+            self.n_workers = os.cpu_count() if self.n_workers is None else self.n_workers
+            self.start_workers()
+        try:
+            if self.mode == "thread":
+                # The threads are not timed, the whole map is timed here
+                token, nfe = self.profiler.start(), self.problem.n_evaluations
+                list_targets = list(self.executor.map(self.get_target_wrapper, pos_list))
+                nfe = self.problem.n_evaluations - nfe
+                self.profiler.stop("evaluation", token, n_calls=nfe, n_positions=nfe)
+                return list_targets
+            # The workers have no cache, the cached positions are not sent to them
+            list_targets, list_keys = self.get_cached_targets(pos_list)
+            list_idx, exhausted = self.reserve_evaluations([idx for idx, target in enumerate(list_targets) if target is None])
+            if len(list_idx) > 0:
+                pos_missing = [pos_list[idx] for idx in list_idx]
+                token = self.profiler.start()
+                if self.mode == "shared":
+                    new_targets = self.get_target_wrapper_shared(pos_missing)
+                elif self.problem.constraint_handler is not None:
+                    list_results = list(self.executor.map(workers.evaluate_positions, workers.split_chunks(pos_missing, self.n_workers)))
+                    new_targets = self.get_penalized_targets(np.vstack([objs_matrix for objs_matrix, _ in list_results]),
+                                                             np.concatenate([violations for _, violations in list_results]))
+                else:
+                    new_targets = []
+                    for chunk_targets in self.executor.map(workers.evaluate_positions, workers.split_chunks(pos_missing, self.n_workers)):
+                        new_targets += chunk_targets
+                # With a batch function (the constraint handler is one), each chunk is one call of the objective function
+                batch_fit = self.problem.batch_fit or self.problem.constraint_handler is not None
+                n_calls = len(workers.split_chunks(pos_missing, self.n_workers)) if batch_fit else len(pos_missing)
+                self.profiler.stop("evaluation", token, n_calls=n_calls, n_positions=len(pos_missing))
+                self.update_epoch_best(pos_missing, new_targets)
+                list_targets = self.put_cached_targets(list_targets, list_keys, list_idx, new_targets)
+            if exhausted:
+                raise EvaluationBudgetExhausted(f"Budget of {self.problem.max_evaluations} function evaluations is used up.")
+            return list_targets
+        finally:
+            if owner:
+                self.stop_workers()
+
+    def get_target_wrapper_shared(self, pos_list):
+        """
+        Evaluate the positions with the pool of workers through the shared memory buffer (grown when needed)
+
+        Args:
+            pos_list (list): list of 1-D numpy array positions
+
+        Returns:
+            list: [[fitness, [obj1, obj2,...]], ...], one target wrapper per position
+        """
+        n_rows = len(pos_list)
+        if self.shared_buffer is None or self.shared_buffer.n_rows < n_rows:
+            if self.shared_buffer is not None:
+                self.shared_buffer.close()
+            # One more column for the violations of a constrained problem
+            n_cols = self.problem.n_objs + (self.problem.constraint_handler is not None)
+            self.shared_buffer = workers.SharedPopulationBuffer(n_rows, self.problem.n_dims, n_cols)
+        self.shared_buffer.positions[:n_rows] = pos_list
+        info = self.shared_buffer.get_info()
+        list_chunks = workers.split_chunks(range(0, n_rows), self.n_workers)
+        list(self.executor.map(workers.evaluate_shared_rows, [info] * len(list_chunks),
+                               [chunk.start for chunk in list_chunks], [chunk.stop for chunk in list_chunks]))
+        objs_matrix = self.shared_buffer.objectives[:n_rows].copy()
+        if self.problem.constraint_handler is not None:
+            return self.get_penalized_targets(objs_matrix[:, :-1], objs_matrix[:, -1])
+        fit_list = np.dot(objs_matrix, self.problem.obj_weights)
+        return [[fit_list[idx], objs_matrix[idx]] for idx in range(0, n_rows)]
+
+    def get_penalized_targets(self, objs_matrix, violations):
+        """
+        Apply the penalties of a constrained problem to the objectives evaluated by the workers of 'process'/'shared' mode:
+        the constraint handler of this process counts the feasible solutions and keeps the adaptive weight (and the worst
+        feasible objective of the deb penalty) of the whole run
+
+        Args:
+            objs_matrix (np.ndarray): (n, n_objs) objectives without penalty
+            violations (np.ndarray): (n,) total violations
+
+        Returns:
+            list: [[fitness, [obj1, obj2,...]], ...], one target wrapper per row
+        """
+        objs_matrix = self.problem.constraint_handler.get_fitness(objs_matrix, violations)
+        fit_list = np.dot(objs_matrix, self.problem.obj_weights)
+        return [[fit_list[idx], objs_matrix[idx]] for idx in range(0, len(objs_matrix))]
 
     def track_optimize_step(self, population=None, epoch=None, runtime=None):
         """
@@ -228,17 +739,30 @@ class Optimizer:
             epoch (int): current iteration
             runtime (float): the runtime for current iteration
         """
-        ## Save history data
-        pop = deepcopy(population)
-        if self.problem.save_population:
-            self.history.list_population.append(pop)
+        ## Save history data, the full population is only copied when save_population is requested (streamed with a store)
+        if self.problem.save_population and self.history.store is None:
+            self.history.list_population.append(deepcopy(population))
         self.history.list_epoch_time.append(runtime)
-        self.history.list_global_best_fit.append(self.history.list_global_best[self.ID_TAR][self.ID_FIT])
-        self.history.list_current_best_fit.append(self.history.list_current_best[self.ID_TAR][self.ID_FIT])
-        # Save the exploration and exploitation data for later usage
-        pos_matrix = np.array([agent[self.ID_POS] for agent in pop])
+        self.history.list_nfe.append(self.problem.n_evaluations - self.nfe_start)
+        self.history.list_global_best_fit.append(self.history.list_global_best[-1][self.ID_TAR][self.ID_FIT])
+        self.history.list_current_best_fit.append(self.history.list_current_best[-1][self.ID_TAR][self.ID_FIT])
+        # Save the exploration and exploitation data for later usage, computed from the positions only
+        if isinstance(population, Population):
+            pos_matrix = population.positions
+        else:
+            pos_matrix = np.array([agent[self.ID_POS] for agent in population])
         div = np.mean(np.abs(np.median(pos_matrix, axis=0) - pos_matrix), axis=0)
         self.history.list_diversity.append(np.mean(div, axis=0))
+        if self.history.store is not None:
+            self.history.store.append(epoch, pos_matrix if self.problem.save_population else None, self.history.list_current_best_fit[-1],
+                                      self.history.list_global_best_fit[-1], self.history.list_diversity[-1], runtime)
+            # The early stopping is counted by self.stagnation, the last 2 solutions are enough
+            self.history.trim_best(2)
+        if self.problem.cache is not None:
+            self.history.list_cache_hits.append(self.problem.cache.hits)
+            self.history.list_cache_misses.append(self.problem.cache.misses)
+        if self.problem.constraint_handler is not None:
+            self.history.list_feasible_ratio.append(self.problem.constraint_handler.update())
         ## Print epoch
         self.logger.info(f">{self._print_model}Epoch: {epoch}, Current best: {self.history.list_current_best[-1][self.ID_TAR][self.ID_FIT]}, "
               f"Global best: {self.history.list_global_best[-1][self.ID_TAR][self.ID_FIT]}, Runtime: {runtime:.5f} seconds")
@@ -254,6 +778,9 @@ class Optimizer:
         self.history.list_global_best = self.history.list_global_best[1:]
         self.history.list_current_best = self.history.list_current_best[1:]
         self.solution = self.history.list_global_best[-1]
+        if self.history.store is not None:
+            self.history.store.close()
+            self.history.list_population = self.history.store.population
 
     def create_population(self, pop_size=None):
         """
@@ -266,18 +793,31 @@ class Optimizer:
         if pop_size is None:
             pop_size = self.pop_size
         pop = []
-        if self.mode == "thread":
-            with parallel.ThreadPoolExecutor() as executor:
-                list_executors = [executor.submit(self.create_solution, self.problem.lb, self.problem.ub) for _ in range(pop_size)]
-                # This method yield the result everytime a thread finished their job (not by order)
-                for f in parallel.as_completed(list_executors):
-                    pop.append(f.result())
-        elif self.mode == "process":
-            with parallel.ProcessPoolExecutor() as executor:
-                list_executors = [executor.submit(self.create_solution, self.problem.lb, self.problem.ub) for _ in range(pop_size)]
-                # This method yield the result everytime a cpu finished their job (not by order).
-                for f in parallel.as_completed(list_executors):
-                    pop.append(f.result())
+        if self.mode == "thread" and self.executor is not None:
+            token, nfe = self.profiler.start(), self.problem.n_evaluations
+            list_executors = [self.executor.submit(self.create_solution, self.problem.lb, self.problem.ub) for _ in range(pop_size)]
+            # This method yield the result everytime a thread finished their job (not by order)
+            for f in parallel.as_completed(list_executors):
+                pop.append(f.result())
+            nfe = self.problem.n_evaluations - nfe
+            self.profiler.stop("evaluation", token, n_calls=nfe, n_positions=nfe)
+        elif self.mode in ("process", "shared") and self.executor is not None:
+            # The workers evaluate the new solutions, so the evaluations are counted here
+            token, n_allowed = self.profiler.start(), self.problem.reserve_evaluations(pop_size)
+            list_sizes = [len(chunk) for chunk in workers.split_chunks(range(0, n_allowed), self.n_workers)]
+            list_seeds = self.spawn_seeds(len(list_sizes))
+            list_executors = [self.executor.submit(workers.create_solutions, size, seed) for size, seed in zip(list_sizes, list_seeds)]
+            # The results are gathered in order, the population doesn't depend on the scheduling of the workers
+            for f in list_executors:
+                if self.problem.constraint_handler is None:
+                    pop += f.result()
+                else:
+                    pos_list, (objs_matrix, violations) = f.result()
+                    pop += [[pos, target] for pos, target in zip(pos_list, self.get_penalized_targets(objs_matrix, violations))]
+            self.profiler.stop("evaluation", token, n_calls=n_allowed, n_positions=n_allowed)
+            if n_allowed < pop_size:
+                self.update_epoch_best([agent[self.ID_POS] for agent in pop], [agent[self.ID_TAR] for agent in pop])
+                raise EvaluationBudgetExhausted(f"Budget of {self.problem.max_evaluations} function evaluations is used up.")
         else:
             pop = [self.create_solution(self.problem.lb, self.problem.ub) for _ in range(0, pop_size)]
         return pop
@@ -292,17 +832,28 @@ class Optimizer:
         Returns:
             list: population with updated fitness value
         """
+        if isinstance(pop, Population):
+            if self.mode == "batch":
+                list_targets = self.get_target_wrapper_batch(pop.positions)
+            elif self.mode == "async":
+                list_targets = self.get_target_wrapper_async(list(pop.positions))
+            elif self.mode in ("thread", "process", "shared"):
+                list_targets = self.get_target_wrapper_parallel(list(pop.positions))
+            else:
+                list_targets = [self.get_target_wrapper(pos) for pos in pop.positions]
+            pop.update_targets([target[self.ID_FIT] for target in list_targets],
+                               [np.ravel(target[self.ID_OBJ]) for target in list_targets])
+            return pop
         pos_list = [agent[self.ID_POS] for agent in pop]
-        if self.mode == "thread":
-            with parallel.ThreadPoolExecutor() as executor:
-                list_results = executor.map(self.get_target_wrapper, pos_list)  # Return result not the future object
-                for idx, target in enumerate(list_results):
-                    pop[idx][self.ID_TAR] = target
-        elif self.mode == "process":
-            with parallel.ProcessPoolExecutor() as executor:
-                list_results = executor.map(self.get_target_wrapper, pos_list)  # Return result not the future object
-                for idx, target in enumerate(list_results):
-                    pop[idx][self.ID_TAR] = target
+        if self.mode == "batch":
+            for idx, target in enumerate(self.get_target_wrapper_batch(pos_list)):
+                pop[idx][self.ID_TAR] = target
+        elif self.mode == "async":
+            for idx, target in enumerate(self.get_target_wrapper_async(pos_list)):
+                pop[idx][self.ID_TAR] = target
+        elif self.mode in ("thread", "process", "shared"):
+            for idx, target in enumerate(self.get_target_wrapper_parallel(pos_list)):
+                pop[idx][self.ID_TAR] = target
         else:
             for idx, pos in enumerate(pos_list):
                 pop[idx][self.ID_TAR] = self.get_target_wrapper(pos)
@@ -318,11 +869,15 @@ class Optimizer:
         Returns:
             Sorted population and global best solution
         """
-        sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT])  # Already returned a new sorted list
-        if self.problem.minmax == "min":
-            return sorted_pop, deepcopy(sorted_pop[0])
-        else:
-            return sorted_pop, deepcopy(sorted_pop[-1])
+        with self.profiler.measure("selection"):
+            if isinstance(pop, Population):
+                pop.sort()  # The best solution comes first for both min and max problem
+                return pop, pop[0]
+            sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT])  # Already returned a new sorted list
+            if self.problem.minmax == "min":
+                return sorted_pop, deepcopy(sorted_pop[0])
+            else:
+                return sorted_pop, deepcopy(sorted_pop[-1])
 
     def get_better_solution(self, agent1: list, agent2: list):
         """
@@ -331,16 +886,50 @@ class Optimizer:
             agent2 (list): Another solution
 
         Returns:
-            The better solution between them
+            The better solution between them (the agent itself, not a copy)
         """
         if self.problem.minmax == "min":
             if agent1[self.ID_TAR][self.ID_FIT] < agent2[self.ID_TAR][self.ID_FIT]:
-                return deepcopy(agent1)
-            return deepcopy(agent2)
+                return agent1
+            return agent2
         else:
             if agent1[self.ID_TAR][self.ID_FIT] < agent2[self.ID_TAR][self.ID_FIT]:
-                return deepcopy(agent2)
-            return deepcopy(agent1)
+                return agent2
+            return agent1
+
+    def get_agent_snapshot(self, agent: list):
+        """
+        Args:
+            agent (list): A solution
+
+        Returns:
+            list: a light copy [position, [fitness, [obj1, obj2, ...]]] of the solution, used by the history
+        """
+        return [np.copy(agent[self.ID_POS]), [agent[self.ID_TAR][self.ID_FIT], np.copy(agent[self.ID_TAR][self.ID_OBJ])]]
+
+    def update_global_best_buffer(self, agent: list):
+        """
+        Copy the solution into the global best solution (self.g_best) in place, the arrays of self.g_best are reused
+
+        Args:
+            agent (list): The new global best solution
+
+        Returns:
+            list: self.g_best
+        """
+        if self.g_best is None or len(self.g_best) < len(agent):
+            self.g_best = deepcopy(agent)
+            return self.g_best
+        for idx, item in enumerate(agent):
+            buffer = self.g_best[idx]
+            if isinstance(item, np.ndarray) and isinstance(buffer, np.ndarray) and item.shape == buffer.shape and item.dtype == buffer.dtype:
+                if item is not buffer:
+                    buffer[...] = item
+            elif idx == self.ID_TAR:
+                self.g_best[idx] = [item[self.ID_FIT], np.copy(item[self.ID_OBJ])]
+            else:
+                self.g_best[idx] = deepcopy(item)
+        return self.g_best
 
     def compare_agent(self, agent_a: list, agent_b: list):
         """
@@ -370,6 +959,13 @@ class Optimizer:
         Returns:
             list: sorted_population, k1 best solutions and k2 worst solutions
         """
+        if isinstance(pop, Population):
+            if best is None and worst is None:
+                exit(0)
+            best_idx, worst_idx = pop.get_special_index(best, worst)
+            list_best = None if best_idx is None else [pop[idx] for idx in best_idx]
+            list_worst = None if worst_idx is None else [pop[idx] for idx in worst_idx]
+            return pop.sort(), list_best, list_worst
         if self.problem.minmax == "min":
             pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT])
         else:
@@ -404,6 +1000,12 @@ class Optimizer:
         """
         Update the global best solution saved in variable named: self.history_list_g_best
 
+        Notes
+        ~~~~~
+        + The history keeps light snapshots of the current/global best solutions, the population is not copied
+        + With save=True, self.g_best is updated in place and returned
+        + self.sorted_index keeps the order of the sort: sorted_pop[i] is pop[self.sorted_index[i]]
+
         Args:
             pop (list): The population of pop_size individuals
             save (bool): True if you want to add new current/global best to history, False if you just want to update current/global best
@@ -411,22 +1013,31 @@ class Optimizer:
         Returns:
             list: Sorted population and the global best solution
         """
-        if self.problem.minmax == "min":
-            sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT])
-        else:
-            sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT], reverse=True)
-        current_best = sorted_pop[0]
-        if save:
-            self.history.list_current_best.append(current_best)
-            better = self.get_better_solution(current_best, self.history.list_global_best[-1])
-            self.history.list_global_best.append(better)
-            return deepcopy(sorted_pop), deepcopy(better)
-        else:
-            local_better = self.get_better_solution(current_best, self.history.list_current_best[-1])
-            self.history.list_current_best[-1] = local_better
-            global_better = self.get_better_solution(current_best, self.history.list_global_best[-1])
-            self.history.list_global_best[-1] = global_better
-            return deepcopy(sorted_pop), deepcopy(global_better)
+        with self.profiler.measure("selection"):
+            if isinstance(pop, Population):
+                self.sorted_index = pop.get_sorted_index()
+                sorted_pop = pop.sort()
+            else:
+                self.sorted_index = sorted(range(0, len(pop)), key=lambda idx: pop[idx][self.ID_TAR][self.ID_FIT],
+                                           reverse=self.problem.minmax != "min")
+                sorted_pop = [pop[idx] for idx in self.sorted_index]
+            current_best = sorted_pop[0]
+            if save:
+                self.history.list_current_best.append(self.get_agent_snapshot(current_best))
+                better = self.get_better_solution(current_best, self.history.list_global_best[-1])
+                if better is current_best:
+                    self.history.list_global_best.append(self.get_agent_snapshot(current_best))
+                else:
+                    self.history.list_global_best.append(better)
+                return sorted_pop, self.update_global_best_buffer(better)
+            else:
+                if self.get_better_solution(current_best, self.history.list_current_best[-1]) is current_best:
+                    self.history.list_current_best[-1] = self.get_agent_snapshot(current_best)
+                global_better = self.get_better_solution(current_best, self.history.list_global_best[-1])
+                if global_better is current_best:
+                    global_better = self.get_agent_snapshot(current_best)
+                    self.history.list_global_best[-1] = global_better
+                return sorted_pop, global_better
 
     ## Selection techniques
     def get_index_roulette_wheel_selection(self, list_fitness: np.array):
@@ -439,18 +1050,34 @@ class Optimizer:
         Returns:
             int: Index of selected solution
         """
+        return int(self.get_index_roulette_wheel_selection_batch(list_fitness, 1)[0])
+
+    def get_index_roulette_wheel_selection_batch(self, list_fitness: np.array, size=1):
+        """
+        Draw size indexes with one cumulative sum and one binary search, same wheel as get_index_roulette_wheel_selection()
+
+        Args:
+            list_fitness (nd.array): 1-D numpy array
+            size (int): The number of selected indexes
+
+        Returns:
+            np.ndarray: 1-D array of size selected indexes
+        """
+        list_fitness = np.asarray(list_fitness, dtype=float)
         scaled_fitness = (list_fitness - np.min(list_fitness)) / (np.ptp(list_fitness) + self.EPSILON)
         if self.problem.minmax == "min":
             final_fitness = 1.0 - scaled_fitness
         else:
             final_fitness = scaled_fitness
-        total_sum = sum(final_fitness)
-        r = np.random.uniform(low=0, high=total_sum)
-        for idx, f in enumerate(final_fitness):
-            r = r + f
-            if r > total_sum:
-                return idx
-        return np.random.choice(range(0, len(list_fitness)))
+        cumsum_fitness = np.cumsum(final_fitness)
+        total_sum = cumsum_fitness[-1]
+        r = self.generator.uniform(low=0, high=total_sum, size=size)
+        # The first index with r + cumsum_fitness[idx] > total_sum
+        list_idx = np.searchsorted(cumsum_fitness, total_sum - r, side="right")
+        out_range = list_idx >= len(list_fitness)
+        if np.any(out_range):
+            list_idx[out_range] = self.generator.integers(0, len(list_fitness), np.sum(out_range))
+        return list_idx
 
     def get_index_kway_tournament_selection(self, pop=None, k_way=0.2, output=2, reverse=False):
         """
@@ -463,21 +1090,38 @@ class Optimizer:
         Returns:
             list: List of the selected indexes
         """
+        list_fitness = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop])
+        return list(self.get_index_kway_tournament_selection_batch(list_fitness, k_way, output, 1, reverse)[0])
+
+    def get_index_kway_tournament_selection_batch(self, list_fitness: np.array, k_way=0.2, output=2, size=1, reverse=False):
+        """
+        Run size tournaments in one pass, each tournament picks k_way distinct solutions
+
+        Args:
+            list_fitness (nd.array): 1-D numpy array, fitness of the population
+            k_way (float/int): The percent or number of solutions are randomized pick
+            output (int): The number of outputs of each tournament
+            size (int): The number of tournaments
+            reverse (bool): set True when finding the worst fitness
+
+        Returns:
+            np.ndarray: 2-D array (size, output) of the selected indexes, from the best to the worst solution
+        """
+        list_fitness = np.asarray(list_fitness, dtype=float)
         if 0 < k_way < 1:
-            k_way = int(k_way * len(pop))
-        list_id = np.random.choice(range(len(pop)), k_way, replace=False)
-        list_parents = [[idx, pop[idx][self.ID_TAR][self.ID_FIT]] for idx in list_id]
-        if self.problem.minmax == "min":
-            list_parents = sorted(list_parents, key=lambda agent: agent[1])
-        else:
-            list_parents = sorted(list_parents, key=lambda agent: agent[1], reverse=True)
+            k_way = int(k_way * len(list_fitness))
+        k_way = min(max(k_way, output), len(list_fitness))
+        # The k_way smallest random keys of each row give k_way distinct solutions
+        list_id = np.argpartition(self.generator.random((size, len(list_fitness))), k_way - 1, axis=1)[:, :k_way]
+        list_fit = list_fitness[list_id] if self.problem.minmax == "min" else -list_fitness[list_id]
+        list_id = np.take_along_axis(list_id, np.argsort(list_fit, axis=1, kind="stable"), axis=1)
         if reverse:
-            return [parent[0] for parent in list_parents[-output:]]
-        return [parent[0] for parent in list_parents[:output]]
+            return list_id[:, -output:]
+        return list_id[:, :output]
 
-    def get_levy_flight_step(self, beta=1.0, multiplier=0.001, case=0):
+    def get_levy_flight_step(self, beta=1.0, multiplier=0.001, case=0, size=None):
         """
-        Get the Levy-flight step size
+        Get the Levy-flight step size, or the steps of a whole epoch at once with size
 
         Args:
             beta (float): Should be in range [0, 2].
@@ -488,28 +1132,16 @@ class Optimizer:
             multiplier (float): default = 0.001
             case (int): Should be one of these value [0, 1, -1].
 
-                * 0: return multiplier * s * np.random.uniform()
-                * 1: return multiplier * s * np.random.normal(0, 1)
+                * 0: return multiplier * s * self.generator.uniform()
+                * 1: return multiplier * s * self.generator.normal(0, 1)
                 * -1: return multiplier * s
 
+            size (int, tuple): None for a single step, i.e: pop_size for one step per agent, (pop_size, n_dims) for one step per dimension
+
         Returns:
-            int: The step size of Levy-flight trajectory
+            float or np.ndarray: The step size of Levy-flight trajectory
         """
-        # u and v are two random variables which follow np.random.normal distribution
-        # sigma_u : standard deviation of u
-        sigma_u = np.power(gamma(1 + beta) * np.sin(np.pi * beta / 2) / (gamma((1 + beta) / 2) * beta * np.power(2, (beta - 1) / 2)), 1 / beta)
-        # sigma_v : standard deviation of v
-        sigma_v = 1
-        u = np.random.normal(0, sigma_u ** 2)
-        v = np.random.normal(0, sigma_v ** 2)
-        s = u / np.power(abs(v), 1 / beta)
-        if case == 0:
-            step = multiplier * s * np.random.uniform()
-        elif case == 1:
-            step = multiplier * s * np.random.normal(0, 1)
-        else:
-            step = multiplier * s
-        return step
+        return levy.get_levy_steps(self.generator, beta, multiplier, case, size)
 
     def levy_flight(self, epoch=None, position=None, g_best_position=None, step=0.001, case=0):
         """
@@ -526,24 +1158,24 @@ class Optimizer:
             The Levy-flight position of current agent
         """
         beta = 1
-        # muy and v are two random variables which follow np.random.normal distribution
+        # muy and v are two random variables which follow normal distribution
         # sigma_muy : standard deviation of muy
-        sigma_muy = np.power(gamma(1 + beta) * np.sin(np.pi * beta / 2) / (gamma((1 + beta) / 2) * beta * np.power(2, (beta - 1) / 2)), 1 / beta)
+        sigma_muy = levy.get_mantegna_sigma(beta)
         # sigma_v : standard deviation of v
         sigma_v = 1
-        muy = np.random.normal(0, sigma_muy ** 2)
-        v = np.random.normal(0, sigma_v ** 2)
+        muy = self.generator.normal(0, sigma_muy ** 2)
+        v = self.generator.normal(0, sigma_v ** 2)
         s = muy / np.power(abs(v), 1 / beta)
-        levy = np.random.uniform(self.problem.lb, self.problem.ub) * step * s * (position - g_best_position)
+        levy_step = self.generator.uniform(self.problem.lb, self.problem.ub) * step * s * (position - g_best_position)
 
         if case == 0:
-            return levy
+            return levy_step
         elif case == 1:
-            return position + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * levy
+            return position + 1.0 / np.sqrt(epoch + 1) * np.sign(self.generator.random() - 0.5) * levy_step
         elif case == 2:
-            return position + np.random.normal(0, 1, len(self.problem.lb)) * levy
+            return position + self.generator.normal(0, 1, len(self.problem.lb)) * levy_step
         elif case == 3:
-            return position + 0.01 * levy
+            return position + 0.01 * levy_step
 
     ### Survivor Selection
     def greedy_selection_population(self, pop_old=None, pop_new=None):
@@ -555,16 +1187,25 @@ class Optimizer:
         Returns:
             The new population with better solutions
         """
-        len_old, len_new = len(pop_old), len(pop_new)
-        if len_old != len_new:
-            self.logger.error("Greedy selection of two population with different length.")
-            exit(0)
-        if self.problem.minmax == "min":
-            return [pop_new[i] if pop_new[i][self.ID_TAR][self.ID_FIT] < pop_old[i][self.ID_TAR][self.ID_FIT]
-                    else pop_old[i] for i in range(len_old)]
-        else:
-            return [pop_new[i] if pop_new[i][self.ID_TAR] > pop_old[i][self.ID_TAR]
-                    else pop_old[i] for i in range(len_old)]
+        with self.profiler.measure("selection"):
+            if isinstance(pop_old, Population) and isinstance(pop_new, Population):
+                if len(pop_old) != len(pop_new):
+                    self.logger.error("Greedy selection of two population with different length.")
+                    exit(0)
+                pop_old = pop_old.copy()
+                pop_old.greedy_selection(pop_new)
+                return pop_old
+            len_old, len_new = len(pop_old), len(pop_new)
+            if len_old != len_new:
+                self.logger.error("Greedy selection of two population with different length.")
+                exit(0)
+            list_fit_old = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop_old])
+            list_fit_new = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop_new])
+            if self.problem.minmax == "min":
+                mask = list_fit_new < list_fit_old
+            else:
+                mask = list_fit_new > list_fit_old
+            return [pop_new[i] if mask[i] else pop_old[i] for i in range(len_old)]
 
     def get_sorted_strim_population(self, pop=None, pop_size=None, reverse=False):
         """
@@ -575,11 +1216,12 @@ class Optimizer:
         Returns:
             The sorted population with pop_size size
         """
-        if self.problem.minmax == "min":
-            pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT], reverse=reverse)
-        else:
-            pop = sorted(pop, key=lambda agent: agent[self.ID_TAR][self.ID_FIT], reverse=reverse)
-        return pop[:pop_size]
+        with self.profiler.measure("selection"):
+            list_fitness = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in pop])
+            if self.problem.minmax != "min":
+                list_fitness = -list_fitness
+            sorted_idx = np.argsort(-list_fitness if reverse else list_fitness, kind="stable")
+            return [pop[idx] for idx in sorted_idx[:pop_size]]
 
     def create_opposition_position(self, agent=None, g_best=None):
         """
@@ -590,7 +1232,7 @@ class Optimizer:
         Returns:
             The opposite position
         """
-        return self.problem.lb + self.problem.ub - g_best[self.ID_POS] + np.random.uniform() * (g_best[self.ID_POS] - agent[self.ID_POS])
+        return self.problem.lb + self.problem.ub - g_best[self.ID_POS] + self.generator.uniform() * (g_best[self.ID_POS] - agent[self.ID_POS])
 
     ### Crossover
     def crossover_arithmetic(self, dad_pos=None, mom_pos=None):
@@ -602,7 +1244,7 @@ class Optimizer:
         Returns:
             list: position of 1st and 2nd child
         """
-        r = np.random.uniform()  # w1 = w2 when r =0.5
+        r = self.generator.uniform()  # w1 = w2 when r =0.5
         w1 = np.multiply(r, dad_pos) + np.multiply((1 - r), mom_pos)
         w2 = np.multiply(r, mom_pos) + np.multiply((1 - r), dad_pos)
         return w1, w2
@@ -624,7 +1266,7 @@ class Optimizer:
         pop_new = []
         for i in range(0, pop_len):
             agent = deepcopy(pop_s1[i])
-            pos_new = pop_s1[i][self.ID_POS] * (1 + np.random.normal(0, 1, self.problem.n_dims))
+            pos_new = pop_s1[i][self.ID_POS] * (1 + self.generator.normal(0, 1, self.problem.n_dims))
             agent[self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append(agent)
         pop_new = self.update_target_wrapper_population(pop_new)
@@ -636,8 +1278,8 @@ class Optimizer:
         pop_new = []
         for i in range(0, pop_len):
             agent = deepcopy(pop_s2[i])
-            pos_new = (g_best[self.ID_POS] - pos_s1_mean) - np.random.random() * \
-                      (self.problem.lb + np.random.random() * (self.problem.ub - self.problem.lb))
+            pos_new = (g_best[self.ID_POS] - pos_s1_mean) - self.generator.random() * \
+                      (self.problem.lb + self.generator.random() * (self.problem.ub - self.problem.lb))
             agent[self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append(agent)
         ## Keep the diversity of populatoin and still improved the exploration
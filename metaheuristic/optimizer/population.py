@@ -0,0 +1,178 @@
+import numpy as np
+
+
+class Population:
+    """
+    Structure-of-arrays container of a population, an alternative to the list of agents used by Optimizer
+
+    Notes
+    ~~~~~
+    + positions: 2-D numpy array with shape (pop_size, n_dims), row i is the position of agent i
+    + fitness: 1-D numpy array with shape (pop_size,)
+    + objectives: 2-D numpy array with shape (pop_size, n_objs)
+    + The best/worst/greedy operations use argsort/argmin on the fitness vector instead of sorting agents
+    + The compatibility view (to_list() and indexing) gives agents in the format [position, [fitness, [obj1, obj2, ...]]]
+      so the evolve() code written for list populations keeps working
+
+    Examples
+    ~~~~~~~~
+    >>> pop = Population.from_list(model.pop, minmax=model.problem.minmax)
+    >>> pop.sort()
+    >>> best_agent = pop[0]
+    >>> model.pop = pop.to_list()
+    """
+
+    ID_POS = 0
+    ID_TAR = 1
+
+    ID_FIT = 0
+    ID_OBJ = 1
+
+    def __init__(self, positions, fitness, objectives=None, minmax="min"):
+        """
+        Args:
+            positions (np.ndarray): 2-D array with shape (pop_size, n_dims)
+            fitness (np.ndarray): 1-D array with shape (pop_size,)
+            objectives (np.ndarray): 2-D array with shape (pop_size, n_objs), default = fitness as a single objective
+            minmax (str): "min" or "max" problem
+        """
+        self.positions = np.array(positions, dtype=float, ndmin=2)
+        self.fitness = np.array(fitness, dtype=float).reshape(len(self.positions))
+        if objectives is None:
+            objectives = self.fitness
+        objectives = np.array(objectives, dtype=float)
+        # The number of objectives is given by the input, so a population without solution is valid too
+        if objectives.ndim == 2:
+            n_objs = objectives.shape[-1]
+        else:
+            n_objs = 1 if len(self.positions) == 0 else objectives.size // len(self.positions)
+        self.objectives = objectives.reshape(len(self.positions), n_objs)
+        self.minmax = minmax
+
+    @classmethod
+    def from_list(cls, pop, minmax="min"):
+        """
+        Args:
+            pop (list): population in the format [[position, [fitness, [obj1, obj2, ...]]], ...]
+            minmax (str): "min" or "max" problem
+
+        Returns:
+            Population: the structure-of-arrays copy of the population
+        """
+        positions = [agent[cls.ID_POS] for agent in pop]
+        fitness = [agent[cls.ID_TAR][cls.ID_FIT] for agent in pop]
+        objectives = [np.ravel(agent[cls.ID_TAR][cls.ID_OBJ]) for agent in pop]
+        return cls(positions, fitness, objectives, minmax)
+
+    def to_list(self):
+        """
+        Returns:
+            list: compatibility view, population in the format [[position, [fitness, [obj1, obj2, ...]]], ...]
+        """
+        return [self[idx] for idx in range(0, len(self))]
+
+    def __len__(self):
+        return len(self.fitness)
+
+    def __getitem__(self, idx):
+        return [self.positions[idx].copy(), [self.fitness[idx], self.objectives[idx].copy()]]
+
+    def __setitem__(self, idx, agent):
+        self.positions[idx] = agent[self.ID_POS]
+        self.fitness[idx] = agent[self.ID_TAR][self.ID_FIT]
+        self.objectives[idx] = np.ravel(agent[self.ID_TAR][self.ID_OBJ])
+
+    def copy(self):
+        return Population(self.positions.copy(), self.fitness.copy(), self.objectives.copy(), self.minmax)
+
+    def update_targets(self, fitness, objectives=None):
+        """
+        Args:
+            fitness (np.ndarray): new fitness vector with shape (pop_size,)
+            objectives (np.ndarray): new objectives matrix with shape (pop_size, n_objs), default = fitness
+        """
+        self.fitness[:] = fitness
+        self.objectives[:] = np.reshape(fitness if objectives is None else objectives, self.objectives.shape)
+
+    def get_sorted_index(self, reverse=False):
+        """
+        Args:
+            reverse (bool): set True to get the worst solution first
+
+        Returns:
+            np.ndarray: indexes of the population from the best to the worst solution
+        """
+        sorted_idx = np.argsort(self.fitness, kind="stable")
+        if self.minmax != "min":
+            sorted_idx = sorted_idx[::-1]
+        return sorted_idx[::-1] if reverse else sorted_idx
+
+    def get_best_index(self):
+        return int(np.argmin(self.fitness)) if self.minmax == "min" else int(np.argmax(self.fitness))
+
+    def get_worst_index(self):
+        return int(np.argmax(self.fitness)) if self.minmax == "min" else int(np.argmin(self.fitness))
+
+    def get_special_index(self, best=3, worst=3):
+        """
+        Args:
+            best (int): number of best solutions, None to skip
+            worst (int): number of worst solutions, None to skip
+
+        Returns:
+            list: indexes of k1 best solutions and k2 worst solutions (best first and worst first)
+        """
+        sorted_idx = self.get_sorted_index()
+        best_idx = None if best is None else sorted_idx[:best]
+        worst_idx = None if worst is None else sorted_idx[::-1][:worst]
+        return best_idx, worst_idx
+
+    def sort(self):
+        """
+        Sort the population in place, the best solution comes first
+
+        Returns:
+            Population: the sorted population itself
+        """
+        sorted_idx = self.get_sorted_index()
+        self.positions = self.positions[sorted_idx]
+        self.fitness = self.fitness[sorted_idx]
+        self.objectives = self.objectives[sorted_idx]
+        return self
+
+    def truncate(self, pop_size):
+        """
+        Keep the first pop_size solutions (call sort() before to keep the best ones)
+        """
+        self.positions = self.positions[:pop_size]
+        self.fitness = self.fitness[:pop_size]
+        self.objectives = self.objectives[:pop_size]
+        return self
+
+    def get_better_mask(self, fitness):
+        """
+        Args:
+            fitness (np.ndarray): fitness vector of the candidate solutions with shape (pop_size,)
+
+        Returns:
+            np.ndarray: boolean mask, True where the candidate is strictly better than the current solution
+        """
+        if self.minmax == "min":
+            return fitness < self.fitness
+        return fitness > self.fitness
+
+    def greedy_selection(self, pop_new):
+        """
+        Replace in place every solution by its candidate in pop_new when the candidate is better
+
+        Args:
+            pop_new (Population): the next population, same size
+
+        Returns:
+            np.ndarray: boolean mask of the replaced solutions
+        """
+        mask = self.get_better_mask(pop_new.fitness)
+        self.positions[mask] = pop_new.positions[mask]
+        self.fitness[mask] = pop_new.fitness[mask]
+        self.objectives[mask] = pop_new.objectives[mask]
+        return mask
@@ -4,8 +4,23 @@
 #       Github: https://github.com/thieu1995        %
 # --------------------------------------------------%
 
+import copy
+import inspect
+import threading
+
 import numpy as np
-from mealpy.utils.logger import Logger
+
+from metaheuristic.optimizer.cache import FitnessCache
+from metaheuristic.optimizer.constraints import ConstraintHandler
+from metaheuristic.optimizer.evaluator import AsyncEvaluator
+from metaheuristic.optimizer.logger import create_logger
+
+
+class EvaluationBudgetExhausted(Exception):
+    """
+    Raised when a position has to be evaluated but the budget of function evaluations (max_evaluations) is used up
+    """
+    pass
 
 
 class Problem:
@@ -26,6 +41,46 @@ class Problem:
         + this parameter can save you from error related to 'memory' when your model is too big (i.e, training neural network, ...)
         + when set to False, you can't use the function draw trajectory chart in history object (model.history.save_trajectory_chart)
     + amend_position(callable): Depend on your problem, may need to design an amend_position function (Optional for continuous domain, Required for discrete domain)
+    + batch_fit (bool): fit_func accepts a (n_solutions, n_dims) matrix and returns one value per row (Optional, default = None).
+        + None: detected automatically by evaluating a 2-row matrix once
+        + True/False: declared by the user, no detection is performed
+    + cache_size (int): keep the fitness of the last cache_size evaluated positions and reuse it for identical positions (Optional, default = None, no cache)
+    + cache_decimals (int): positions are rounded to cache_decimals decimals before the cache lookup (Optional, default = 10)
+    + n_evaluations (int): number of function evaluations done so far, counted by the Optimizer (cache hits are not counted)
+    + n_probe_evaluations (int): number of evaluations done by the checks of fit_func when the problem is created (not
+    counted in n_evaluations), 0 for a problem given by spawn(): pass a Problem to the Optimizer to reuse its checks
+    + generator (np.random.Generator): random generator of generate_position(), the Optimizer sets it to its own generator
+    + max_evaluations (int): budget of function evaluations, set by the Optimizer with the 'FE' termination (None = no budget)
+    + profile_every (int): profile the phases of one epoch every profile_every epochs, saved in history.list_profile (Optional, default = None, no profiling)
+        + 1: every epoch is profiled
+        + k > 1: sampling mode, lower overhead for long runs
+    + history_dir (str): folder of a disk-backed HistoryStore, the populations (save_population) and the best fitness/diversity
+    columns are streamed to it instead of being kept in RAM (Optional, default = None, everything is kept in RAM)
+        + history_keep_every (int): store the population of one epoch every history_keep_every epochs (default = 1)
+        + history_keep_last (int): keep only the populations of the last history_keep_last stored epochs (default = None, keep all)
+        + history_chunk_size (int): number of populations buffered in RAM before being written to disk (default = 100)
+    + checkpoint_file (str): path of the checkpoint saved by solve(), the run can be continued with Optimizer.resume(path)
+    (Optional, default = None, no checkpoint). At least one of these parameters must be set:
+        + checkpoint_every (int): save the checkpoint every checkpoint_every epochs
+        + checkpoint_seconds (float): save the checkpoint when checkpoint_seconds seconds have passed since the last one
+    + fit_func can be a coroutine function (async def), then problem.evaluator (AsyncEvaluator) runs it: the 'async' mode
+    of solve() evaluates the whole population concurrently, the other modes call it synchronously. Optional parameters:
+        + async_max_in_flight (int): maximum number of calls awaited at the same time (default = 16)
+        + async_timeout (float): maximum time in seconds of a call (default = None, no limit)
+        + async_retries (int): number of times a failed or timed out call is tried again (default = 0)
+    + Stagnation detection of solve() (Optional, default = None, disabled), see StagnationTracker:
+        + stagnation_epochs (int): the global best didn't improve for stagnation_epochs epochs
+        + stagnation_diversity (float): the diversity of the population fell under stagnation_diversity * its first value, in (0, 1)
+        + stagnation_action (str): "terminate" stops solve(), "restart" replaces the population by new random agents
+        except the best one (default = "terminate")
+        + stagnation_agent_epochs (int): the agents that didn't improve for stagnation_agent_epochs epochs are replaced by
+        new random agents, whatever stagnation_action
+    + constraints (callable): constraint function of a constrained problem, it takes a (n, n_dims) matrix and returns the
+    (n, n_cons) constraint matrix, g(x) <= 0 for a feasible solution (Optional, default = None). Then fit_func must also
+    accept the (n, n_dims) matrix, problem.constraint_handler (ConstraintHandler) computes the penalized fitness:
+        + penalty (str): "static", "adaptive" or "deb" (feasibility rules), see ConstraintHandler (default = "static")
+        + penalty_weight (float): weight of the static penalty, starting weight of the adaptive one (default = 1e8)
+        + The feasibility ratio of each epoch is saved in history.list_feasible_ratio
 
     Examples
     ~~~~~~~~
@@ -80,15 +135,77 @@ class Problem:
         self.obj_is_list = False
         self.n_dims, self.lb, self.ub = None, None, None
         self.save_population = True
+        self.batch_fit = None
+        self.cache_size, self.cache_decimals, self.cache = None, 10, None
+        self.n_evaluations, self.max_evaluations, self.n_probe_evaluations = 0, None, 0
+        self.generator = np.random.default_rng()
+        self.profile_every = None
+        self.history_dir, self.history_keep_every, self.history_keep_last, self.history_chunk_size = None, 1, None, 100
+        self.checkpoint_file, self.checkpoint_every, self.checkpoint_seconds = None, None, None
+        self.async_max_in_flight, self.async_timeout, self.async_retries, self.evaluator = 16, None, 0, None
+        self.stagnation_epochs, self.stagnation_diversity, self.stagnation_agent_epochs = None, None, None
+        self.stagnation_action = "terminate"
+        self.constraints, self.penalty, self.penalty_weight, self.constraint_handler = None, "static", 1e8, None
+        self._lock = threading.Lock()
         self.__set_keyword_arguments(kwargs)
-        self.logger = Logger(self.log_to, log_file=self.log_file).create_logger(name=f"{__name__}.{__class__.__name__}",
+        self.logger = create_logger(f"{__name__}.{__class__.__name__}", self.log_to, self.log_file,
             format_str='%(asctime)s, %(levelname)s, %(name)s [line: %(lineno)d]: %(message)s')
         self.__check_problem(kwargs)
+        self.__check_async()
+        self.__set_cache()
+        self.__check_profile()
+        self.__check_history_store()
+        self.__check_checkpoint()
+        self.__check_stagnation()
 
     def __set_keyword_arguments(self, kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def spawn(self):
+        """
+        Copy of this validated problem for another optimizer: no check and no probe evaluation of fit_func. The settings
+        (and the async evaluator) are shared, the counters, the cache, the random generator and the constraint handler are new
+
+        Returns:
+            Problem: the new problem
+        """
+        problem = copy.copy(self)
+        problem.n_evaluations, problem.max_evaluations, problem.n_probe_evaluations = 0, None, 0
+        problem._lock = threading.Lock()
+        problem.generator = np.random.default_rng()
+        if self.cache is not None:
+            problem.cache = FitnessCache(self.cache_size, self.cache_decimals)
+        if self.constraint_handler is not None:
+            problem.constraint_handler = self.constraint_handler.spawn()
+            problem.fit_func = problem.constraint_handler
+        return problem
+
+    def reserve_evaluations(self, n_evaluations):
+        """
+        Count the function evaluations before they are done, within the budget of function evaluations
+
+        Args:
+            n_evaluations (int): number of positions to evaluate
+
+        Returns:
+            int: number of positions allowed to be evaluated (less than n_evaluations when the budget is used up)
+        """
+        with self._lock:
+            if self.max_evaluations is not None:
+                n_evaluations = max(0, min(n_evaluations, self.max_evaluations - self.n_evaluations))
+            self.n_evaluations += n_evaluations
+        return n_evaluations
+
     def __check_problem(self, kwargs):
         if ("fit_func" in kwargs) and ("lb" in kwargs) and ("ub" in kwargs):
             self.__set_problem(kwargs)
@@ -141,6 +258,77 @@ class Problem:
             self.logger.error("Lower bound and Upper bound need to be a list and same length.")
             exit(0)
 
+    def __set_cache(self):
+        if self.cache_size is None:
+            return
+        if type(self.cache_size) == int and self.cache_size > 0 and type(self.cache_decimals) == int:
+            self.cache = FitnessCache(self.cache_size, self.cache_decimals)
+        else:
+            self.logger.error("cache_size must be an integer number > 0 and cache_decimals an integer number.")
+            exit(0)
+
+    def __check_profile(self):
+        if self.profile_every is None:
+            return
+        if not (type(self.profile_every) == int and self.profile_every > 0):
+            self.logger.error("profile_every must be an integer number > 0.")
+            exit(0)
+
+    def __check_history_store(self):
+        if self.history_dir is None:
+            return
+        if not isinstance(self.history_dir, str):
+            self.logger.error("history_dir must be a string, the folder of the history store.")
+            exit(0)
+        if not (type(self.history_keep_every) == int and self.history_keep_every > 0 and type(self.history_chunk_size) == int
+                and self.history_chunk_size > 0):
+            self.logger.error("history_keep_every and history_chunk_size must be integer numbers > 0.")
+            exit(0)
+        if not (self.history_keep_last is None or (type(self.history_keep_last) == int and self.history_keep_last > 0)):
+            self.logger.error("history_keep_last must be None or an integer number > 0.")
+            exit(0)
+
+    def __check_checkpoint(self):
+        if self.checkpoint_file is None:
+            return
+        if not isinstance(self.checkpoint_file, str):
+            self.logger.error("checkpoint_file must be a string, the path of the checkpoint.")
+            exit(0)
+        if self.checkpoint_every is None and self.checkpoint_seconds is None:
+            self.logger.error("checkpoint_file needs checkpoint_every (epochs) or checkpoint_seconds (seconds).")
+            exit(0)
+        if not (self.checkpoint_every is None or (type(self.checkpoint_every) == int and self.checkpoint_every > 0)):
+            self.logger.error("checkpoint_every must be None or an integer number > 0.")
+            exit(0)
+        if not (self.checkpoint_seconds is None or (type(self.checkpoint_seconds) in (int, float) and self.checkpoint_seconds > 0)):
+            self.logger.error("checkpoint_seconds must be None or a number > 0.")
+            exit(0)
+
+    def __check_stagnation(self):
+        if not (self.stagnation_epochs is None or (type(self.stagnation_epochs) == int and self.stagnation_epochs > 0)):
+            self.logger.error("stagnation_epochs must be None or an integer number > 0.")
+            exit(0)
+        if not (self.stagnation_agent_epochs is None or (type(self.stagnation_agent_epochs) == int and self.stagnation_agent_epochs > 0)):
+            self.logger.error("stagnation_agent_epochs must be None or an integer number > 0.")
+            exit(0)
+        if not (self.stagnation_diversity is None or (type(self.stagnation_diversity) in (int, float) and 0 < self.stagnation_diversity < 1)):
+            self.logger.error("stagnation_diversity must be None or a number in range (0, 1).")
+            exit(0)
+        if self.stagnation_action not in ("terminate", "restart"):
+            self.logger.error("stagnation_action must be 'terminate' or 'restart'.")
+            exit(0)
+
+    def __check_async(self):
+        if not (type(self.async_max_in_flight) == int and self.async_max_in_flight > 0):
+            self.logger.error("async_max_in_flight must be an integer number > 0.")
+            exit(0)
+        if not (self.async_timeout is None or (type(self.async_timeout) in (int, float) and self.async_timeout > 0)):
+            self.logger.error("async_timeout must be None or a number > 0.")
+            exit(0)
+        if not (type(self.async_retries) == int and self.async_retries >= 0):
+            self.logger.error("async_retries must be an integer number >= 0.")
+            exit(0)
+
     def __check_problem_size(self, n_dims):
         if type(n_dims) == int and n_dims > 1:
             return int(n_dims)
@@ -150,8 +338,12 @@ class Problem:
 
     def __set_fitness_function(self, fit_func, kwargs):
         tested_solution = self.generate_position(self.lb, self.ub)
-        if callable(fit_func):
-            self.fit_func = fit_func
+        if inspect.iscoroutinefunction(fit_func) or inspect.iscoroutinefunction(getattr(fit_func, "__call__", None)):
+            # The 'async' mode awaits the coroutines, the other modes use the synchronous wrapper
+            self.evaluator = AsyncEvaluator(fit_func, self.async_max_in_flight, self.async_timeout, self.async_retries)
+            self.fit_func = self.evaluator.evaluate
+        elif callable(fit_func):
+            self.fit_func = self.__set_constraints(fit_func)
         else:
             self.logger.error("Please enter your 'fit_func' as a callable function, and it needs to return a value or list of values.")
             exit(0)
@@ -162,6 +354,7 @@ class Problem:
                 self.logger.error("Please enter your 'amend_position' as a callable function, and it needs to return amended solution.")
                 exit(0)
         result = self.fit_func(self.element_to_list(tested_solution, len(tested_solution)))
+        self.n_probe_evaluations += 1
         if isinstance(result, list) or isinstance(result, np.ndarray):
             self.n_objs = len(result)
             self.obj_is_list = True
@@ -195,6 +388,39 @@ class Problem:
         else:
             self.logger.error("Fitness function needs to return a single value or a list of values.")
             exit(0)
+        if self.batch_fit is None:
+            self.batch_fit = self.__check_batch_function(tested_solution, result)
+
+    def __set_constraints(self, fit_func):
+        if self.constraints is None:
+            return fit_func
+        if not callable(self.constraints):
+            self.logger.error("Please enter your 'constraints' as a callable function, it takes a (n, n_dims) matrix and returns the (n, n_cons) constraint matrix.")
+            exit(0)
+        if self.penalty not in ConstraintHandler.PENALTIES:
+            self.logger.error(f"penalty must be one of {ConstraintHandler.PENALTIES}.")
+            exit(0)
+        if not (type(self.penalty_weight) in (int, float) and self.penalty_weight > 0):
+            self.logger.error("penalty_weight must be a number > 0.")
+            exit(0)
+        self.constraint_handler = ConstraintHandler(fit_func, self.constraints, self.penalty, self.penalty_weight, self.minmax)
+        return self.constraint_handler
+
+    def __check_batch_function(self, tested_solution, result):
+        """
+        A fit_func is batch-capable when it returns one value per row of the input matrix, so a (2, n_dims) matrix
+        must give back 2 values equal to the value of the single row.
+        """
+        if not self.obj_is_list or self.n_objs != 1:
+            return False
+        self.n_probe_evaluations += 1
+        try:
+            batch_result = self.fit_func(np.vstack([tested_solution, tested_solution]))
+        except Exception:
+            return False
+        if np.shape(batch_result) != (2,):
+            return False
+        return bool(np.allclose(batch_result, result[0], equal_nan=True))
 
     def generate_position(self, lb=None, ub=None):
         """
@@ -207,7 +433,7 @@ class Problem:
         Returns:
             np.array: the position (the solution for the problem)
         """
-        return np.random.uniform(lb, ub)
+        return self.generator.uniform(lb, ub)
 
     def amend_position(self, position=None, lb=None, ub=None):
         """
@@ -0,0 +1,109 @@
+import threading
+import time
+
+
+class PhaseProfiler:
+    """
+    Split the runtime of each epoch of Optimizer.solve() into phases
+
+    Notes
+    ~~~~~
+    + variation: time of before_evolve/evolve/after_evolve minus the evaluation and selection done inside them
+    + evaluation: time spent in the objective function (or waiting for the workers)
+    + selection: sorting, greedy selection and update of the global best solution
+    + bookkeeping: history tracking and logging
+    + n_calls counts the calls of the objective function (a batch call counts once), n_positions the evaluated positions
+    + Only the thread running solve() is timed, nested measures are counted once (the outermost one)
+    + sample_every = k profiles one epoch every k epochs, the other epochs only pay for one attribute check per measure
+    """
+
+    PHASES = ("variation", "evaluation", "selection", "bookkeeping")
+
+    def __init__(self, sample_every=None):
+        """
+        Args:
+            sample_every (int): profile one epoch every sample_every epochs, None to disable the profiler
+        """
+        self.sample_every = sample_every
+        self.active, self._owner, self._depth = False, None, 0
+        self.times, self.n_calls, self.n_positions = dict.fromkeys(self.PHASES, 0.0), 0, 0
+
+    def start_epoch(self, epoch):
+        """
+        Args:
+            epoch (int): current iteration, starts from 1
+        """
+        self.active = self.sample_every is not None and epoch % self.sample_every == 0
+        if self.active:
+            self._owner, self._depth = threading.get_ident(), 0
+            self.times, self.n_calls, self.n_positions = dict.fromkeys(self.PHASES, 0.0), 0, 0
+
+    def start(self):
+        """
+        Returns:
+            float: token given back to stop(), None when this measure is not recorded
+        """
+        if not self.active or threading.get_ident() != self._owner:
+            return None
+        self._depth += 1
+        return time.perf_counter()
+
+    def stop(self, phase, token, n_calls=0, n_positions=0):
+        """
+        Args:
+            phase (str): one of PHASES
+            token (float): value returned by start()
+            n_calls (int): number of calls of the objective function done in this measure
+            n_positions (int): number of positions evaluated in this measure
+        """
+        if token is None:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            self.times[phase] += time.perf_counter() - token
+        self.n_calls += n_calls
+        self.n_positions += n_positions
+
+    def measure(self, phase):
+        """
+        Returns:
+            context manager timing the phase, i.e: with self.profiler.measure("selection"): ...
+        """
+        return _Measure(self, phase)
+
+    def set_evolve_time(self, runtime):
+        """
+        The variation time is what remains of the evolve time once the evaluation and the selection are removed
+
+        Args:
+            runtime (float): time of before_evolve/evolve/after_evolve
+        """
+        if self.active:
+            self.times["variation"] = max(0.0, runtime - self.times["evaluation"] - self.times["selection"])
+
+    def end_epoch(self, epoch, history):
+        """
+        Args:
+            epoch (int): current iteration
+            history (History): the profile of the epoch is appended to history.list_profile
+        """
+        if not self.active:
+            return
+        self.active = False
+        record = {"epoch": epoch}
+        record.update(self.times)
+        record.update({"n_calls": self.n_calls, "n_positions": self.n_positions})
+        history.list_profile.append(record)
+
+
+class _Measure:
+    def __init__(self, profiler, phase):
+        self.profiler, self.phase, self.token = profiler, phase, None
+
+    def __enter__(self):
+        self.token = self.profiler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.stop(self.phase, self.token)
+        return False
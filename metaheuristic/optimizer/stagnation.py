@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class StagnationTracker:
+    """
+    Incremental stagnation detection of Optimizer.solve(), updated once per epoch in O(1) (O(pop_size) for the agents)
+
+    Notes
+    ~~~~~
+    + n_repeated: number of last epochs in a row where the global best fitness didn't change by more than epsilon, the
+      same count as History.get_global_repeated_times() (used by the 'ES' termination) without scanning the history
+    + global_epochs: the global best didn't improve for global_epochs epochs (since the start or the last restart)
+    + diversity_ratio: the diversity of the population fell under diversity_ratio * the diversity of the first epoch
+    + agent_epochs: an agent didn't improve for agent_epochs epochs, see get_stalled_agents(). The agents are tracked by
+      their index in the population given by evolve(), the counters follow the agents when the population is sorted
+      (sorted_index of update()). A population of a new size resets the counters (i.e: linear population reduction)
+    """
+
+    def __init__(self, minmax="min", epsilon=10E-10, global_epochs=None, diversity_ratio=None, agent_epochs=None):
+        """
+        Args:
+            minmax (str): "min" or "max" problem
+            epsilon (float): smallest change of fitness counted as an improvement
+            global_epochs (int): stagnation of the global best after global_epochs epochs, None to disable
+            diversity_ratio (float): collapse of the diversity under diversity_ratio * first diversity, None to disable
+            agent_epochs (int): stagnation of an agent after agent_epochs epochs, None to disable
+        """
+        self.minmax, self.epsilon = minmax, epsilon
+        self.global_epochs, self.diversity_ratio, self.agent_epochs = global_epochs, diversity_ratio, agent_epochs
+        self.reset()
+
+    def reset(self, g_best_fit=None):
+        """
+        Args:
+            g_best_fit (float): fitness of the global best solution of the initial population
+        """
+        self.last_fit, self.n_repeated, self.global_count = g_best_fit, 0, 0
+        self.diversity_start = None
+        self.agent_fits, self.agent_counts = None, None
+
+    def update(self, g_best_fit, diversity=None, fitness=None, sorted_index=None):
+        """
+        Args:
+            g_best_fit (float): fitness of the global best solution after the epoch
+            diversity (float): diversity of the population after the epoch
+            fitness (np.ndarray): fitness of each agent of the population before it is sorted, only needed with agent_epochs
+            sorted_index (list): new order of the agents after the sort of the population (new agent i is the agent
+                sorted_index[i]), None when the population keeps its order
+
+        Returns:
+            str: the detected stagnation ("global best" or "diversity collapse"), None when the search is still moving
+        """
+        if self.last_fit is not None and np.abs(g_best_fit - self.last_fit) <= self.epsilon:
+            self.n_repeated += 1
+            self.global_count += 1
+        else:
+            self.n_repeated, self.global_count = 0, 0
+        self.last_fit = g_best_fit
+        if self.agent_epochs is not None and fitness is not None:
+            fitness = np.asarray(fitness, dtype=float)
+            if self.agent_fits is None or len(self.agent_fits) != len(fitness):
+                self.agent_counts = np.zeros(len(fitness), dtype=int)
+            else:
+                if self.minmax == "min":
+                    improved = fitness < self.agent_fits - self.epsilon
+                else:
+                    improved = fitness > self.agent_fits + self.epsilon
+                self.agent_counts = np.where(improved, 0, self.agent_counts + 1)
+            self.agent_fits = fitness
+            if sorted_index is not None:
+                self.agent_fits, self.agent_counts = self.agent_fits[sorted_index], self.agent_counts[sorted_index]
+        if self.diversity_ratio is not None and diversity is not None:
+            if self.diversity_start is None:
+                self.diversity_start = diversity
+            elif diversity <= self.diversity_ratio * self.diversity_start:
+                return "diversity collapse"
+        if self.global_epochs is not None and self.global_count >= self.global_epochs:
+            return "global best"
+        return None
+
+    def get_stalled_agents(self):
+        """
+        Returns:
+            list: indexes of the agents that didn't improve for agent_epochs epochs
+        """
+        if self.agent_counts is None:
+            return []
+        return np.flatnonzero(self.agent_counts >= self.agent_epochs).tolist()
+
+    def restart(self, list_idx=None, fitness=None):
+        """
+        Reset the counters after a restart, n_repeated (early stopping) is kept
+
+        Args:
+            list_idx (list): indexes of the restarted agents, None when the whole population is restarted
+            fitness (list): fitness of the restarted agents
+        """
+        if list_idx is None:
+            self.global_count = 0
+            self.agent_fits, self.agent_counts = None, None
+        elif self.agent_counts is not None:
+            self.agent_counts[list_idx] = 0
+            self.agent_fits[list_idx] = fitness
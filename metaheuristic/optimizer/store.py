@@ -0,0 +1,226 @@
+import json
+import os
+
+import numpy as np
+
+
+class HistoryStore:
+    """
+    Disk-backed sink of the History: the populations are streamed to disk as float32, the per-epoch columns
+    (current best fitness, global best fitness, diversity, runtime) are saved next to them
+
+    Notes
+    ~~~~~
+    + keep_every: the population of one epoch every keep_every epochs is stored
+    + keep_last: only the populations of the last keep_last stored epochs are kept, in a ring buffer memory-mapped on
+      disk (population.dat). None keeps all of them in chunked files population_xxxxx.npz
+    + chunk_size: number of populations buffered in RAM before they are written to disk (chunked files only),
+      the RAM used is about chunk_size * pop_size * n_dims * 4 bytes
+    + The number of rows is given by the first stored population, the extra agents of a bigger population are dropped
+      and the missing rows of a smaller population are NaN
+    + The store is read lazily: HistoryStore.load(directory), then store.population[idx] only reads the needed file
+
+    Examples
+    ~~~~~~~~
+    >>> store = HistoryStore.load("history/run1")
+    >>> store.epochs, store.columns["global_best_fit"]
+    >>> positions = store.get_positions(-1)  # (pop_size, n_dims) float32 array of the last stored epoch
+    """
+
+    COLUMNS = ("epoch", "current_best_fit", "global_best_fit", "diversity", "runtime")
+
+    def __init__(self, directory, keep_every=1, keep_last=None, chunk_size=100):
+        """
+        Args:
+            directory (str): folder of the store, created when needed
+            keep_every (int): store the population of one epoch every keep_every epochs
+            keep_last (int): keep only the last keep_last stored populations, None to keep all of them
+            chunk_size (int): number of populations buffered in RAM before being written to disk
+        """
+        self.directory, self.keep_every, self.keep_last, self.chunk_size = directory, keep_every, keep_last, chunk_size
+        self.n_rows, self.n_dims = None, None
+        self.columns = {name: [] for name in self.COLUMNS}
+        self.n_chunks, self.n_stored = 0, 0
+        self._buffer, self._buffer_epochs = None, []
+        self._ring, self._ring_epochs = None, None
+        self._chunk_epochs = []
+        os.makedirs(directory, exist_ok=True)
+
+    def append(self, epoch, positions, current_best_fit, global_best_fit, diversity, runtime):
+        """
+        Args:
+            epoch (int): current iteration
+            positions (np.ndarray): positions of the population (pop_size, n_dims), None to only save the columns
+            current_best_fit (float): fitness of the current best solution
+            global_best_fit (float): fitness of the global best solution
+            diversity (float): diversity of the population
+            runtime (float): runtime of the epoch
+        """
+        for name, value in zip(self.COLUMNS, (epoch, current_best_fit, global_best_fit, diversity, runtime)):
+            self.columns[name].append(value)
+        if positions is None or epoch % self.keep_every != 0:
+            return
+        positions = np.asarray(positions, dtype=np.float32)
+        if self.n_rows is None:
+            self.n_rows, self.n_dims = positions.shape
+            if self.keep_last is not None:
+                self._ring = np.memmap(os.path.join(self.directory, "population.dat"), dtype=np.float32, mode="w+",
+                                       shape=(self.keep_last, self.n_rows, self.n_dims))
+                self._ring_epochs = np.full(self.keep_last, -1, dtype=int)
+            else:
+                self._buffer = np.empty((self.chunk_size, self.n_rows, self.n_dims), dtype=np.float32)
+        if self.keep_last is not None:
+            self._write_rows(self._ring, self.n_stored % self.keep_last, positions)
+            self._ring_epochs[self.n_stored % self.keep_last] = epoch
+        else:
+            self._write_rows(self._buffer, len(self._buffer_epochs), positions)
+            self._buffer_epochs.append(epoch)
+            if len(self._buffer_epochs) == self.chunk_size:
+                self.flush()
+        self.n_stored += 1
+
+    def _write_rows(self, block, idx, positions):
+        n_rows = min(self.n_rows, len(positions))
+        block[idx, :n_rows] = positions[:n_rows]
+        block[idx, n_rows:] = np.nan
+
+    def flush(self):
+        """
+        Write the buffered populations and the columns to disk
+        """
+        if self._buffer is not None and len(self._buffer_epochs) > 0:
+            np.savez(os.path.join(self.directory, f"population_{self.n_chunks:05d}.npz"),
+                     epochs=np.array(self._buffer_epochs), positions=self._buffer[:len(self._buffer_epochs)])
+            self._chunk_epochs.append(list(self._buffer_epochs))
+            self.n_chunks += 1
+            self._buffer_epochs = []
+        if self._ring is not None:
+            self._ring.flush()
+            np.save(os.path.join(self.directory, "population_epochs.npy"), self._ring_epochs)
+        np.savez(os.path.join(self.directory, "columns.npz"), **{name: np.array(values) for name, values in self.columns.items()})
+        with open(os.path.join(self.directory, "store.json"), "w") as file:
+            json.dump({"keep_every": self.keep_every, "keep_last": self.keep_last, "chunk_size": self.chunk_size,
+                       "n_rows": self.n_rows, "n_dims": self.n_dims, "chunk_epochs": self._chunk_epochs}, file)
+
+    def close(self):
+        """
+        Flush the store and release the buffers, the store can then be read lazily
+        """
+        self.flush()
+        self._buffer, self._ring = None, None
+
+    def get_state(self):
+        """
+        Returns:
+            dict: state of the store saved in the checkpoints of the Optimizer (the populations of the ring buffer included)
+        """
+        self.flush()
+        return {"directory": self.directory, "keep_every": self.keep_every, "keep_last": self.keep_last,
+                "chunk_size": self.chunk_size, "n_rows": self.n_rows, "n_dims": self.n_dims,
+                "columns": {name: list(values) for name, values in self.columns.items()}, "n_chunks": self.n_chunks,
+                "n_stored": self.n_stored, "chunk_epochs": [list(epochs) for epochs in self._chunk_epochs],
+                "ring": None if self._ring is None else np.array(self._ring),
+                "ring_epochs": None if self._ring_epochs is None else self._ring_epochs.copy()}
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Args:
+            state (dict): state given by get_state(), the files written after it are overwritten by the next epochs
+
+        Returns:
+            HistoryStore: the store in write mode
+        """
+        store = cls(state["directory"], state["keep_every"], state["keep_last"], state["chunk_size"])
+        store.n_rows, store.n_dims = state["n_rows"], state["n_dims"]
+        store.columns = {name: list(values) for name, values in state["columns"].items()}
+        store.n_chunks, store.n_stored, store._chunk_epochs = state["n_chunks"], state["n_stored"], state["chunk_epochs"]
+        if state["ring"] is not None:
+            store._ring = np.memmap(os.path.join(store.directory, "population.dat"), dtype=np.float32, mode="w+",
+                                    shape=(store.keep_last, store.n_rows, store.n_dims))
+            store._ring[:] = state["ring"]
+            store._ring_epochs = state["ring_epochs"].copy()
+        elif store.n_rows is not None and store.keep_last is None:
+            store._buffer = np.empty((store.chunk_size, store.n_rows, store.n_dims), dtype=np.float32)
+        return store
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Args:
+            directory (str): folder of a store written by HistoryStore
+
+        Returns:
+            HistoryStore: the store in read mode, the populations are read lazily
+        """
+        with open(os.path.join(directory, "store.json")) as file:
+            meta = json.load(file)
+        store = cls.__new__(cls)
+        store.directory, store.keep_every, store.keep_last = directory, meta["keep_every"], meta["keep_last"]
+        store.chunk_size, store.n_rows, store.n_dims = meta["chunk_size"], meta["n_rows"], meta["n_dims"]
+        store._chunk_epochs = meta["chunk_epochs"]
+        store._buffer, store._buffer_epochs, store._ring = None, [], None
+        store.n_chunks = len(store._chunk_epochs)
+        with np.load(os.path.join(directory, "columns.npz")) as data:
+            store.columns = {name: data[name] for name in cls.COLUMNS}
+        if store.keep_last is not None and store.n_rows is not None:
+            store._ring_epochs = np.load(os.path.join(directory, "population_epochs.npy"))
+        else:
+            store._ring_epochs = None
+        store.n_stored = len(store.epochs)
+        return store
+
+    @property
+    def epochs(self):
+        """
+        Returns:
+            list: epochs of the stored populations, oldest first
+        """
+        if self._ring_epochs is not None:
+            return sorted(int(epoch) for epoch in self._ring_epochs if epoch >= 0)
+        return [epoch for chunk in self._chunk_epochs for epoch in chunk] + list(self._buffer_epochs)
+
+    def get_positions(self, idx):
+        """
+        Args:
+            idx (int): index of the stored population (negative index allowed), see epochs
+
+        Returns:
+            np.ndarray: float32 positions (n_rows, n_dims) of the stored population
+        """
+        epoch = self.epochs[idx]
+        if self._ring_epochs is not None:
+            slot = int(np.flatnonzero(self._ring_epochs == epoch)[0])
+            ring = np.memmap(os.path.join(self.directory, "population.dat"), dtype=np.float32, mode="r",
+                             shape=(self.keep_last, self.n_rows, self.n_dims))
+            return np.array(ring[slot])
+        for chunk, chunk_epochs in enumerate(self._chunk_epochs):
+            if epoch in chunk_epochs:
+                with np.load(os.path.join(self.directory, f"population_{chunk:05d}.npz")) as data:
+                    return data["positions"][chunk_epochs.index(epoch)]
+        return np.array(self._buffer[self._buffer_epochs.index(epoch)])
+
+    @property
+    def population(self):
+        """
+        Returns:
+            StoredPopulation: lazy list of the stored populations in the format [[position, None], ...]
+        """
+        return StoredPopulation(self)
+
+
+class StoredPopulation:
+    """
+    Lazy sequence of the populations of a HistoryStore, used as History.list_population (i.e. by save_trajectory_chart)
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return len(self.store.epochs)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        return [[pos, None] for pos in self.store.get_positions(idx)]
@@ -0,0 +1,152 @@
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+# Copy of the optimizer owned by the current worker process, set once by init_worker()
+_worker_optimizer = None
+
+
+def init_worker(optimizer):
+    """
+    Initializer of the process pool: the optimizer (and so the objective function) is shipped once per worker
+
+    Args:
+        optimizer: the Optimizer running the solve() call
+    """
+    global _worker_optimizer
+    _worker_optimizer = optimizer
+    # The cache, the budget of function evaluations and the profiler live in the parent
+    _worker_optimizer.problem.cache = None
+    _worker_optimizer.problem.max_evaluations = None
+    _worker_optimizer.profiler.active = False
+    # Forked workers inherit the same global random state (used by stochastic objective functions), draw a fresh one for each worker
+    np.random.seed()
+
+
+def create_solutions(n_solutions, seed):
+    """
+    Args:
+        n_solutions (int): number of solutions created by this task
+        seed (np.random.SeedSequence): child stream of the optimizer given to this task
+
+    Returns:
+        list: solutions created (and evaluated) by the worker. For a constrained problem: the positions, and their
+            objectives and violations given by ConstraintHandler.evaluate(), the parent applies the penalties
+    """
+    _worker_optimizer.generator = np.random.default_rng(seed)
+    _worker_optimizer.problem.generator = _worker_optimizer.generator
+    lb, ub = _worker_optimizer.problem.lb, _worker_optimizer.problem.ub
+    if _worker_optimizer.problem.constraint_handler is not None:
+        pos_list = [_worker_optimizer.amend_position(_worker_optimizer.generate_position(lb, ub), lb, ub) for _ in range(0, n_solutions)]
+        return pos_list, _worker_optimizer.problem.constraint_handler.evaluate(np.array(pos_list, dtype=float))
+    return [_worker_optimizer.create_solution(lb, ub) for _ in range(0, n_solutions)]
+
+
+def evaluate_positions(pos_chunk):
+    """
+    Args:
+        pos_chunk (list): chunk of positions evaluated by this task
+
+    Returns:
+        list: target wrapper [fitness, [obj1, obj2, ...]] of each position. For a constrained problem: the objectives
+            and violations given by ConstraintHandler.evaluate(), the parent applies the penalties
+    """
+    if _worker_optimizer.problem.constraint_handler is not None:
+        return _worker_optimizer.problem.constraint_handler.evaluate(np.array(pos_chunk, dtype=float))
+    if _worker_optimizer.problem.batch_fit:
+        return _worker_optimizer.get_target_wrapper_batch(pos_chunk)
+    return [_worker_optimizer.get_target_wrapper(pos) for pos in pos_chunk]
+
+
+def split_chunks(items, n_workers, chunks_per_worker=4):
+    """
+    Args:
+        items (list): items to dispatch to the workers
+        n_workers (int): number of workers of the pool
+        chunks_per_worker (int): number of chunks given to each worker, more chunks give a better load balance
+
+    Returns:
+        list: list of chunks (consecutive slices of items)
+    """
+    n_chunks = max(1, min(len(items), n_workers * chunks_per_worker))
+    bounds = np.linspace(0, len(items), n_chunks + 1).astype(int)
+    return [items[bounds[idx]:bounds[idx + 1]] for idx in range(0, n_chunks) if bounds[idx] < bounds[idx + 1]]
+
+
+def prepare_shared_memory():
+    """
+    Start the resource tracker of the parent before the workers, so they share it instead of starting their own one
+    (a tracker of a worker would unlink the shared blocks when the worker exits)
+    """
+    resource_tracker.ensure_running()
+
+
+class SharedPopulationBuffer:
+    """
+    Positions matrix and objectives matrix living in shared memory, used by the 'shared' mode of Optimizer.solve()
+
+    Notes
+    ~~~~~
+    + The parent process writes the positions, the workers evaluate row slices in place and write the objectives back
+    + Only the names of the blocks, their shape and the row slices cross the process boundary
+    + For a constrained problem, the last column of the objectives matrix holds the violation of each row
+    """
+
+    def __init__(self, n_rows, n_dims, n_objs):
+        self.n_rows, self.n_dims, self.n_objs = n_rows, n_dims, n_objs
+        self.shm_pos = shared_memory.SharedMemory(create=True, size=n_rows * n_dims * np.dtype(float).itemsize)
+        self.shm_obj = shared_memory.SharedMemory(create=True, size=n_rows * n_objs * np.dtype(float).itemsize)
+        self.positions = np.ndarray((n_rows, n_dims), dtype=float, buffer=self.shm_pos.buf)
+        self.objectives = np.ndarray((n_rows, n_objs), dtype=float, buffer=self.shm_obj.buf)
+
+    def get_info(self):
+        return self.shm_pos.name, self.shm_obj.name, self.n_rows, self.n_dims, self.n_objs
+
+    def close(self):
+        self.positions, self.objectives = None, None
+        for shm in (self.shm_pos, self.shm_obj):
+            shm.close()
+            shm.unlink()
+
+
+# Shared blocks attached by the current worker process: name of the positions block -> [positions block, objectives block]
+_worker_blocks = {}
+
+
+def _attach_buffer(info):
+    pos_name, obj_name, n_rows, n_dims, n_objs = info
+    if pos_name not in _worker_blocks:
+        for blocks in _worker_blocks.values():
+            for shm in blocks:
+                shm.close()
+        _worker_blocks.clear()
+        blocks = []
+        for name in (pos_name, obj_name):
+            # The workers share the resource tracker of the parent, which owns and unlinks the blocks
+            blocks.append(shared_memory.SharedMemory(name=name))
+        _worker_blocks[pos_name] = blocks
+    blocks = _worker_blocks[pos_name]
+    positions = np.ndarray((n_rows, n_dims), dtype=float, buffer=blocks[0].buf)
+    objectives = np.ndarray((n_rows, n_objs), dtype=float, buffer=blocks[1].buf)
+    return positions, objectives
+
+
+def evaluate_shared_rows(info, start, stop):
+    """
+    Evaluate the rows [start, stop) of the shared positions matrix and write their objectives in the shared objectives
+    matrix (for a constrained problem: the objectives without penalty and the violation in the last column)
+
+    Args:
+        info (tuple): names and shape of the shared blocks, given by SharedPopulationBuffer.get_info()
+        start (int): first row
+        stop (int): last row (excluded)
+    """
+    positions, objectives = _attach_buffer(info)
+    if _worker_optimizer.problem.constraint_handler is not None:
+        objectives[start:stop, :-1], objectives[start:stop, -1] = _worker_optimizer.problem.constraint_handler.evaluate(positions[start:stop])
+    elif _worker_optimizer.problem.batch_fit:
+        objs = _worker_optimizer.problem.fit_func(positions[start:stop])
+        objectives[start:stop] = np.reshape(np.asarray(objs, dtype=float), (stop - start, -1))
+    else:
+        for idx in range(start, stop):
+            objectives[idx] = np.ravel(_worker_optimizer.get_target_wrapper(positions[idx])[1])
+    return stop - start
@@ -8,6 +8,7 @@ import numpy as np
 from copy import deepcopy
 
 from metaheuristic.optimizer.optimizer import Optimizer
+from metaheuristic.pso.swarm import Swarm
 
 
 class BasePSO(Optimizer):
@@ -50,12 +51,6 @@ class BasePSO(Optimizer):
     [1] Kennedy, J. and Eberhart, R., 1995, November. Particle swarm optimization. In Proceedings of
     ICNN'95-international conference on neural networks (Vol. 4, pp. 1942-1948). IEEE.
     """
-    ID_POS = 0
-    ID_TAR = 1
-    ID_VEC = 2  # Velocity
-    ID_LOP = 3  # Local position
-    ID_LOF = 4  # Local fitness
-
     def __init__(self, problem, epoch=10000, pop_size=100, c1=2.05, c2=2.05, w_min=0.4, w_max=0.9, **kwargs):
         """
         Args:
@@ -80,24 +75,21 @@ class BasePSO(Optimizer):
         self.v_max = 0.5 * (self.problem.ub - self.problem.lb)
         self.v_min = -self.v_max
 
-    def create_solution(self, lb=None, ub=None):
+    def initialization(self):
+        super().initialization()
+        # The velocities and the personal bests are the arrays of the swarm
+        self.pop = self.create_swarm(self.pop)
+
+    def create_swarm(self, pop):
         """
-        To get the position, fitness wrapper, target and obj list
-            + A[self.ID_POS]                  --> Return: position
-            + A[self.ID_TAR]                  --> Return: [target, [obj1, obj2, ...]]
-            + A[self.ID_TAR][self.ID_FIT]     --> Return: target
-            + A[self.ID_TAR][self.ID_OBJ]     --> Return: [obj1, obj2, ...]
+        Args:
+            pop (list): the population
 
         Returns:
-            list: wrapper of solution with format [position, target, velocity, local_pos, local_fit]
+            Swarm: the swarm of the population with random velocities, each personal best is the particle itself
         """
-        position = self.generate_position(lb, ub)
-        position = self.amend_position(position, lb, ub)
-        target = self.get_target_wrapper(position)
-        velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(target)
-        return [position, target, velocity, local_pos, local_fit]
+        velocities = self.generator.uniform(self.v_min, self.v_max, (len(pop), self.problem.n_dims))
+        return Swarm.from_list(pop, self.problem.minmax, velocities)
 
     def amend_position(self, position=None, lb=None, ub=None):
         """
@@ -112,7 +104,7 @@ class BasePSO(Optimizer):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def evolve(self, epoch):
         """
@@ -123,25 +115,17 @@ class BasePSO(Optimizer):
         """
         # Update weight after each move count  (weight down)
         w = (self.epoch - epoch) / self.epoch * (self.w_max - self.w_min) + self.w_min
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            agent = deepcopy(self.pop[idx])
-            v_new = w * self.pop[idx][self.ID_VEC] + self.c1 * np.random.rand() * \
-                    (self.pop[idx][self.ID_LOP] - self.pop[idx][self.ID_POS]) + \
-                    self.c2 * np.random.rand() * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-            x_new = self.pop[idx][self.ID_POS] + v_new  # Xi(new) = Xi(old) + Vi(new) * deltaT (deltaT = 1)
-            pos_new = self.amend_position(x_new, self.problem.lb, self.problem.ub)
-            agent[self.ID_POS] = pos_new
-            agent[self.ID_VEC] = v_new
-            pop_new.append(agent)
-        pop_new = self.update_target_wrapper_population(pop_new)
-
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
-                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_TAR])
+        swarm = self.pop
+        r1 = self.generator.random((len(swarm), 1))
+        r2 = self.generator.random((len(swarm), 1))
+        v_new = w * swarm.velocities + self.c1 * r1 * (swarm.pbest_positions - swarm.positions) + \
+                self.c2 * r2 * (self.g_best[self.ID_POS] - swarm.positions)
+        x_new = swarm.positions + v_new  # Xi(new) = Xi(old) + Vi(new) * deltaT (deltaT = 1)
+        pos_new = np.array([self.amend_position(x, self.problem.lb, self.problem.ub) for x in x_new])
+        candidates = self.update_target_wrapper_population(swarm.get_candidates(pos_new))
+
+        # Move the particles to their better candidates, then update their personal bests
+        swarm.move(candidates, v_new)
 
 
 class PPSO(Optimizer):
@@ -179,10 +163,6 @@ class PPSO(Optimizer):
     Phasor particle swarm optimization: a simple and efficient variant of PSO. Soft Computing, 23(19), pp.9701-9718.
     """
 
-    ID_VEC = 2  # Velocity
-    ID_LOP = 3  # Local position
-    ID_LOF = 4  # Local fitness
-
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
         Args:
@@ -199,27 +179,23 @@ class PPSO(Optimizer):
         self.v_max = 0.5 * (self.problem.ub - self.problem.lb)
         self.v_min = -self.v_max
 
-        # Dynamic variable
-        self.dyn_delta_list = np.random.uniform(0, 2 * np.pi, self.pop_size)
+    def initialization(self):
+        super().initialization()
+        # The velocities and the personal bests are the arrays of the swarm
+        self.pop = self.create_swarm(self.pop)
+        # Dynamic variable: the phase angle of each particle
+        self.pop.add_array("deltas", self.generator.uniform(0, 2 * np.pi, len(self.pop)))
 
-    def create_solution(self, lb=None, ub=None):
+    def create_swarm(self, pop):
         """
-        To get the position, fitness wrapper, target and obj list
-            + A[self.ID_POS]                  --> Return: position
-            + A[self.ID_TAR]                  --> Return: [target, [obj1, obj2, ...]]
-            + A[self.ID_TAR][self.ID_FIT]     --> Return: target
-            + A[self.ID_TAR][self.ID_OBJ]     --> Return: [obj1, obj2, ...]
+        Args:
+            pop (list): the population
 
         Returns:
-            list: wrapper of solution with format [position, target, velocity, local_pos, local_fit]
+            Swarm: the swarm of the population with random velocities, each personal best is the particle itself
         """
-        position = self.generate_position(lb, ub)
-        position = self.amend_position(position, lb, ub)
-        target = self.get_target_wrapper(position)
-        velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(target)
-        return [position, target, velocity, local_pos, local_fit]
+        velocities = self.generator.uniform(self.v_min, self.v_max, (len(pop), self.problem.n_dims))
+        return Swarm.from_list(pop, self.problem.minmax, velocities)
 
     def evolve(self, epoch):
         """
@@ -228,34 +204,23 @@ class PPSO(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop_new = []
-        for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
-            aa = 2 * (np.sin(self.dyn_delta_list[i]))
-            bb = 2 * (np.cos(self.dyn_delta_list[i]))
-            ee = np.abs(np.cos(self.dyn_delta_list[i])) ** aa
-            tt = np.abs(np.sin(self.dyn_delta_list[i])) ** bb
-
-            v_new = ee * (self.pop[i][self.ID_LOP] - self.pop[i][self.ID_POS]) + tt * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
-            v_new = np.minimum(np.maximum(v_new, -self.v_max), self.v_max)
-            agent[self.ID_VEC] = deepcopy(v_new)
-
-            pos_new = self.pop[i][self.ID_POS] + v_new
-            agent[self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-
-            self.dyn_delta_list[i] += np.abs(aa + bb) * (2 * np.pi)
-            self.v_max = (np.abs(np.cos(self.dyn_delta_list[i])) ** 2) * (self.problem.ub - self.problem.lb)
-            pop_new.append(agent)
+        swarm = self.pop
+        aa = 2 * (np.sin(swarm.deltas))
+        bb = 2 * (np.cos(swarm.deltas))
+        ee = (np.abs(np.cos(swarm.deltas)) ** aa)[:, None]
+        tt = (np.abs(np.sin(swarm.deltas)) ** bb)[:, None]
+        # Maximum velocity of each particle, given by its phase angle
+        v_max = (np.abs(np.cos(swarm.deltas)) ** 2)[:, None] * (self.problem.ub - self.problem.lb)
+
+        v_new = ee * (swarm.pbest_positions - swarm.positions) + tt * (self.g_best[self.ID_POS] - swarm.positions)
+        v_new = np.minimum(np.maximum(v_new, -v_max), v_max)
+        pos_new = np.array([self.amend_position(x, self.problem.lb, self.problem.ub) for x in swarm.positions + v_new])
+        swarm.deltas = swarm.deltas + np.abs(aa + bb) * (2 * np.pi)
         # Update fitness for all solutions
-        pop_new = self.update_target_wrapper_population(pop_new)
+        candidates = self.update_target_wrapper_population(swarm.get_candidates(pos_new))
 
         # Update current position, current velocity and compare with past position, past fitness (local best)
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
-                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_TAR])
+        swarm.move(candidates, v_new)
 
 
 class HPSO_TVAC(PPSO):
@@ -325,41 +290,34 @@ class HPSO_TVAC(PPSO):
             epoch (int): The current iteration
         """
         c_it = ((self.cf - self.ci) * ((epoch + 1) / self.epoch)) + self.ci
-        pop_new = []
-        for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
-            idx_k = np.random.randint(0, self.pop_size)
-            w = np.random.normal()
-            while np.abs(w - 1.0) < 0.01:
-                w = np.random.normal()
-            c1_it = np.abs(w) ** (c_it * w)
-            c2_it = np.abs(1 - w) ** (c_it / (1 - w))
-
-            #################### HPSO
-            v_new = c1_it * np.random.uniform(0, 1, self.problem.n_dims) * (self.pop[i][self.ID_LOP] - self.pop[i][self.ID_POS]) + \
-                    c2_it * np.random.uniform(0, 1, self.problem.n_dims) * \
-                    (self.g_best[self.ID_POS] + self.pop[idx_k][self.ID_LOP] - 2 * self.pop[i][self.ID_POS])
-
-            np.where(v_new == 0, np.sign(0.5 - np.random.uniform()) * np.random.uniform() * self.v_max, v_new)
-            v_new = np.sign(v_new) * np.minimum(np.abs(v_new), self.v_max)
-            #########################
-
-            v_new = np.minimum(np.maximum(v_new, -self.v_max), self.v_max)
-            pos_new = self.pop[i][self.ID_POS] + v_new
-            agent[self.ID_VEC] = v_new
-            agent[self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop_new.append(agent)
-
-            # Update fitness for all solutions
-        pop_new = self.update_target_wrapper_population(pop_new)
+        swarm = self.pop
+        pop_size, n_dims = swarm.positions.shape
+        idx_k = self.generator.integers(0, pop_size, size=pop_size)
+        w = self.generator.normal(size=pop_size)
+        list_idx = np.flatnonzero(np.abs(w - 1.0) < 0.01)
+        while len(list_idx) > 0:
+            w[list_idx] = self.generator.normal(size=len(list_idx))
+            list_idx = list_idx[np.abs(w[list_idx] - 1.0) < 0.01]
+        c1_it = (np.abs(w) ** (c_it * w))[:, None]
+        c2_it = (np.abs(1 - w) ** (c_it / (1 - w)))[:, None]
+
+        #################### HPSO
+        v_new = c1_it * self.generator.uniform(0, 1, (pop_size, n_dims)) * (swarm.pbest_positions - swarm.positions) + \
+                c2_it * self.generator.uniform(0, 1, (pop_size, n_dims)) * \
+                (self.g_best[self.ID_POS] + swarm.pbest_positions[idx_k] - 2 * swarm.positions)
+
+        # A null velocity is replaced by a random one
+        v_rand = np.sign(0.5 - self.generator.uniform(size=(pop_size, 1))) * self.generator.uniform(size=(pop_size, 1)) * self.v_max
+        v_new = np.where(v_new == 0, v_rand, v_new)
+        v_new = np.sign(v_new) * np.minimum(np.abs(v_new), self.v_max)
+        #########################
+
+        pos_new = np.array([self.amend_position(x, self.problem.lb, self.problem.ub) for x in swarm.positions + v_new])
+        # Update fitness for all solutions
+        candidates = self.update_target_wrapper_population(swarm.get_candidates(pos_new))
 
         # Update current position, current velocity and compare with past position, past fitness (local best)
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
-                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_TAR])
+        swarm.move(candidates, v_new)
 
 
 class C_PSO(BasePSO):
@@ -435,9 +393,9 @@ class C_PSO(BasePSO):
     def __get_weights__(self, fit, fit_avg, fit_min):
         temp1 = self.w_min + (self.w_max - self.w_min) * (fit - fit_min) / (fit_avg - fit_min)
         if self.problem.minmax == "min":
-            output = temp1 if fit <= fit_avg else self.w_max
+            output = np.where(fit <= fit_avg, temp1, self.w_max)
         else:
-            output = self.w_max if fit <= fit_avg else temp1
+            output = np.where(fit <= fit_avg, self.w_max, temp1)
         return output
 
     def evolve(self, epoch):
@@ -448,32 +406,23 @@ class C_PSO(BasePSO):
             epoch (int): The current iteration
         """
         nfe_epoch = 0
-        list_fits = [item[self.ID_TAR][self.ID_FIT] for item in self.pop]
-        fit_avg = np.mean(list_fits)
-        fit_min = np.min(list_fits)
-        pop_new = []
-        for i in range(self.pop_size):
-            agent = deepcopy(self.pop[i])
-            w = self.__get_weights__(self.pop[i][self.ID_TAR][self.ID_FIT], fit_avg, fit_min)
-            v_new = w * self.pop[i][self.ID_VEC] + self.c1 * np.random.rand() * (self.pop[i][self.ID_LOP] - self.pop[i][self.ID_POS]) + \
-                    self.c2 * np.random.rand() * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
-            v_new = np.clip(v_new, self.v_min, self.v_max)
-            x_new = self.pop[i][self.ID_POS].astype(float) + v_new
-            agent[self.ID_VEC] = v_new
-            agent[self.ID_POS] = self.amend_position(x_new, self.dyn_lb, self.dyn_ub)
-            pop_new.append(agent)
+        swarm = self.pop
+        fit_avg = np.mean(swarm.fitness)
+        fit_min = np.min(swarm.fitness)
+        w = self.__get_weights__(swarm.fitness, fit_avg, fit_min)[:, None]
+        r1 = self.generator.random((len(swarm), 1))
+        r2 = self.generator.random((len(swarm), 1))
+        v_new = w * swarm.velocities + self.c1 * r1 * (swarm.pbest_positions - swarm.positions) + \
+                self.c2 * r2 * (self.g_best[self.ID_POS] - swarm.positions)
+        v_new = np.clip(v_new, self.v_min, self.v_max)
+        pos_new = np.array([self.amend_position(x, self.dyn_lb, self.dyn_ub) for x in swarm.positions + v_new])
 
         # Update fitness for all solutions
-        pop_new = self.update_target_wrapper_population(pop_new)
-        nfe_epoch += self.pop_size
+        candidates = self.update_target_wrapper_population(swarm.get_candidates(pos_new))
+        nfe_epoch += len(swarm)
 
         # Update current position, current velocity and compare with past position, past fitness (local best)
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
-                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_TAR])
+        swarm.move(candidates, v_new)
 
         ## Implement chaostic local search for the best solution
         g_best = self.g_best
@@ -485,14 +434,14 @@ class C_PSO(BasePSO):
         if self.compare_agent([x_best, target_best], self.g_best):
             g_best = [x_best, target_best]
 
-        r = np.random.rand()
+        r = self.generator.random()
         bound_min = np.stack([self.dyn_lb, g_best[self.ID_POS] - r * (self.dyn_ub - self.dyn_lb)])
         self.dyn_lb = np.max(bound_min, axis=0)
         bound_max = np.stack([self.dyn_ub, g_best[self.ID_POS] + r * (self.dyn_ub - self.dyn_lb)])
         self.dyn_ub = np.min(bound_max, axis=0)
 
-        pop_new_child = self.create_population(self.pop_size - self.N_CLS)
-        self.pop = self.get_sorted_strim_population(self.pop + pop_new_child, self.pop_size)
+        pop_new_child = self.create_swarm(self.create_population(self.pop_size - self.N_CLS))
+        self.pop = swarm.concatenate(pop_new_child).sort().truncate(self.pop_size)
         nfe_epoch += 1 + (self.pop_size - self.N_CLS)
         self.nfe_per_epoch = nfe_epoch
 
@@ -538,10 +487,6 @@ class CL_PSO(Optimizer):
     for global optimization of multimodal functions. IEEE transactions on evolutionary computation, 10(3), pp.281-295.
     """
 
-    ID_VEC = 2
-    ID_LOP = 3
-    ID_LOF = 4
-
     def __init__(self, problem, epoch=10000, pop_size=100, c_local=1.2, w_min=0.4, w_max=0.9, max_flag=7, **kwargs):
         """
         Args:
@@ -566,27 +511,25 @@ class CL_PSO(Optimizer):
         self.v_max = 0.5 * (self.problem.ub - self.problem.lb)
         self.v_min = -self.v_max
 
-        # Dynamic variable
-        self.flags = np.zeros(self.pop_size)
+    def initialization(self):
+        super().initialization()
+        # The velocities and the personal bests are the arrays of the swarm
+        self.pop = self.create_swarm(self.pop)
+        # Learning probability of each particle and number of epochs without a better personal best
+        pci = 0.05 + 0.45 * (np.exp(10 * np.arange(1, len(self.pop) + 1) / len(self.pop)) - 1) / (np.exp(10) - 1)
+        self.pop.add_array("pci", pci)
+        self.pop.add_array("flags", np.zeros(len(self.pop)))
 
-    def create_solution(self, lb=None, ub=None):
+    def create_swarm(self, pop):
         """
-        To get the position, fitness wrapper, target and obj list
-            + A[self.ID_POS]                  --> Return: position
-            + A[self.ID_TAR]                  --> Return: [target, [obj1, obj2, ...]]
-            + A[self.ID_TAR][self.ID_FIT]     --> Return: target
-            + A[self.ID_TAR][self.ID_OBJ]     --> Return: [obj1, obj2, ...]
+        Args:
+            pop (list): the population
 
         Returns:
-            list: wrapper of solution with format [position, target, velocity, local_pos, local_fit]
+            Swarm: the swarm of the population with random velocities, each personal best is the particle itself
         """
-        position = self.generate_position(lb, ub)
-        position = self.amend_position(position, lb, ub)
-        target = self.get_target_wrapper(position)
-        velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(target)
-        return [position, target, velocity, local_pos, local_fit]
+        velocities = self.generator.uniform(self.v_min, self.v_max, (len(pop), self.problem.n_dims))
+        return Swarm.from_list(pop, self.problem.minmax, velocities)
 
     def evolve(self, epoch):
         """
@@ -596,44 +539,23 @@ class CL_PSO(Optimizer):
             epoch (int): The current iteration
         """
         wk = self.w_max * (epoch / self.epoch) * (self.w_max - self.w_min)
-        pop_new = []
-        for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
-            if self.flags[i] >= self.max_flag:
-                self.flags[i] = 0
-                agent = self.create_solution(self.problem.lb, self.problem.ub)
-
-            pci = 0.05 + 0.45 * (np.exp(10 * (i + 1) / self.pop_size) - 1) / (np.exp(10) - 1)
-
-            vec_new = deepcopy(self.pop[i][self.ID_VEC])
-            for j in range(0, self.problem.n_dims):
-                if np.random.rand() > pci:
-                    vj = wk * self.pop[i][self.ID_VEC][j] + self.c_local * np.random.rand() * \
-                         (self.pop[i][self.ID_LOP][j] - self.pop[i][self.ID_POS][j])
-                else:
-                    id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
-                    if self.compare_agent(self.pop[id1], self.pop[id2]):
-                        vj = wk * self.pop[i][self.ID_VEC][j] + self.c_local * np.random.rand() * \
-                             (self.pop[id1][self.ID_LOP][j] - self.pop[i][self.ID_POS][j])
-                    else:
-                        vj = wk * self.pop[i][self.ID_VEC][j] + self.c_local * np.random.rand() * \
-                             (self.pop[id2][self.ID_LOP][j] - self.pop[i][self.ID_POS][j])
-                vec_new[j] = vj
-            vec_new = np.clip(vec_new, self.v_min, self.v_max)
-            pos_new = self.pop[i][self.ID_POS] + vec_new
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            agent[self.ID_VEC] = vec_new
-            agent[self.ID_POS] = pos_new
-            pop_new.append(agent)
-        pop_new = self.update_target_wrapper_population(pop_new)
+        swarm = self.pop
+        # The personal bests that didn't improve for max_flag epochs are replaced by new random solutions
+        list_idx = np.flatnonzero(swarm.flags >= self.max_flag)
+        if len(list_idx) > 0:
+            swarm.flags[list_idx] = 0
+            pop_refresh = self.create_population(len(list_idx))
+            swarm.pbest_positions[list_idx] = [agent[self.ID_POS] for agent in pop_refresh]
+            swarm.pbest_fitness[list_idx] = [agent[self.ID_TAR][self.ID_FIT] for agent in pop_refresh]
+
+        # Exemplar of each dimension: own personal best or personal best of the tournament winner
+        exemplars = swarm.get_exemplars(self.generator, swarm.pci)
+        v_new = wk * swarm.velocities + self.c_local * self.generator.random(swarm.positions.shape) * (exemplars - swarm.positions)
+        v_new = np.clip(v_new, self.v_min, self.v_max)
+        pos_new = np.array([self.amend_position(x, self.problem.lb, self.problem.ub) for x in swarm.positions + v_new])
+        candidates = self.update_target_wrapper_population(swarm.get_candidates(pos_new))
 
         # Update current position, current velocity and compare with past position, past fitness (local best)
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
-                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_TAR])
-                    self.flags[idx] = 0
-                else:
-                    self.flags[idx] += 1
+        mask, mask_pbest = swarm.move(candidates, v_new)
+        swarm.flags[mask_pbest] = 0
+        swarm.flags[mask & ~mask_pbest] += 1
@@ -0,0 +1,163 @@
+import numpy as np
+
+from metaheuristic.DE.strategies import get_distinct_pairs
+from metaheuristic.optimizer.population import Population
+
+
+class Swarm(Population):
+    """
+    Population of the PSO algorithms: the Population arrays plus the velocities and the personal bests of the particles
+
+    Notes
+    ~~~~~
+    + velocities: 2-D numpy array with shape (pop_size, n_dims)
+    + pbest_positions: 2-D numpy array with shape (pop_size, n_dims), best position found by each particle
+    + pbest_fitness: 1-D numpy array with shape (pop_size,), fitness of the personal bests
+    + An algorithm can add its own per-particle arrays with add_array() (i.e: the phase angles of PPSO). Every array
+      follows its particle when the swarm is sorted (update_global_best_solution() sorts a Population in place)
+    + Assigning an agent to a particle (i.e: restart_agents()) also resets its personal best, the velocity is kept
+    """
+
+    def __init__(self, positions, fitness, objectives=None, minmax="min", velocities=None):
+        """
+        Args:
+            positions (np.ndarray): 2-D array with shape (pop_size, n_dims)
+            fitness (np.ndarray): 1-D array with shape (pop_size,)
+            objectives (np.ndarray): 2-D array with shape (pop_size, n_objs), default = fitness as a single objective
+            minmax (str): "min" or "max" problem
+            velocities (np.ndarray): 2-D array with shape (pop_size, n_dims), default = zero velocities
+        """
+        super().__init__(positions, fitness, objectives, minmax)
+        self.velocities = np.zeros(self.positions.shape) if velocities is None else np.array(velocities, dtype=float, ndmin=2)
+        self.pbest_positions = self.positions.copy()
+        self.pbest_fitness = self.fitness.copy()
+        self.list_arrays = ["positions", "fitness", "objectives", "velocities", "pbest_positions", "pbest_fitness"]
+
+    @classmethod
+    def from_list(cls, pop, minmax="min", velocities=None):
+        """
+        Args:
+            pop (list): population in the format [[position, [fitness, [obj1, obj2, ...]]], ...]
+            minmax (str): "min" or "max" problem
+            velocities (np.ndarray): initial velocities, default = zero velocities
+
+        Returns:
+            Swarm: the swarm of the population, each personal best is the particle itself
+        """
+        swarm = super().from_list(pop, minmax)
+        if velocities is not None:
+            swarm.velocities = np.array(velocities, dtype=float, ndmin=2)
+        return swarm
+
+    def add_array(self, name, values):
+        """
+        Args:
+            name (str): name of the attribute
+            values (np.ndarray): array with one row per particle
+        """
+        setattr(self, name, np.asarray(values))
+        self.list_arrays.append(name)
+
+    def __setitem__(self, idx, agent):
+        super().__setitem__(idx, agent)
+        self.pbest_positions[idx] = self.positions[idx]
+        self.pbest_fitness[idx] = self.fitness[idx]
+
+    def select(self, list_idx):
+        """
+        Keep the particles list_idx (in this order) in every array
+
+        Returns:
+            Swarm: the swarm itself
+        """
+        for name in self.list_arrays:
+            setattr(self, name, getattr(self, name)[list_idx])
+        return self
+
+    def copy(self):
+        swarm = Swarm(self.positions, self.fitness, self.objectives, self.minmax)
+        for name in self.list_arrays:
+            setattr(swarm, name, getattr(self, name).copy())
+        swarm.list_arrays = list(self.list_arrays)
+        return swarm
+
+    def sort(self):
+        return self.select(self.get_sorted_index())
+
+    def truncate(self, pop_size):
+        return self.select(slice(0, pop_size))
+
+    def concatenate(self, swarm):
+        """
+        Args:
+            swarm (Swarm): particles to add, with the same arrays
+
+        Returns:
+            Swarm: new swarm with the particles of both swarms
+        """
+        result = self.copy()
+        for name in self.list_arrays:
+            setattr(result, name, np.concatenate([getattr(self, name), getattr(swarm, name)]))
+        return result
+
+    def get_candidates(self, positions):
+        """
+        Args:
+            positions (np.ndarray): 2-D array with shape (pop_size, n_dims), the next positions of the particles
+
+        Returns:
+            Population: the candidate positions, to evaluate with update_target_wrapper_population()
+        """
+        n_rows = len(positions)
+        return Population(positions, np.zeros(n_rows), np.zeros((n_rows, self.objectives.shape[1])), self.minmax)
+
+    def get_better_pbest_mask(self, fitness):
+        """
+        Returns:
+            np.ndarray: boolean mask, True where the fitness is strictly better than the personal best
+        """
+        if self.minmax == "min":
+            return fitness < self.pbest_fitness
+        return fitness > self.pbest_fitness
+
+    def move(self, candidates, velocities):
+        """
+        Greedy move of the swarm: a particle takes its candidate position and velocity when the candidate is better,
+        then its personal best is updated when the candidate is also better than the personal best
+
+        Args:
+            candidates (Population): evaluated candidate positions
+            velocities (np.ndarray): velocities of the candidates
+
+        Returns:
+            tuple: boolean masks of the moved particles and of the updated personal bests
+        """
+        mask = self.greedy_selection(candidates)
+        self.velocities[mask] = velocities[mask]
+        mask_pbest = mask & self.get_better_pbest_mask(self.fitness)
+        self.pbest_positions[mask_pbest] = self.positions[mask_pbest]
+        self.pbest_fitness[mask_pbest] = self.fitness[mask_pbest]
+        return mask, mask_pbest
+
+    def get_exemplars(self, generator, pci):
+        """
+        Comprehensive learning exemplars of CL_PSO drawn for all the particles and dimensions at once: each dimension
+        learns from the personal best of the particle itself with probability 1 - pci, otherwise from the personal
+        best of the winner of a tournament between 2 other particles (compared by their current fitness)
+
+        Args:
+            generator (np.random.Generator): the generator of the optimizer
+            pci (np.ndarray): learning probability of each particle
+
+        Returns:
+            np.ndarray: (pop_size, n_dims) exemplar positions
+        """
+        pop_size, n_dims = self.positions.shape
+        # 2 distinct competitors different from the particle
+        id1, id2 = get_distinct_pairs(generator, pop_size, n_dims)
+        if self.minmax == "min":
+            winner = np.where(self.fitness[id1] < self.fitness[id2], id1, id2)
+        else:
+            winner = np.where(self.fitness[id1] >= self.fitness[id2], id1, id2)
+        exemplars = self.pbest_positions[winner, np.arange(0, n_dims)]
+        return np.where(generator.random((pop_size, n_dims)) > np.asarray(pci)[:, None], self.pbest_positions, exemplars)
@@ -88,11 +88,11 @@ class BaseSBO(Optimizer):
             ### Select a bower using roulette wheel
             idx = self.get_index_roulette_wheel_selection(fit_list)
             ### Calculating Step Size
-            lamda = self.alpha * np.random.uniform()
+            lamda = self.alpha * self.generator.uniform()
             pos_new = self.pop[i][self.ID_POS] + lamda * ((self.pop[idx][self.ID_POS] + self.g_best[self.ID_POS]) / 2 - self.pop[i][self.ID_POS])
             ### Mutation
-            temp = self.pop[i][self.ID_POS] + np.random.normal(0, 1, self.problem.n_dims) * self.sigma
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.p_m, temp, pos_new)
+            temp = self.pop[i][self.ID_POS] + self.generator.normal(0, 1, self.problem.n_dims) * self.sigma
+            pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < self.p_m, temp, pos_new)
             ### In-bound position
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
@@ -164,7 +164,7 @@ class OriginalSBO(BaseSBO):
         Returns:
             f (int): The index of selected solution
         """
-        r = np.random.uniform()
+        r = self.generator.uniform()
         c = np.cumsum(fitness_list)
         f = np.where(r < c)[0][0]
         return f
@@ -198,8 +198,8 @@ class OriginalSBO(BaseSBO):
                 pos_new[j] = self.pop[i][self.ID_POS][j] + lamda * \
                              ((self.pop[idx][self.ID_POS][j] + self.g_best[self.ID_POS][j]) / 2 - self.pop[i][self.ID_POS][j])
                 ### Mutation
-                if np.random.uniform() < self.p_m:
-                    pos_new[j] = self.pop[i][self.ID_POS][j] + np.random.normal(0, 1) * self.sigma[j]
+                if self.generator.uniform() < self.p_m:
+                    pos_new[j] = self.pop[i][self.ID_POS][j] + self.generator.normal(0, 1) * self.sigma[j]
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         self.pop = self.update_target_wrapper_population(pop_new)
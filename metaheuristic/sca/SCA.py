@@ -67,12 +67,12 @@ class BaseSCA(Optimizer):
             a = 2.0
             r1 = a - (epoch + 1) * (a / self.epoch)
             # Update r2, r3, and r4 for Eq. (3.3), remove third loop here
-            r2 = 2 * np.pi * np.random.uniform(0, 1, self.problem.n_dims)
-            r3 = 2 * np.random.uniform(0, 1, self.problem.n_dims)
+            r2 = 2 * np.pi * self.generator.uniform(0, 1, self.problem.n_dims)
+            r3 = 2 * self.generator.uniform(0, 1, self.problem.n_dims)
             # Eq. 3.3, 3.1 and 3.2
             pos_new1 = self.pop[idx][self.ID_POS] + r1 * np.sin(r2) * abs(r3 * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
             pos_new2 = self.pop[idx][self.ID_POS] + r1 * np.cos(r2) * abs(r3 * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < 0.5, pos_new1, pos_new2)
+            pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < 0.5, pos_new1, pos_new2)
             # Check the bound
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
@@ -138,7 +138,7 @@ class OriginalSCA(BaseSCA):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def evolve(self, epoch):
         """
@@ -155,9 +155,9 @@ class OriginalSCA(BaseSCA):
             pos_new = deepcopy(self.pop[idx][self.ID_POS])
             for j in range(self.problem.n_dims):  # j-th dimension
                 # Update r2, r3, and r4 for Eq. (3.3)
-                r2 = 2 * np.pi * np.random.uniform()
-                r3 = 2 * np.random.uniform()
-                r4 = np.random.uniform()
+                r2 = 2 * np.pi * self.generator.uniform()
+                r3 = 2 * self.generator.uniform()
+                r4 = self.generator.uniform()
                 # Eq. 3.3, 3.1 and 3.2
                 if r4 < 0.5:
                     pos_new[j] = pos_new[j] + r1 * np.sin(r2) * abs(r3 * self.g_best[self.ID_POS][j] - pos_new[j])
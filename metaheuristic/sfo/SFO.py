@@ -93,9 +93,9 @@ class BaseSFO(Optimizer):
         pop_new = []
         PD = 1 - self.pop_size / (self.pop_size + self.s_size)
         for i in range(0, self.pop_size):
-            lamda_i = 2 * np.random.uniform() * PD - PD
+            lamda_i = 2 * self.generator.uniform() * PD - PD
             pos_new = self.s_gbest[self.ID_POS] - lamda_i * \
-                (np.random.uniform() * (self.pop[i][self.ID_POS] + self.s_gbest[self.ID_POS]) / 2 - self.pop[i][self.ID_POS])
+                (self.generator.uniform() * (self.pop[i][self.ID_POS] + self.s_gbest[self.ID_POS]) / 2 - self.pop[i][self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         self.pop = self.update_target_wrapper_population(pop_new)
@@ -107,20 +107,20 @@ class BaseSFO(Optimizer):
             alpha = int(self.s_size * np.abs(AP))
             beta = int(self.problem.n_dims * np.abs(AP))
             ### Random np.random.choice number of sardines which will be updated their position
-            list1 = np.random.choice(range(0, self.s_size), alpha)
+            list1 = self.generator.choice(range(0, self.s_size), alpha)
             for i in range(0, self.s_size):
                 if i in list1:
                     #### Random np.random.choice number of dimensions in sardines updated, remove third loop by numpy vector computation
                     pos_new = deepcopy(self.s_pop[i][self.ID_POS])
-                    list2 = np.random.choice(range(0, self.problem.n_dims), beta, replace=False)
-                    pos_new[list2] = (np.random.uniform(0, 1, self.problem.n_dims) *
+                    list2 = self.generator.choice(range(0, self.problem.n_dims), beta, replace=False)
+                    pos_new[list2] = (self.generator.uniform(0, 1, self.problem.n_dims) *
                                       (self.pop[self.ID_POS] - self.s_pop[i][self.ID_POS] + AP))[list2]
                     pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
                     self.s_pop[i] = [pos_new, None]
         else:
             ### Update the position of all sardine using Eq.(9)
             for i in range(0, self.s_size):
-                pos_new = np.random.uniform() * (self.g_best[self.ID_POS] - self.s_pop[i][self.ID_POS] + AP)
+                pos_new = self.generator.uniform() * (self.g_best[self.ID_POS] - self.s_pop[i][self.ID_POS] + AP)
                 self.s_pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         ## Recalculate the fitness of all sardine
         self.s_pop = self.update_target_wrapper_population(self.s_pop)
@@ -223,9 +223,9 @@ class ImprovedSFO(Optimizer):
         pop_new = []
         for i in range(0, self.pop_size):
             PD = 1 - len(self.pop) / (len(self.pop) + len(self.s_pop))
-            lamda_i = 2 * np.random.uniform() * PD - PD
+            lamda_i = 2 * self.generator.uniform() * PD - PD
             pos_new = self.s_gbest[self.ID_POS] - \
-                lamda_i * (np.random.uniform() * (self.g_best[self.ID_POS] + self.s_gbest[self.ID_POS]) / 2 - self.pop[i][self.ID_POS])
+                lamda_i * (self.generator.uniform() * (self.g_best[self.ID_POS] + self.s_gbest[self.ID_POS]) / 2 - self.pop[i][self.ID_POS])
             pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
             pop_new.append([pos_new, None])
         self.pop = self.update_target_wrapper_population(pop_new)
@@ -237,12 +237,12 @@ class ImprovedSFO(Optimizer):
         if AP < 0.5:
             for i in range(0, len(self.s_pop)):
                 temp = (self.g_best[self.ID_POS] + AP) / 2
-                pos_new = self.problem.lb + self.problem.ub - temp + np.random.uniform() * (temp - self.s_pop[i][self.ID_POS])
+                pos_new = self.problem.lb + self.problem.ub - temp + self.generator.uniform() * (temp - self.s_pop[i][self.ID_POS])
                 self.s_pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         else:
             ### Update the position of all sardine using Eq.(9)
             for i in range(0, len(self.s_pop)):
-                pos_new = np.random.uniform() * (self.g_best[self.ID_POS] - self.s_pop[i][self.ID_POS] + AP)
+                pos_new = self.generator.uniform() * (self.g_best[self.ID_POS] - self.s_pop[i][self.ID_POS] + AP)
                 self.s_pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         ## Recalculate the fitness of all sardine
         self.s_pop = self.update_target_wrapper_population(self.s_pop)
@@ -82,19 +82,19 @@ class BaseSHO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
             h = self.h_factor - (epoch + 1.0) * (self.h_factor / self.epoch)
-            rd1 = np.random.uniform(0, 1, self.problem.n_dims)
-            rd2 = np.random.uniform(0, 1, self.problem.n_dims)
+            rd1 = self.generator.uniform(0, 1, self.problem.n_dims)
+            rd2 = self.generator.uniform(0, 1, self.problem.n_dims)
             B = 2 * rd1
             E = 2 * h * rd2 - h
 
-            if np.random.rand() < 0.5:
+            if self.generator.random() < 0.5:
                 D_h = np.abs(np.dot(B, self.g_best[self.ID_POS]) - self.pop[idx][self.ID_POS])
                 pos_new = self.g_best[self.ID_POS] - np.dot(E, D_h)
             else:
                 N = 1
                 for i in range(0, self.N_tried):
-                    pos_temp = self.g_best[self.ID_POS] + np.random.uniform(self.rand_v[0], self.rand_v[1]) * \
-                              np.random.uniform(self.problem.lb, self.problem.ub)
+                    pos_temp = self.g_best[self.ID_POS] + self.generator.uniform(self.rand_v[0], self.rand_v[1]) * \
+                              self.generator.uniform(self.problem.lb, self.problem.ub)
                     pos_temp = self.amend_position(pos_temp, self.problem.lb, self.problem.ub)
                     target = self.get_target_wrapper(pos_temp)
                     if self.compare_agent([pos_temp, target], self.g_best):
@@ -103,7 +103,7 @@ class BaseSHO(Optimizer):
                         break
                     N += 1
                 circle_list = []
-                idx_list = np.random.choice(range(0, self.pop_size), N, replace=False)
+                idx_list = self.generator.choice(range(0, self.pop_size), N, replace=False)
                 for j in range(0, N):
                     D_h = np.abs(np.dot(B, self.g_best[self.ID_POS]) - self.pop[idx_list[j]][self.ID_POS])
                     p_k = self.g_best[self.ID_POS] - np.dot(E, D_h)
@@ -5,8 +5,8 @@
 # --------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 
+from metaheuristic.DE.strategies import get_distinct_indices, get_distinct_pairs
 from metaheuristic.optimizer.optimizer import Optimizer
 
 
@@ -17,7 +17,7 @@ class BaseSMA(Optimizer):
     Notes
     ~~~~~
     + Selected 2 unique and random solution to create new solution (not to create variable) --> remove third loop in original version
-    + Check bound and update fitness after each individual move instead of after the whole population move in the original version
+    + The moves of the whole population are computed at once and evaluated in one batch
     + This version not only faster but also better than the original version
 
     Hyper-parameters should fine tuned in approximate range to get faster convergen toward the global optimum:
@@ -46,8 +46,6 @@ class BaseSMA(Optimizer):
     >>> print(f"Solution: {best_position}, Fitness: {best_fitness}")
     """
 
-    ID_WEI = 2
-
     def __init__(self, problem, epoch=10000, pop_size=100, p_t=0.03, **kwargs):
         """
         Args:
@@ -64,21 +62,6 @@ class BaseSMA(Optimizer):
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = True
 
-    def create_solution(self, lb=None, ub=None):
-        """
-        Args:
-            lb: list of lower bound values
-            ub: list of upper bound values
-
-        Returns:
-            list: [position, target, weight]
-        """
-        position = self.generate_position(lb, ub)
-        position = self.amend_position(position, lb, ub)
-        target = self.get_target_wrapper(position)
-        weight = np.zeros(len(lb))
-        return [position, target, weight]
-
     def evolve(self, epoch):
         """
         The main operations (equations) of algorithm. Inherit from Optimizer class
@@ -86,44 +69,49 @@ class BaseSMA(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        # plus eps to avoid denominator zero
-        s = self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[-1][self.ID_TAR][self.ID_FIT] + self.EPSILON
-
-        # calculate the fitness weight of each slime mold
-        for i in range(0, self.pop_size):
-            # Eq.(2.5)
-            if i <= int(self.pop_size / 2):
-                self.pop[i][self.ID_WEI] = 1 + np.random.uniform(0, 1, self.problem.n_dims) * \
-                    np.log10((self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[i][self.ID_TAR][self.ID_FIT]) / s + 1)
-            else:
-                self.pop[i][self.ID_WEI] = 1 - np.random.uniform(0, 1, self.problem.n_dims) * \
-                    np.log10((self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[i][self.ID_TAR][self.ID_FIT]) / s + 1)
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        weights = self.get_weights(fit_list)
 
         a = np.arctanh(-((epoch + 1) / (self.epoch+1)) + 1)  # Eq.(2.4)
         b = 1 - (epoch + 1) / (self.epoch+1)
 
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            # Update the Position of search agent
-            if np.random.uniform() < self.p_t:  # Eq.(2.7)
-                pos_new = self.generate_position(self.problem.lb, self.problem.ub)
-            else:
-                p = np.tanh(np.abs(self.pop[idx][self.ID_TAR][self.ID_FIT] - self.g_best[self.ID_TAR][self.ID_FIT]))  # Eq.(2.2)
-                vb = np.random.uniform(-a, a, self.problem.n_dims)  # Eq.(2.3)
-                vc = np.random.uniform(-b, b, self.problem.n_dims)
-
-                # two positions randomly selected from population, apply for the whole problem size instead of 1 variable
-                id_a, id_b = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-
-                pos_1 = self.g_best[self.ID_POS] + vb * (self.pop[idx][self.ID_WEI] * self.pop[id_a][self.ID_POS] - self.pop[id_b][self.ID_POS])
-                pos_2 = vc * self.pop[idx][self.ID_POS]
-                pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < p, pos_1, pos_2)
-
-            # Check bound and re-calculate fitness after each individual move
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop_new.append([pos_new, None, np.zeros(self.problem.n_dims)])
+        # Update the Position of all the search agents
+        p = np.tanh(np.abs(fit_list - self.g_best[self.ID_TAR][self.ID_FIT]))  # Eq.(2.2)
+        vb = self.generator.uniform(-a, a, pos_matrix.shape)  # Eq.(2.3)
+        vc = self.generator.uniform(-b, b, pos_matrix.shape)
+        # two positions randomly selected from population, apply for the whole problem size instead of 1 variable
+        id_a, id_b = get_distinct_indices(self.generator, self.pop_size, 2).T
+        pos_1 = self.g_best[self.ID_POS] + vb * (weights * pos_matrix[id_a] - pos_matrix[id_b])
+        pos_2 = vc * pos_matrix
+        pos_new = np.where(self.generator.uniform(0, 1, pos_matrix.shape) < p[:, None], pos_1, pos_2)
+        list_restart = np.flatnonzero(self.generator.uniform(0, 1, self.pop_size) < self.p_t)  # Eq.(2.7)
+        for idx in list_restart:
+            pos_new[idx] = self.generate_position(self.problem.lb, self.problem.ub)
+
+        # Check bound and calculate the fitness of the whole population at once
+        pop_new = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         self.pop = self.update_target_wrapper_population(pop_new)
 
+    def get_weights(self, fit_list):
+        """
+        Eq.(2.5), the weight of each dimension of each slime mould
+
+        Args:
+            fit_list (np.ndarray): fitness of the population
+
+        Returns:
+            np.ndarray: (pop_size, n_dims) weight matrix, bigger than 1 for the best half of the population
+        """
+        sorted_idx = np.argsort(fit_list if self.problem.minmax == "min" else -fit_list, kind="stable")
+        list_rank = np.empty(len(fit_list), dtype=int)
+        list_rank[sorted_idx] = np.arange(0, len(fit_list))
+        # plus eps to avoid denominator zero
+        s = self.g_best[self.ID_TAR][self.ID_FIT] - fit_list[sorted_idx[-1]] + self.EPSILON
+        temp = self.generator.uniform(0, 1, (len(fit_list), self.problem.n_dims)) * \
+            np.log10((self.g_best[self.ID_TAR][self.ID_FIT] - fit_list) / s + 1)[:, None]
+        return np.where((list_rank <= int(len(fit_list) / 2))[:, None], 1 + temp, 1 - temp)
+
 
 class OriginalSMA(BaseSMA):
     """
@@ -164,8 +152,6 @@ class OriginalSMA(BaseSMA):
     stochastic optimization. Future Generation Computer Systems, 111, pp.300-323.
     """
 
-    ID_WEI = 2
-
     def __init__(self, problem, epoch=10000, pop_size=100, p_t=0.03, **kwargs):
         """
         Args:
@@ -184,40 +170,25 @@ class OriginalSMA(BaseSMA):
             epoch (int): The current iteration
         """
 
-        # plus eps to avoid denominator zero
-        s = self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[-1][self.ID_TAR][self.ID_FIT] + self.EPSILON
-
-        # calculate the fitness weight of each slime mold
-        for i in range(0, self.pop_size):
-            # Eq.(2.5)
-            if i <= int(self.pop_size / 2):
-                self.pop[i][self.ID_WEI] = 1 + np.random.uniform(0, 1, self.problem.n_dims) * \
-                    np.log10((self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[i][self.ID_TAR][self.ID_FIT]) / s + 1)
-            else:
-                self.pop[i][self.ID_WEI] = 1 - np.random.uniform(0, 1, self.problem.n_dims) * \
-                    np.log10((self.g_best[self.ID_TAR][self.ID_FIT] - self.pop[i][self.ID_TAR][self.ID_FIT]) / s + 1)
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        weights = self.get_weights(fit_list)
 
         a = np.arctanh(-((epoch + 1) / (self.epoch+1)) + 1)  # Eq.(2.4)
         b = 1 - (epoch + 1) / (self.epoch+1)
 
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            # Update the Position of search agent
-            current_agent = deepcopy(self.pop[idx])
-            if np.random.uniform() < self.p_t:  # Eq.(2.7)
-                current_agent[self.ID_POS] = np.random.uniform(self.problem.lb, self.problem.ub)
-            else:
-                p = np.tanh(np.abs(current_agent[self.ID_TAR][self.ID_FIT] - self.g_best[self.ID_TAR][self.ID_FIT]))  # Eq.(2.2)
-                vb = np.random.uniform(-a, a, self.problem.n_dims)  # Eq.(2.3)
-                vc = np.random.uniform(-b, b, self.problem.n_dims)
-                for j in range(0, self.problem.n_dims):
-                    # two positions randomly selected from population
-                    id_a, id_b = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                    if np.random.uniform() < p:  # Eq.(2.1)
-                        current_agent[self.ID_POS][j] = self.g_best[self.ID_POS][j] + \
-                            vb[j] * (current_agent[self.ID_WEI][j] * self.pop[id_a][self.ID_POS][j] - self.pop[id_b][self.ID_POS][j])
-                    else:
-                        current_agent[self.ID_POS][j] = vc[j] * current_agent[self.ID_POS][j]
-            pos_new = self.amend_position(current_agent[self.ID_POS], self.problem.lb, self.problem.ub)
-            pop_new.append([pos_new, None, np.zeros(self.problem.n_dims)])
+        # Update the Position of all the search agents
+        p = np.tanh(np.abs(fit_list - self.g_best[self.ID_TAR][self.ID_FIT]))  # Eq.(2.2)
+        vb = self.generator.uniform(-a, a, pos_matrix.shape)  # Eq.(2.3)
+        vc = self.generator.uniform(-b, b, pos_matrix.shape)
+        # two positions randomly selected from population for each variable, both different from the agent itself
+        id_a, id_b = get_distinct_pairs(self.generator, self.pop_size, self.problem.n_dims)
+        dims = np.arange(0, self.problem.n_dims)
+        pos_1 = self.g_best[self.ID_POS] + vb * (weights * pos_matrix[id_a, dims] - pos_matrix[id_b, dims])  # Eq.(2.1)
+        pos_2 = vc * pos_matrix
+        pos_new = np.where(self.generator.uniform(0, 1, pos_matrix.shape) < p[:, None], pos_1, pos_2)
+        mask_restart = self.generator.uniform(0, 1, self.pop_size) < self.p_t  # Eq.(2.7)
+        pos_new[mask_restart] = self.generator.uniform(self.problem.lb, self.problem.ub, (np.sum(mask_restart), self.problem.n_dims))
+
+        pop_new = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         self.pop = self.update_target_wrapper_population(pop_new)
@@ -69,8 +69,8 @@ class BaseSSO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
             if idx < self.pop_size / 2:
-                c2_list = np.random.random(self.problem.n_dims)
-                c3_list = np.random.random(self.problem.n_dims)
+                c2_list = self.generator.random(self.problem.n_dims)
+                c3_list = self.generator.random(self.problem.n_dims)
                 pos_new_1 = self.g_best[self.ID_POS] + c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
                 pos_new_2 = self.g_best[self.ID_POS] - c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
                 pos_new = np.where(c3_list < 0.5, pos_new_1, pos_new_2)
@@ -3,10 +3,7 @@
 #       Email: nguyenthieu2102@gmail.com            %
 #       Github: https://github.com/thieu1995        %
 # --------------------------------------------------%
-import math
-
 from matplotlib import pyplot
-from noise import pnoise3, pnoise1
 
 import numpy as np
 from scipy.stats import cauchy
@@ -14,6 +11,8 @@ from copy import deepcopy
 from opfunu.cec_based import F102022, F112022, F12022, F72021, F82022, F12020, F42020, F72022, F92022, F22022, F32022, \
     F42022, F52022, F62022, F122022
 from metaheuristic.optimizer.optimizer import Optimizer
+from metaheuristic.optimizer.levy import get_uniform_levy_steps
+from metaheuristic.triangle.strategies import get_perlin_noise, get_top_centroid, get_random_centroids
 
 class TCO(Optimizer):
 
@@ -31,14 +30,11 @@ class TCO(Optimizer):
         self.sort_flag = False
 
     def perlin(self, current_position):
-        perlin_values = []
-        for i in range(self.problem.n_dims):
-            perlin_values.append(
-                pnoise1(current_position[i]))  # Use pnoise2() or pnoise3() for 2D or 3D noise respectively
-        return perlin_values
+        # Perlin noise of each dimension, of all the agents at once for a (pop_size, n_dims) matrix
+        return get_perlin_noise(current_position)
 
     def _mutation__(self, current_pos, new_pos):
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
+        pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
         return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
 
     def evolve(self, epoch):
@@ -48,37 +44,26 @@ class TCO(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop = []
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        for idx in range(0, self.pop_size):
-            idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-
-
-            centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] +pop_sorted[2][self.ID_POS]) / 3
-            centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + self.pop[idx_list[1]][self.ID_POS] ) / 3
-
-            if np.random.uniform(0, 1) < self.sp:
-                pos_new = self.pop[idx][self.ID_POS] + np.random.binomial(n=1, p=self.mp, size=[self.problem.n_dims]) *  self.levy_step() * (centroid  - self.pop[idx][self.ID_POS])
-            else:
-                pos_new = self.pop[idx][self.ID_POS] +  self.perlin(self.pop[idx][self.ID_POS]) * (centroid2 - self.pop[idx][self.ID_POS])
-
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop.append([pos_new, None])
-
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        # Centroid of the 3 best agents, and centroid of 3 random other agents of each agent
+        centroid = get_top_centroid(pos_matrix, fit_list, self.problem.minmax)
+        centroid2 = get_random_centroids(self.generator, pos_matrix)
+
+        # Both moves of all the agents, each agent takes the Levy move with probability sp, the Perlin move otherwise
+        pos_levy = pos_matrix + self.generator.binomial(n=1, p=self.mp, size=pos_matrix.shape) * \
+                   self.levy_step(len(pos_matrix))[:, None] * (centroid - pos_matrix)
+        pos_perlin = pos_matrix + self.perlin(pos_matrix) * (centroid2 - pos_matrix)
+        pos_new = np.where(self.generator.uniform(0, 1, (len(pos_matrix), 1)) < self.sp, pos_levy, pos_perlin)
+
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
         self.pop = self.greedy_selection_population(self.pop, pop)
 
-    def levy_step(self):
+    def levy_step(self, size=None):
         alpha = self.alpha#1.5  # Parameter controlling the tail heaviness (typically > 1)
-        sigma = (math.gamma(1 + alpha) * np.sin(math.pi * alpha / 2) / (
-                    math.gamma((1 + alpha) / 2) * alpha * (2 ** ((alpha - 1) / 2)))) ** (1 / alpha)
-
-        # Generate a step length
-        u = np.random.uniform(0,1)  # Random number from a uniform distribution [0, 1]
-        v = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-
-        return (u / abs(v) ** (1 / alpha)) * sigma
+        # Generate a step length (or size steps at once), sigma is computed once for each alpha
+        return get_uniform_levy_steps(self.generator, alpha, size)
 
 
 
@@ -106,15 +91,13 @@ class TCO1(Optimizer):
         self.sort_flag = False
 
     def perlin(self, current_position):
-        perlin_values = []
-        for i in range(self.problem.n_dims):
-            perlin_values.append(
-                pnoise1(current_position[i]))  # Use pnoise2() or pnoise3() for 2D or 3D noise respectively
-        return perlin_values
+        # Perlin noise of each dimension, of all the agents at once for a (pop_size, n_dims) matrix
+        return get_perlin_noise(current_position)
 
     def _mutation__(self, current_pos, new_pos):
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
-        return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
+        # Crossover of all the agents at once: each variable keeps the current position with probability cr
+        pos_new = np.where(self.generator.uniform(0, 1, current_pos.shape) < self.cr, current_pos, new_pos)
+        return np.array([self.amend_position(pos, self.problem.lb, self.problem.ub) for pos in pos_new])
 
     def evolve(self, epoch):
         """
@@ -123,44 +106,26 @@ class TCO1(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop = []
-        for idx in range(0, self.pop_size):
-            #idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-            idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        # Centroid of the 3 best agents
+        centroid = get_top_centroid(pos_matrix, fit_list, self.problem.minmax)
 
-            pop_sorted = self.get_sorted_strim_population(self.pop)
-
-            centroid = (self.g_best[self.ID_POS] + self.pop[idx_list[0]][self.ID_POS] + self.pop[idx_list[1]][self.ID_POS]) / 3
-            centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] + pop_sorted[2][self.ID_POS]) / 3
-            #centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] + self.pop[idx_list[0]][self.ID_POS]) / 3
-
-            #pos_new = self.pop[idx][self.ID_POS] + self.levy_step() * (centroid - self.pop[idx][self.ID_POS])
-            pos_new = self.pop[idx][self.ID_POS] + self.levy_step() * (centroid - self.pop[idx][self.ID_POS])
-            self.cr = 0.7
-            #self.cr = 0.0
-            self.cr = 0.6
-            #pnoise3()
-
-            pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-
-            pop.append([pos_new, None])
+        pos_new = pos_matrix + self.levy_step(len(pos_matrix))[:, None] * (centroid - pos_matrix)
+        self.cr = 0.6
+        pos_new = self._mutation__(pos_matrix, pos_new)
 
+        pop = [[pos, None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
         # create new pop by comparing fitness of corresponding each member in pop and children
         self.pop = self.greedy_selection_population(self.pop, pop)
 
 
-    def levy_step(self):
+    def levy_step(self, size=None):
         alpha = 1.5#1.5  # Parameter controlling the tail heaviness (typically > 1)
-        sigma = (math.gamma(1 + alpha) * np.sin(math.pi * alpha / 2) / (
-                    math.gamma((1 + alpha) / 2) * alpha * (2 ** ((alpha - 1) / 2)))) ** (1 / alpha)
-
-        # Generate a step length
-        u = np.random.uniform(0,1)  # Random number from a uniform distribution [0, 1]
-        v = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-
-        return (u / abs(v) ** (1 / alpha)) * sigma
+        # Generate a step length (or size steps at once), sigma is computed once for each alpha
+        return get_uniform_levy_steps(self.generator, alpha, size)
 
 
 class TCO2(Optimizer):
@@ -177,7 +142,7 @@ class TCO2(Optimizer):
         self.sort_flag = False
 
     def _mutation__(self, current_pos, new_pos):
-        pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
+        pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < self.cr, current_pos, new_pos)
         return self.amend_position(pos_new, self.problem.lb, self.problem.ub)
 
     def evolve(self, epoch):
@@ -187,83 +152,32 @@ class TCO2(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop = []
-        for idx in range(0, self.pop_size):
-            # idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-            idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-
-            pop_sorted = self.get_sorted_strim_population(self.pop)
-
-
-            centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] + self.pop[idx][self.ID_POS] ) / 3
-            centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] +pop_sorted[2][self.ID_POS]) / 3
-
-            #centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + pop_sorted[2][self.ID_POS] ) / 3
-           # centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + pop_sorted[self.pop_size//2][self.ID_POS] ) / 3
-            centroid2 = (self.pop[idx][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + self.pop[idx_list[1]][self.ID_POS] ) / 3
-            centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + self.pop[idx_list[1]][self.ID_POS] ) / 3
-
-
-            #centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + self.create_solution(self.problem.lb, self.problem.ub)[self.ID_POS] ) / 3
-
-            # centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] + self.pop[idx_list[0]][self.ID_POS]) / 3
-
-            # pos_new = self.pop[idx][self.ID_POS] + self.levy_step() * (centroid - self.pop[idx][self.ID_POS])
-
-            #self.cr = 0.5
-            #self.cr = 0.6
-            #self.cr = 0.4
-            self.cr = 0.8
-            #print("-------" + str(self.perlin(centroid)))
-            if np.random.uniform(0, 1) < self.cr:
-                pos_new = self.pop[idx][self.ID_POS] + np.random.randint(2, size=self.problem.n_dims) *  self.levy_step() * (centroid  - self.pop[idx][self.ID_POS])
-                #pos_new = self.pop[idx][self.ID_POS] +  self.levy_step() *np.random.uniform(0.0, 1, self.problem.n_dims) * (centroid - self.pop[idx][self.ID_POS])
-
-            else:
-                #pos_new = self.pop[idx][self.ID_POS] +   np.multiply(np.random.randint(2, size=self.problem.n_dims), self.levy_step() * (centroid2 + self.perlin(centroid) * np.random.uniform(0.0, 1, self.problem.n_dims) - self.pop[idx][self.ID_POS]))
-                #pos_new = self.pop[idx][self.ID_POS] +    self.perlin(centroid) * np.random.uniform(0.0, 1, self.problem.n_dims) * (centroid2 - self.pop[idx][self.ID_POS]) *
-                pos_new = self.pop[idx][self.ID_POS] +  self.perlin(self.pop[idx][self.ID_POS]) * (centroid2 - self.pop[idx][self.ID_POS])
-
-            '''
-            if np.random.uniform(0, 1) < self.cr:
-                pos_new = self.pop[idx][self.ID_POS] +  self.levy_step() * (centroid + self.perlin(centroid) * np.random.uniform(0.0, 1, self.problem.n_dims) - self.pop[idx][self.ID_POS])
-            else:
-                pos_new = self.pop[idx][self.ID_POS] +    self.levy_step() * (centroid2 + self.perlin(centroid) * np.random.uniform(0.0, 1, self.problem.n_dims) - self.pop[idx][self.ID_POS])
-            '''
-
-            #print(self.perlin(pos_new))
-            #print(pos_new)
-            #pos_new = pos_new + self.perlin(pos_new) * np.random.uniform(0.0, 2, self.problem.n_dims)
-
-            #pos_new = self.mutation_process(pos_new)
-
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            # self.cr = 0.0
-            # pnoise3()
-            #pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-            pop.append([pos_new, None])
-
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        # Centroid of the 3 best agents, and centroid of 3 random other agents of each agent
+        centroid = get_top_centroid(pos_matrix, fit_list, self.problem.minmax)
+        centroid2 = get_random_centroids(self.generator, pos_matrix)
+
+        # Both moves of all the agents, each agent takes the Levy move with probability cr, the Perlin move otherwise
+        self.cr = 0.8
+        pos_levy = pos_matrix + self.generator.integers(2, size=pos_matrix.shape) * \
+                   self.levy_step(len(pos_matrix))[:, None] * (centroid - pos_matrix)
+        pos_perlin = pos_matrix + self.perlin(pos_matrix) * (centroid2 - pos_matrix)
+        pos_new = np.where(self.generator.uniform(0, 1, (len(pos_matrix), 1)) < self.cr, pos_levy, pos_perlin)
+
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
         self.pop = self.greedy_selection_population(self.pop, pop)
 
 
-    def levy_step(self):
+    def levy_step(self, size=None):
         alpha = 1.5  # 1.5  # Parameter controlling the tail heaviness (typically > 1)
-        sigma = (math.gamma(1 + alpha) * np.sin(math.pi * alpha / 2) / (
-                math.gamma((1 + alpha) / 2) * alpha * (2 ** ((alpha - 1) / 2)))) ** (1 / alpha)
-
-        # Generate a step length
-        u = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-        v = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-
-        return (u / abs(v) ** (1 / alpha)) * sigma
+        # Generate a step length (or size steps at once), sigma is computed once for each alpha
+        return get_uniform_levy_steps(self.generator, alpha, size)
 
     def perlin(self, current_position):
-        perlin_values = []
-        for i in range(self.problem.n_dims):
-            perlin_values.append(
-                pnoise1(current_position[i]))  # Use pnoise2() or pnoise3() for 2D or 3D noise respectively
-        return perlin_values
+        # Perlin noise of each dimension, of all the agents at once for a (pop_size, n_dims) matrix
+        return get_perlin_noise(current_position)
 
     def select(self, pop_old_sorted, pop_new):
         keep = pop_old_sorted[:3]
@@ -290,48 +204,36 @@ class TCO3(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        pop = []
-        for idx in range(0, self.pop_size):
-            idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-
-            centroid = (pop_sorted[0][self.ID_POS] + pop_sorted[1][self.ID_POS] +pop_sorted[2][self.ID_POS]) / 3
-            centroid2 = (self.pop[idx_list[2]][self.ID_POS]  + self.pop[idx_list[0]][self.ID_POS] + self.pop[idx_list[1]][self.ID_POS] ) / 3
-
-            if np.random.uniform(0, 1) < self.sp:
-                pos_new = self.pop[idx][self.ID_POS] + np.random.binomial(n=1, p=0.6, size=[self.problem.n_dims]) * self.levy_step()  * (centroid  - self.pop[idx][self.ID_POS])
-            else:
-                pos_new = self.pop[idx][self.ID_POS] + self.perlin(self.pop[idx][self.ID_POS]) * (centroid2 - self.pop[idx][self.ID_POS])
-            pos_new = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
-            pop.append([pos_new, None])
-
+        pos_matrix = np.array([agent[self.ID_POS] for agent in self.pop])
+        fit_list = np.array([agent[self.ID_TAR][self.ID_FIT] for agent in self.pop])
+        # Centroid of the 3 best agents, and centroid of 3 random other agents of each agent
+        centroid = get_top_centroid(pos_matrix, fit_list, self.problem.minmax)
+        centroid2 = get_random_centroids(self.generator, pos_matrix)
+
+        # Both moves of all the agents, each agent takes the Levy move with probability sp, the Perlin move otherwise
+        pos_levy = pos_matrix + self.generator.binomial(n=1, p=0.6, size=pos_matrix.shape) * \
+                   self.levy_step(len(pos_matrix))[:, None] * (centroid - pos_matrix)
+        pos_perlin = pos_matrix + self.perlin(pos_matrix) * (centroid2 - pos_matrix)
+        pos_new = np.where(self.generator.uniform(0, 1, (len(pos_matrix), 1)) < self.sp, pos_levy, pos_perlin)
+
+        pop = [[self.amend_position(pos, self.problem.lb, self.problem.ub), None] for pos in pos_new]
         pop = self.update_target_wrapper_population(pop)
 
         self.pop = self.greedy_selection_population(self.pop, pop)
 
 
-    def levy_step(self):
+    def levy_step(self, size=None):
         alpha = 1.2  # 1.5  # Parameter controlling the tail heaviness (typically > 1)
-        sigma = (math.gamma(1 + alpha) * np.sin(math.pi * alpha / 2) / (
-                math.gamma((1 + alpha) / 2) * alpha * (2 ** ((alpha - 1) / 2)))) ** (1 / alpha)
-
-        # Generate a step length
-        u = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-        v = np.random.uniform(0, 1)  # Random number from a uniform distribution [0, 1]
-
-        return (u / abs(v) ** (1 / alpha)) * sigma
+        # Generate a step length (or size steps at once), sigma is computed once for each alpha
+        return get_uniform_levy_steps(self.generator, alpha, size)
 
     def perlin(self, current_position):
-        perlin_values = []
-        for i in range(self.problem.n_dims):
-            perlin_values.append(
-                pnoise1(current_position[i]))
-        return perlin_values
+        # Perlin noise of each dimension, of all the agents at once for a (pop_size, n_dims) matrix
+        return get_perlin_noise(current_position)
 
     def random_levy_step(self, alpha):
         # Generate a random step from the Cauchy distribution
-        step = np.random.standard_cauchy()
+        step = self.generator.standard_cauchy()
 
         # Apply transformation to map the step to the range [0, 1]
         transformed_step = 0.5 + np.arctan(step) / np.pi
@@ -342,6 +244,6 @@ class TCO3(Optimizer):
         beta = 1.5   # Shape parameter for the Beta distribution
 
         # Generate a random step from the Beta distribution
-        step = np.random.beta(alpha, beta)
+        step = self.generator.beta(alpha, beta)
 
         return step
\ No newline at end of file
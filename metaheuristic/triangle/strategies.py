@@ -0,0 +1,69 @@
+import numpy as np
+
+from metaheuristic.DE.strategies import get_distinct_indices, get_sorted_index
+
+# Permutation of the improved Perlin noise, the table of noise.pnoise1()
+PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36, 103, 30, 69, 142, 8, 99, 37, 240,
+    21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177, 33, 88,
+    237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83,
+    111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54, 65, 25, 63, 161, 1, 216,
+    80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186,
+    3, 64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59, 227, 47, 16, 58,
+    17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104, 218, 246, 97, 228, 251, 34, 242, 193,
+    238, 210, 144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29, 24, 72, 243, 141, 128,
+    195, 78, 66, 215, 61, 156, 180])
+
+# Gradient of each lattice point, same rule as noise.pnoise1(): (hash & 7) + 1, or -1 when the bit 8 of the hash is set
+GRADIENTS = np.where(PERM & 8, -1.0, (PERM & 7) + 1.0)
+
+
+def get_perlin_noise(x):
+    """
+    1-D Perlin gradient noise of every value of x at once, the values of noise.pnoise1(x) with its default
+    arguments (1 octave, no base offset) computed in double precision instead of float32, the lattice repeats every
+    256 units
+
+    Args:
+        x (np.ndarray): the values, any shape (i.e: the (pop_size, n_dims) positions)
+
+    Returns:
+        np.ndarray: the noise of each value, same shape as x
+    """
+    x = np.asarray(x, dtype=float)
+    x_floor = np.floor(x)
+    idx = x_floor.astype(np.int64) & 255
+    t = x - x_floor
+    fade = t * t * t * (t * (t * 6 - 15) + 10)
+    g0 = GRADIENTS[idx] * t
+    g1 = GRADIENTS[(idx + 1) & 255] * (t - 1)
+    return 0.4 * (g0 + fade * (g1 - g0))
+
+
+def get_top_centroid(pos_matrix, fit_list, minmax="min", n_top=3):
+    """
+    Args:
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        fit_list (np.ndarray): fitness of the population
+        minmax (str): "min" or "max" problem
+        n_top (int): number of the best agents
+
+    Returns:
+        np.ndarray: centroid of the n_top best agents
+    """
+    return np.mean(pos_matrix[get_sorted_index(fit_list, minmax)[:n_top]], axis=0)
+
+
+def get_random_centroids(generator, pos_matrix, n_donors=3):
+    """
+    Args:
+        generator (np.random.Generator): the generator of the optimizer
+        pos_matrix (np.ndarray): (pop_size, n_dims) positions of the population
+        n_donors (int): number of the random agents of each centroid
+
+    Returns:
+        np.ndarray: (pop_size, n_dims) centroid of n_donors distinct random agents of each agent, other than the agent itself
+    """
+    return np.mean(pos_matrix[get_distinct_indices(generator, len(pos_matrix), n_donors)], axis=1)
@@ -97,8 +97,8 @@ class BaseVCS(Optimizer):
         ## Viruses diffusion
         for i in range(0, self.pop_size):
             xichma = (np.log1p(epoch + 1) / self.epoch) * (self.pop[i][self.ID_POS] - self.g_best[self.ID_POS])
-            gauss = np.random.normal(np.random.normal(self.g_best[self.ID_POS], np.abs(xichma)))
-            pos_new = gauss + np.random.uniform() * self.g_best[self.ID_POS] - np.random.uniform() * self.pop[i][self.ID_POS]
+            gauss = self.generator.normal(self.generator.normal(self.g_best[self.ID_POS], np.abs(xichma)))
+            pos_new = gauss + self.generator.uniform() * self.g_best[self.ID_POS] - self.generator.uniform() * self.pop[i][self.ID_POS]
             self.pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         self.pop = self.update_target_wrapper_population(self.pop)
 
@@ -107,7 +107,7 @@ class BaseVCS(Optimizer):
         xichma = self.xichma * (1 - (epoch + 1) / self.epoch)
         for i in range(0, self.pop_size):
             ## Basic / simple version, not the original version in the paper
-            pos_new = x_mean + xichma * np.random.normal(0, 1, self.problem.n_dims)
+            pos_new = x_mean + xichma * self.generator.normal(0, 1, self.problem.n_dims)
             self.pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         self.pop = self.update_target_wrapper_population(self.pop)
 
@@ -117,9 +117,9 @@ class BaseVCS(Optimizer):
         ## Immune response
         for i in range(0, self.pop_size):
             pr = (self.problem.n_dims - i + 1) / self.problem.n_dims
-            id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
-            temp = self.pop[id1][self.ID_POS] - (self.pop[id2][self.ID_POS] - self.pop[i][self.ID_POS]) * np.random.uniform()
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < pr, self.pop[i][self.ID_POS], temp)
+            id1, id2 = self.generator.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+            temp = self.pop[id1][self.ID_POS] - (self.pop[id2][self.ID_POS] - self.pop[i][self.ID_POS]) * self.generator.uniform()
+            pos_new = np.where(self.generator.uniform(0, 1, self.problem.n_dims) < pr, self.pop[i][self.ID_POS], temp)
             self.pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         self.pop = self.update_target_wrapper_population(self.pop)
 
@@ -189,7 +189,7 @@ class OriginalVCS(BaseVCS):
         Returns:
             Amended position (make the position is in bound)
         """
-        return np.where(np.logical_and(lb <= position, position <= ub), position, np.random.uniform(lb, ub))
+        return np.where(np.logical_and(lb <= position, position <= ub), position, self.generator.uniform(lb, ub))
 
     def evolve(self, epoch):
         """
@@ -202,8 +202,8 @@ class OriginalVCS(BaseVCS):
         ## Viruses diffusion
         for i in range(0, self.pop_size):
             xichma = (np.log1p(epoch + 1) / self.epoch) * (pop[i][self.ID_POS] - self.g_best[self.ID_POS])
-            gauss = np.array([np.random.normal(self.g_best[self.ID_POS][idx], np.abs(xichma[idx])) for idx in range(0, self.problem.n_dims)])
-            pos_new = gauss + np.random.uniform() * self.g_best[self.ID_POS] - np.random.uniform() * pop[i][self.ID_POS]
+            gauss = np.array([self.generator.normal(self.g_best[self.ID_POS][idx], np.abs(xichma[idx])) for idx in range(0, self.problem.n_dims)])
+            pos_new = gauss + self.generator.uniform() * self.g_best[self.ID_POS] - self.generator.uniform() * pop[i][self.ID_POS]
             pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         pop = self.update_target_wrapper_population(pop)
 
@@ -212,7 +212,7 @@ class OriginalVCS(BaseVCS):
         xichma = self.xichma * (1 - (epoch + 1) / self.epoch)
         for i in range(0, self.pop_size):
             ## Basic / simple version, not the original version in the paper
-            pos_new = x_mean + xichma * np.random.normal(0, 1, self.problem.n_dims)
+            pos_new = x_mean + xichma * self.generator.normal(0, 1, self.problem.n_dims)
             pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         pop = self.update_target_wrapper_population(pop)
 
@@ -221,9 +221,9 @@ class OriginalVCS(BaseVCS):
             pr = (self.problem.n_dims - i + 1) / self.problem.n_dims
             pos_new = pop[i][self.ID_POS]
             for j in range(0, self.problem.n_dims):
-                if np.random.uniform() > pr:
-                    id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
-                    pos_new[j] = pop[id1][self.ID_POS][j] - (pop[id2][self.ID_POS][j] - pop[i][self.ID_POS][j]) * np.random.uniform()
+                if self.generator.uniform() > pr:
+                    id1, id2 = self.generator.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+                    pos_new[j] = pop[id1][self.ID_POS][j] - (pop[id2][self.ID_POS][j] - pop[i][self.ID_POS][j]) * self.generator.uniform()
             pop[i][self.ID_POS] = self.amend_position(pos_new, self.problem.lb, self.problem.ub)
         pop = self.update_target_wrapper_population(pop)
 
@@ -87,7 +87,7 @@ class BaseWDO(Optimizer):
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = False
         ## Dynamic variable
-        self.dyn_list_velocity = self.max_v * np.random.uniform(self.problem.lb, self.problem.ub, (self.pop_size, self.problem.n_dims))
+        self.dyn_list_velocity = self.max_v * self.generator.uniform(self.problem.lb, self.problem.ub, (self.pop_size, self.problem.n_dims))
 
     def evolve(self, epoch):
         """
@@ -98,7 +98,7 @@ class BaseWDO(Optimizer):
         """
         pop_new = []
         for idx in range(0, self.pop_size):
-            rand_dim = np.random.randint(0, self.problem.n_dims)
+            rand_dim = self.generator.integers(0, self.problem.n_dims)
             temp = self.dyn_list_velocity[idx][rand_dim] * np.ones(self.problem.n_dims)
             vel = (1 - self.alp) * self.dyn_list_velocity[idx] - self.g_c * self.pop[idx][self.ID_POS] + \
                   (1 - 1.0 / (idx + 1)) * self.RT * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + self.c_e * temp / (idx + 1)
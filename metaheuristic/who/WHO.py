@@ -106,7 +106,7 @@ class BaseWHO(Optimizer):
             ### 1. Local movement (Milling behaviour)
             local_list = []
             for j in range(0, self.n_s):
-                temp = self.pop[i][self.ID_POS] + self.eta * np.random.uniform() * np.random.uniform(self.problem.lb, self.problem.ub)
+                temp = self.pop[i][self.ID_POS] + self.eta * self.generator.uniform() * self.generator.uniform(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position(temp, self.problem.lb, self.problem.ub)
                 local_list.append([pos_new, None])
             local_list = self.update_target_wrapper_population(local_list)
@@ -120,8 +120,8 @@ class BaseWHO(Optimizer):
 
         for i in range(0, self.pop_size):
             ### 2. Herd instinct
-            idr = np.random.choice(range(0, self.pop_size))
-            if self.compare_agent(pop_new[idr], pop_new[i]) and np.random.rand() < self.p_hi:
+            idr = self.generator.choice(range(0, self.pop_size))
+            if self.compare_agent(pop_new[idr], pop_new[i]) and self.generator.random() < self.p_hi:
                 temp = self.global_move[0] * pop_new[i][self.ID_POS] + self.global_move[1] * pop_new[idr][self.ID_POS]
                 pos_new = self.amend_position(temp, self.problem.lb, self.problem.ub)
                 target = self.get_target_wrapper(pos_new)
@@ -139,20 +139,20 @@ class BaseWHO(Optimizer):
 
             ### 3. Starvation avoidance
             if dist_to_worst < self.delta[0]:
-                temp = pop_new[i][self.ID_POS] + np.random.uniform() * (self.problem.ub - self.problem.lb) * \
-                       np.random.uniform(self.problem.lb, self.problem.ub)
+                temp = pop_new[i][self.ID_POS] + self.generator.uniform() * (self.problem.ub - self.problem.lb) * \
+                       self.generator.uniform(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position(temp, self.problem.lb, self.problem.ub)
                 pop_child.append([pos_new, None])
 
             ### 4. Population pressure
             if 1.0 < dist_to_best and dist_to_best < self.delta[1]:
-                temp = g_best[self.ID_POS] + self.eta * np.random.uniform(self.problem.lb, self.problem.ub)
+                temp = g_best[self.ID_POS] + self.eta * self.generator.uniform(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position(temp, self.problem.lb, self.problem.ub)
                 pop_child.append([pos_new, None])
 
             ### 5. Herd social memory
             for j in range(0, self.n_e):
-                temp = g_best[self.ID_POS] + 0.1 * np.random.uniform(self.problem.lb, self.problem.ub)
+                temp = g_best[self.ID_POS] + 0.1 * self.generator.uniform(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position(temp, self.problem.lb, self.problem.ub)
                 pop_child.append([pos_new, None])
 
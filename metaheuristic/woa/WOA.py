@@ -66,13 +66,13 @@ class BaseWOA(Optimizer):
         a = 2 - 2 * epoch / (self.epoch - 1)  # linearly decreased from 2 to 0
         pop_new = []
         for idx in range(0, self.pop_size):
-            r = np.random.rand()
+            r = self.generator.random()
             A = 2 * a * r - a
             C = 2 * r
-            l = np.random.uniform(-1, 1)
+            l = self.generator.uniform(-1, 1)
             p = 0.5
             b = 1
-            if np.random.uniform() < p:
+            if self.generator.uniform() < p:
                 if np.abs(A) < 1:
                     D = np.abs(C * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
                     pos_new = self.g_best[self.ID_POS] - A * D
@@ -158,13 +158,13 @@ class HI_WOA(Optimizer):
         a = 2 + 2 * np.cos(np.pi / 2 * (1 + epoch / self.epoch))  # Eq. 8
         pop_new = []
         for idx in range(0, self.pop_size):
-            r = np.random.rand()
+            r = self.generator.random()
             A = 2 * a * r - a
             C = 2 * r
-            l = np.random.uniform(-1, 1)
+            l = self.generator.uniform(-1, 1)
             p = 0.5
             b = 1
-            if np.random.uniform() < p:
+            if self.generator.uniform() < p:
                 if np.abs(A) < 1:
                     D = np.abs(C * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
                     pos_new = self.g_best[self.ID_POS] - A * D
@@ -189,7 +189,7 @@ class HI_WOA(Optimizer):
             self.dyn_feedback_count = 0
 
         if self.dyn_feedback_count >= self.feedback_max:
-            idx_list = np.random.choice(range(0, self.pop_size), self.n_changes, replace=False)
+            idx_list = self.generator.choice(range(0, self.pop_size), self.n_changes, replace=False)
             pop_child = self.create_population(self.n_changes)
             nfe_epoch += self.n_changes
             for idx_counter, idx in enumerate(idx_list):